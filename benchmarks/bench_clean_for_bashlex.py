@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Measure how long it takes to clean large blocks of pasted shell transcripts for bashlex.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_clean_for_bashlex
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import random
+import time
+
+from tutorons.common.extractor import CommandExtractor
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+LINES = [
+    "$ wget -r -np http://example.com/files/  ",
+    "--2015-06-01 12:00:00--  http://example.com/files/",
+    "Resolving example.com... 93.184.216.34",
+    "HTTP request sent, awaiting response... 200 OK",
+    "",
+    "   ",
+    "# Download only the PDF files",
+    "grep -rn 'pattern' . | sed 's/a/b/g'  # and replace",
+    "",
+    "",
+]
+
+
+def make_transcript(size, seed):
+    rand = random.Random(seed)
+    lines = []
+    length = 0
+    while length < size:
+        line = rand.choice(LINES)
+        lines.append(line)
+        length += len(line) + 1
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 500000, 1000000])
+    argument_parser.add_argument('--seed', type=int, default=0)
+    args = argument_parser.parse_args()
+
+    extractor = CommandExtractor('wget')
+    for size in args.sizes:
+        transcript = make_transcript(size, args.seed)
+        start_time = time.time()
+        extractor._clean_for_bashlex(transcript)
+        seconds = time.time() - start_time
+        print("%d characters: cleaned in %.3fs (%.0f KB/s)" % (
+            len(transcript), seconds, len(transcript) / 1000.0 / seconds))
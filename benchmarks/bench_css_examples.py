@@ -0,0 +1,55 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Measure how quickly we can render the HTML examples generated for CSS selectors.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_css_examples
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import time
+
+from parsers.common.util import parse_plaintext, walk_tree
+from parsers.css.CssLexer import CssLexer
+from parsers.css.CssParser import CssParser
+from tutorons.css.examples import CssExampleGenerator, HtmlRenderer
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+SELECTORS = [
+    "p", "div.content", "#main-nav li > a", "input[type='text']:checked", "ul li:first-child",
+    ".btn-primary::before", "a[href^='http://']", "table tr:nth-child(2n) td", "h1 + p::first-line",
+    "ns|p.klazz ~ span::attr(title)", "pre::first-line", "form > input.wide, img[alt='logo']",
+]
+
+
+def generate_contents(selectors):
+    contents = []
+    for selector in selectors:
+        example_generator = CssExampleGenerator()
+        parse_tree = parse_plaintext(selector, CssLexer, CssParser, 'selectors_group')
+        walk_tree(parse_tree, example_generator)
+        contents.extend(example_generator.result.values())
+    return contents
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--repetitions', type=int, default=200)
+    args = argument_parser.parse_args()
+
+    contents = generate_contents(SELECTORS)
+    renderer = HtmlRenderer()
+    start_time = time.time()
+    for _ in range(args.repetitions):
+        for content in contents:
+            renderer.render_html_contents(content, indent_level=4)
+    render_seconds = time.time() - start_time
+
+    render_count = len(contents) * args.repetitions
+    print("Examples rendered: %d" % render_count)
+    print("Render time: %.3fs (%.0f examples/s)" % (render_seconds, render_count / render_seconds))
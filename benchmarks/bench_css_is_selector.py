@@ -0,0 +1,65 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Measure how quickly we can decide whether JavaScript string literals are CSS selectors.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_css_is_selector
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import random
+import time
+
+from tutorons.css.detect import is_selector, selector_verdicts, _parse_selector_and_check
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+COMMON_STRINGS = [
+    "use strict", "click", "load", "change", "submit", "GET", "POST", "json", "undefined",
+    "function", "object", "Please enter a valid email address.", "Loading...",
+    "http://example.com/api/v1/items", "/static/js/app.js", "#", "", " ", "%s: %d",
+    "p", "div.content", "#main-nav li > a", "input[type='text']", "ul li:first-child",
+    ".btn-primary", "a[href^='http://']", "table tr:nth-child(2n) td",
+]
+WORDS = ["error", "user", "value", "data", "item", "list", "name", "id", "the", "is", "not"]
+
+
+def make_corpus(size, seed):
+    ''' A corpus of string literals where common strings repeat, like on real pages. '''
+    rand = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        if rand.random() < 0.7:
+            corpus.append(rand.choice(COMMON_STRINGS))
+        else:
+            corpus.append(' '.join(rand.choice(WORDS) for _ in range(rand.randint(1, 6))))
+    return corpus
+
+
+def time_check(check, corpus):
+    start_time = time.time()
+    for string in corpus:
+        check(string)
+    return time.time() - start_time
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--size', type=int, default=100000)
+    argument_parser.add_argument('--seed', type=int, default=0)
+    args = argument_parser.parse_args()
+
+    corpus = make_corpus(args.size, args.seed)
+    parse_seconds = time_check(_parse_selector_and_check, corpus)
+    selector_verdicts.clear()
+    screened_seconds = time_check(is_selector, corpus)
+
+    print("Strings: %d" % len(corpus))
+    print("Parse every string: %.3fs (%.0f strings/s)" % (parse_seconds, len(corpus) / parse_seconds))
+    print("Pre-screen and cache: %.3fs (%.0f strings/s)" % (
+        screened_seconds, len(corpus) / screened_seconds))
+    print("Cache hits: %d, misses: %d" % (selector_verdicts.hits, selector_verdicts.misses))
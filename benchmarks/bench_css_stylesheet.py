@@ -0,0 +1,51 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Measure how selector extraction from embedded stylesheets scales with the number of rules.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_css_stylesheet
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import random
+import time
+
+from tutorons.common.htmltools import HtmlDocument
+from tutorons.css.detect import StylesheetSelectorExtractor
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+SELECTORS = [
+    "p", "div.content", "#main-nav li > a", "ul li:first-child", ".btn-primary",
+    "table tr td", "h1 + p", "input[type='text']", "nothtml", "span.label",
+]
+
+
+def make_stylesheet_node(rule_count, seed):
+    rand = random.Random(seed)
+    lines = []
+    for _ in range(rule_count):
+        lines.append("%s {" % rand.choice(SELECTORS))
+        lines.append("    color: #%06x;" % rand.randint(0, 0xffffff))
+        lines.append("}")
+    return HtmlDocument("<pre>" + "\n".join(lines) + "</pre>").pre
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--rules', type=int, nargs='+', default=[1000, 5000, 10000])
+    argument_parser.add_argument('--seed', type=int, default=0)
+    args = argument_parser.parse_args()
+
+    extractor = StylesheetSelectorExtractor()
+    for rule_count in args.rules:
+        node = make_stylesheet_node(rule_count, args.seed)
+        start_time = time.time()
+        regions = extractor.extract(node)
+        seconds = time.time() - start_time
+        print("%d rules: %d regions in %.3fs (%.0f rules/s)" % (
+            rule_count, len(regions), seconds, rule_count / seconds))
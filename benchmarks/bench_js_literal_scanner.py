@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Compare how fast string and regex literals are found in large, minified scripts by the
+literal scanner and by lexing the scripts with slimit.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_js_literal_scanner
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import random
+import time
+
+from tutorons.common.extractor import scan_javascript_literals
+from tutorons.common.javascript import lex_javascript
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+STATEMENTS = [
+    "var a=document.querySelectorAll('div.content > p'),b=a.length/2;",
+    "function c(d,e){return d.replace(/\\s+/g,\" \").split(e)}",
+    "if(f.test(g))h=i[j]/k|0;else h=\"none\";",
+    "l.on(\"click\",function(m){m.preventDefault();n(m.target,'.btn-primary')});",
+    "for(o=0;o<p.length;o++)q+=p[o]/r*(s-1);",
+    "t=/^[a-z0-9_-]{3,16}$/i.exec(u)||{v:'w',x:1e3};",
+    "y=z?\"#main-nav li > a\":'ul li:first-child';",
+]
+
+
+def make_minified_script(size, seed):
+    rand = random.Random(seed)
+    statements = []
+    length = 0
+    while length < size:
+        statement = rand.choice(STATEMENTS)
+        statements.append(statement)
+        length += len(statement)
+    return ''.join(statements)
+
+
+def time_call(function, text):
+    start_time = time.time()
+    literals, _ = function(text)
+    return literals, time.time() - start_time
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 500000, 1000000])
+    argument_parser.add_argument('--seed', type=int, default=0)
+    args = argument_parser.parse_args()
+
+    for size in args.sizes:
+        script = make_minified_script(size, args.seed)
+        tokens, lex_seconds = time_call(lex_javascript, script)
+        literals, scan_seconds = time_call(scan_javascript_literals, script)
+        lexed_literal_count = len([t for t in tokens if t.type in ('STRING', 'REGEX')])
+        print("%d characters: %d literals" % (len(script), len(literals)))
+        print("  slimit lexer: %d literals in %.3fs (%.0f KB/s)" % (
+            lexed_literal_count, lex_seconds, len(script) / 1000.0 / lex_seconds))
+        print("  scanner:      %d literals in %.3fs (%.0f KB/s)" % (
+            len(literals), scan_seconds, len(script) / 1000.0 / scan_seconds))
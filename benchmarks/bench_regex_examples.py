@@ -0,0 +1,48 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+'''
+Measure how quickly we can generate examples for regular expressions.  Examples are
+seeded, so every run generates the same examples and does the same amount of work.
+Run from the main directory:
+    DJANGO_SETTINGS_MODULE=tutorons.settings.dev python -m benchmarks.bench_regex_examples
+'''
+
+from __future__ import unicode_literals
+import argparse
+import logging
+import time
+
+from tutorons.regex.examples import get_examples, get_default_dict, pattern_trees
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+PATTERNS = [
+    r'^[a-z0-9_-]{3,16}$', r'[\w\-\.]+@[a-z]+\.[a-z]{2,3}', r'\d{3}-\d{3}-\d{4}',
+    r'([0-9A-F]{2}[:-]){5}([0-9A-F]{2})', r'^(https?|ftp)://[^\s/$.?#].[^\s]*$',
+    r'(foo|bar|baz)+(\.txt|\.log)?', r'[^aeiou\s]{2,}ing\b', r'a{5000}', r'(x{100}){100}',
+    r'(a|b)(c|d)(e|f)(g|h)(i|j)(k|l)(m|n)(o|p)(q|r)(s|t)(u|v)(w|x)(y|z)',
+]
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(description=__doc__)
+    argument_parser.add_argument('--repetitions', type=int, default=50)
+    argument_parser.add_argument('--count', type=int, default=4)
+    argument_parser.add_argument('--seed', type=int, default=0)
+    args = argument_parser.parse_args()
+
+    dictionary = get_default_dict()
+    for pattern in PATTERNS:
+        get_examples(pattern, args.count, dictionary, seed=args.seed)
+
+    start_time = time.time()
+    for _ in range(args.repetitions):
+        for pattern in PATTERNS:
+            get_examples(pattern, args.count, dictionary, seed=args.seed)
+    seconds = time.time() - start_time
+
+    pattern_count = len(PATTERNS) * args.repetitions
+    print("Patterns: %d (parse cache: %s)" % (pattern_count, pattern_trees.stats()))
+    print("Generation time: %.3fs (%.0f patterns/s)" % (seconds, pattern_count / seconds))
@@ -4,7 +4,7 @@ import sys
 
 from SocketServer import BaseServer
 from wsgiref import handlers
-from tutorons.common.java.gateway import gateway
+from tutorons.common.java.gateway import shutdown_gateway
 
 
 def patch_broken_pipe_error():
@@ -43,9 +43,9 @@ if __name__ == "__main__":
     except:
         # We make sure to catch all exceptions and raised events while running
         # the main command.  This includes keyboard interrupts.
-        # Because we are starting a gateway server to Java through Py4J, we still
+        # If the command started a gateway server to Java through Py4J, we still
         # need to do the tear-down of shutting down the gateway once the main
         # command has finished running, regardless of its outcome.
         pass
 
-    gateway.shutdown(raise_exception=True)
+    shutdown_gateway(raise_exception=True)
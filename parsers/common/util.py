@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 import logging
+import threading
 
 from antlr4 import CommonTokenStream, ParseTreeWalker
 from antlr4.InputStream import InputStream
@@ -10,6 +11,11 @@ from antlr4.InputStream import InputStream
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+# ANTLR's Python runtime keeps the DFAs it builds while parsing in caches shared by all
+# lexers and parsers for a grammar, and updates them without any locking.  Parsing is
+# pure Python, so holding this lock costs threads little they wouldn't lose to the GIL.
+_parse_lock = threading.Lock()
+
 
 def parse_plaintext(text, LexerClass, ParserClass, rule_name):
     '''
@@ -25,7 +31,8 @@ def parse_plaintext(text, LexerClass, ParserClass, rule_name):
     token_stream = CommonTokenStream(lexer)
     parser = ParserClass(token_stream)
     if hasattr(parser, rule_name):
-        return getattr(parser, rule_name)()
+        with _parse_lock:
+            return getattr(parser, rule_name)()
     else:
         raise KeyError("Main rule %s doesn't exist in your parser's grammar", rule_name)
 
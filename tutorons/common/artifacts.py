@@ -0,0 +1,56 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+from bs4 import Tag
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class ArtifactStore(object):
+    '''
+    Representations of HTML nodes and their text that are expensive to compute and that
+    several extractors need, like the text blocks in a node or the bash parse tree of a
+    command.  Each is computed the first time an extractor asks for it, and then shared
+    with every other extractor that is given the same store.
+
+    A store should be created for each scan of a document and dropped after it, as it
+    holds on to everything computed during the scan.  Artifacts can be keyed by HTML
+    nodes, which are compared by identity, or by strings and other hashable values.
+    Artifacts must not be changed by the extractors that ask for them.
+    '''
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._artifacts = {}
+
+    def get(self, kind, key, compute):
+        '''
+        Get the artifact of a kind (e.g., 'bash_tree') for a key, computing it with
+        `compute(key)` if it hasn't been computed yet.  If computing the artifact raised
+        an exception, the same exception is raised each time the artifact is asked for.
+        '''
+        store_key = (kind, id(key)) if isinstance(key, Tag) else (kind, key)
+
+        if store_key in self._artifacts:
+            self.hits += 1
+            _, artifact, error = self._artifacts[store_key]
+        else:
+            self.misses += 1
+            artifact, error = None, None
+            try:
+                artifact = compute(key)
+            except Exception as e:
+                error = e
+            # We keep a reference to the key so that the ID of a node can't be reused
+            # by another node while the store is alive.
+            self._artifacts[store_key] = (key, artifact, error)
+
+        if error is not None:
+            raise error
+        return artifact
+
+    def __len__(self):
+        return len(self._artifacts)
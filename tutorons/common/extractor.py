@@ -4,16 +4,27 @@
 from __future__ import unicode_literals
 import logging
 import re
-from slimit.lexer import Lexer as JsLexer
 import bashlex
 import copy
+import sys
+import hashlib
+from collections import namedtuple
+from django.conf import settings
+from django.core.cache import caches
+from slimit.lexer import Lexer as JsLexer, TOKENS_THAT_IMPLY_DIVISON
 
-from tutorons.common.util import get_descendants
+from tutorons.common.util import get_descendants, LruCache
+from tutorons.common.artifacts import ArtifactStore
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 RARE_CHARACTER = '\u3222'  # A character we never expect to appear on an HTML page
 
+# Patterns for cleaning bash text for bashlex
+TRAILING_SPACES_OR_COMMENT_PATTERN = re.compile(r'#.*$| +$', re.MULTILINE)
+LEADING_NEWLINES_PATTERN = re.compile(r'\A\n+')
+EXTRA_NEWLINES_PATTERN = re.compile(r'\n(\s*\n)')
+
 
 class Region(object):
     '''
@@ -40,14 +51,18 @@ class Region(object):
 
 class LineExtractor(object):
 
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+
     def extract(self, node):
         ''' Given HTML node, extract all line Regions. '''
 
         text = node.text
+        lines = self.artifacts.get('lines', text, lambda text: text.split('\n'))
 
         regions = []
         char_index = 0
-        for line in text.split('\n'):
+        for line in lines:
             first_char = char_index
             last_char = char_index + len(line) - 1
             r = Region(node, first_char, last_char, line)
@@ -57,37 +72,250 @@ class LineExtractor(object):
         return regions
 
 
+'''
+A scanner for the string and regular expression literals in JavaScript.
+
+Extractors only need the literals in a script, and lexing all of a script with slimit
+to find them is slow on large, minified scripts.  The scanner below jumps from one quote,
+slash or backtick to the next, and skips the code in between.  The only time it needs to
+look at that code is to decide whether a '/' starts a regular expression or is a division,
+which depends on the kind of token that came before it.  Then it reads the tokens since
+the last literal or comment, with the same rules as the slimit lexer.  Literals are read
+with slimit's own patterns, so the scanner finds the same literals at the same offsets as
+slimit.  Unlike slimit, it skips over template literals, rather than reading the text
+inside of them as code.
+'''
+
+JavascriptLiteral = namedtuple('JavascriptLiteral', ['type', 'value', 'lexpos'])
+
+JAVASCRIPT_STOP_PATTERN = re.compile(r'[\'"/`]')
+JAVASCRIPT_TEMPLATE_STOP_PATTERN = re.compile(r'[\'"/`{}]')
+JAVASCRIPT_TOKEN_PATTERN = re.compile(r'''
+    (?P<space>[\ \t]+)
+  | (?P<newline>[\n\r]+)
+  | (?P<word>[a-zA-Z_$][0-9a-zA-Z_$]*(?![^\x00-\x7f])|''' + JsLexer.identifier + r''')
+  | (?P<number>''' + JsLexer.t_NUMBER + r''')
+  | (?P<closing_punctuator>\+\+|--|[)\]}])
+  | (?P<punctuator>[*%&|^~?!<>=,;:(\[{]+|[-+.])
+  | (?P<illegal>[\s\S])
+''', re.VERBOSE)
+JAVASCRIPT_STRING_PATTERN = re.compile(JsLexer.string, re.VERBOSE)
+JAVASCRIPT_REGEX_PATTERN = re.compile(JsLexer.t_regex_REGEX, re.VERBOSE)
+JAVASCRIPT_LINE_COMMENT_PATTERN = re.compile(JsLexer.t_LINE_COMMENT)
+JAVASCRIPT_BLOCK_COMMENT_PATTERN = re.compile(JsLexer.t_BLOCK_COMMENT)
+JAVASCRIPT_PROPERTY_PATTERN = re.compile(r'\s' + JsLexer.identifier)
+JAVASCRIPT_TEMPLATE_PATTERN = re.compile(r'(?:[^`\\$]|\\[\s\S]|\$(?!\{))*(`|\$\{)?')
+
+
+def scan_javascript_literals(text):
+    '''
+    Find the string and regular expression literals in JavaScript text.  Returns a tuple
+    of the literals that were found, and whether all of the text could be scanned.  If
+    it couldn't (because a '/' starts a regular expression that never ends), the literals
+    found before the error are still returned.
+
+    Each literal has a type ('STRING' or 'REGEX'), a value, and an offset, which are
+    the same as the type, value and `lexpos` of the token slimit's lexer reads for it.
+    '''
+    literals = []
+    length = len(text)
+    position = 0
+
+    # Where the tokens that haven't been read yet start, and what we know from the
+    # tokens before them: whether a '/' after them would be a division, and whether
+    # the last character was part of a token (see `_read_division_state`).
+    tokens_start = 0
+    division_allowed = False
+    after_token = True
+
+    # Brace depths at which the expressions embedded in open template literals end
+    template_depths = []
+    brace_depth = 0
+
+    while True:
+
+        stop_pattern = JAVASCRIPT_TEMPLATE_STOP_PATTERN if template_depths else JAVASCRIPT_STOP_PATTERN
+        match = stop_pattern.search(text, position)
+        if match is None:
+            break
+        position = match.start()
+        char = text[position]
+
+        if char in '\'"':
+            string_match = JAVASCRIPT_STRING_PATTERN.match(text, position)
+            if string_match is None:
+                # slimit skips a quote that doesn't start a string, and reads the text
+                # after it as code.  The quote will be read with the tokens after it.
+                position += 1
+                continue
+            end = string_match.end()
+            # Like slimit, we remove the line continuations from a string's value.
+            value = string_match.group().replace('\\\n', '')
+            literals.append(JavascriptLiteral('STRING', value, position))
+            division_allowed = True
+
+        elif char == '/':
+            next_char = text[position + 1] if position + 1 < length else None
+            if next_char == '/':
+                end = JAVASCRIPT_LINE_COMMENT_PATTERN.match(text, position).end()
+                division_allowed = False
+            elif next_char == '*':
+                comment_match = JAVASCRIPT_BLOCK_COMMENT_PATTERN.match(text, position)
+                end = comment_match.end() if comment_match else position + 1
+                division_allowed = False
+            else:
+                division_allowed, after_token = _read_division_state(
+                    text, tokens_start, position, division_allowed, after_token)
+                if after_token and next_char is not None and not division_allowed:
+                    regex_match = JAVASCRIPT_REGEX_PATTERN.match(text, position)
+                    if regex_match is None:
+                        return literals, False
+                    end = regex_match.end()
+                    literals.append(JavascriptLiteral('REGEX', regex_match.group(), position))
+                    division_allowed = True
+                else:
+                    end = position + 2 if next_char == '=' else position + 1
+                    division_allowed = False
+
+        elif char == '`':
+            end, division_allowed = _scan_template(text, position + 1, template_depths, brace_depth)
+
+        elif char == '{':
+            brace_depth += 1
+            end = position + 1
+            division_allowed = False
+
+        else:
+            end = position + 1
+            if template_depths[-1] == brace_depth:
+                template_depths.pop()
+                end, division_allowed = _scan_template(text, end, template_depths, brace_depth)
+            else:
+                brace_depth -= 1
+                division_allowed = True
+
+        after_token = True
+        tokens_start = position = end
+
+    return literals, True
+
+
+def _read_division_state(text, start, end, division_allowed, after_token):
+    '''
+    Read the tokens between `start` and `end`, which contain no literals or comments,
+    to find out whether a '/' at `end` would be a division.  `division_allowed` and
+    `after_token` describe the tokens before `start`, and are returned updated.
+
+    A '/' is a division if the token before it ends an operand, like an identifier or
+    a closing paren.  There is one exception: when slimit skips a character it doesn't
+    recognize, it reads the token after it without checking if a '/' starts a regular
+    expression.  `after_token` is false when the last character read was skipped.
+    '''
+    position = start
+    while position < end:
+
+        match = JAVASCRIPT_TOKEN_PATTERN.match(text, position)
+        kind = match.lastgroup
+        position = match.end()
+
+        if kind == 'space':
+            continue
+        elif kind == 'illegal':
+            after_token = False
+            continue
+        elif kind == 'word':
+            word = match.group()
+            if word in ('get', 'set') and JAVASCRIPT_PROPERTY_PATTERN.match(text, position):
+                division_allowed = False
+            else:
+                token_type = JsLexer.keywords_dict.get(word, 'ID')
+                division_allowed = token_type in TOKENS_THAT_IMPLY_DIVISON
+        else:
+            division_allowed = kind in ('number', 'closing_punctuator')
+        after_token = True
+
+    return division_allowed, after_token
+
+
+def _scan_template(text, position, template_depths, brace_depth):
+    '''
+    Skip over the text of a template literal, starting just after its opening backtick
+    or the end of one of its embedded expressions.  Returns the offset to continue
+    scanning from, and whether a '/' after it would be a division.
+    '''
+    match = JAVASCRIPT_TEMPLATE_PATTERN.match(text, position)
+    if match.group(1) == '${':
+        template_depths.append(brace_depth)
+        return match.end(), False
+    return match.end(), True
+
+
 class JavascriptStringExtractor(object):
 
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+
     def extract(self, node):
 
-        lexer = JsLexer()
-        lexer.input(node.text)
+        literals, scanned = self.artifacts.get(
+            'javascript_literals', node.text, scan_javascript_literals)
+        if not scanned:
+            logging.warn("Failed to parse text: %s...", node.text[:100])
 
         regions = []
-        while True:
-            try:
-                tok = lexer.token()
-                if not tok:
-                    break
-                if tok.type == "STRING":
-                    start_char = tok.lexpos + 1
-                    string = tok.value[1:-1]
-                    end_char = start_char + len(string) - 1
-                    r = Region(node, start_char, end_char, string)
-                    regions.append(r)
-            except (TypeError, AttributeError):
-                logging.warn("Failed to parse text: %s...", node.text[:100])
-                break
+        for literal in literals:
+            if literal.type == "STRING":
+                start_char = literal.lexpos + 1
+                string = literal.value[1:-1]
+                end_char = start_char + len(string) - 1
+                r = Region(node, start_char, end_char, string)
+                regions.append(r)
 
         return regions
 
 
+def get_text_blocks(node):
+    ''' Split the text of an HTML node into the blocks of text between its <br> tags. '''
+    node_copy = copy.copy(node)
+    for br in node_copy.select('br'):
+        br.replace_with(RARE_CHARACTER)
+    return node_copy.text.split(RARE_CHARACTER)
+
+
+def get_bash_commands(tree):
+    ''' Get all of the simple commands in a bash parse tree. '''
+    nodes = get_descendants(tree)
+    return [n for n in nodes if n.kind == 'command']
+
+
+def _sizeof_command_spans(key, value):
+    cmdname, text = key
+    parsed, spans = value
+    return (
+        sys.getsizeof(key) + sys.getsizeof(cmdname) + sys.getsizeof(text) +
+        sys.getsizeof(value) + sys.getsizeof(spans) + sum(sys.getsizeof(s) for s in spans)
+    )
+
+
+'''
+The same command lines (`wget -O - URL | sh`, `grep -r foo .`) appear on many pages,
+and parsing them with bashlex is slow.  So we remember the spans of the commands found in
+each block of bash text across requests, including the verdict that a block can't be
+parsed.  If `settings.BASH_COMMAND_CACHE` names a Django cache, spans are also shared
+between workers through that cache.  `command_spans.stats()` reports the hit rate and
+the approximate memory used by the spans cached in this process; staff can see it at
+`/metrics`.
+'''
+COMMAND_SPANS_CACHE_SIZE = 20000
+command_spans = LruCache(COMMAND_SPANS_CACHE_SIZE, sizeof=_sizeof_command_spans)
+
+
 class CommandExtractor(object):
     ''' Extractor of bash simple commands. '''
 
-    def __init__(self, cmdname):
+    def __init__(self, cmdname, artifacts=None):
         self.cmdname = cmdname
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
 
     def extract(self, node):
 
@@ -95,48 +323,79 @@ class CommandExtractor(object):
         orig_text = node.text
         orig_text_safe = self._replace_carats(orig_text)
 
-        ''' Make a copy of the node and split on <br> tags. '''
-        node_copy = copy.copy(node)
-        for br in node_copy.select('br'):
-            br.replace_with(RARE_CHARACTER)
-        splittable_text = node_copy.text
-        text_blocks = splittable_text.split(RARE_CHARACTER)
+        ''' Split on <br> tags. '''
+        text_blocks = self.artifacts.get('text_blocks', node, get_text_blocks)
 
         regions = []
         offset = 0
 
         for text in text_blocks:
 
-            text = self._replace_carats(text)
-            text = self._replace_leading_redirects(text)
-            text = self._clean_for_bashlex(text)
+            text = self.artifacts.get('bash_text', text, self._prepare_for_bashlex)
 
             if not text.isspace():
-
-                try:
-                    tree = bashlex.parse(text)
-                    valid_script = True
-                except bashlex.errors.ParsingError:
-                    valid_script = False
-                except Exception as e:
-                    valid_script = False
-                    logging.error("Bash parsing error: %s, for script %s", str(e), text)
-
-                if valid_script:
-                    nodes = get_descendants(tree)
-                    commands = [n for n in nodes if n.kind == 'command']
-                    for c in commands:
-                        if self._is_target_command(c, self.cmdname) and self._has_arguments(c):
-                            start_char = offset + self._get_start(c, self.cmdname)
-                            end_char = offset + c.pos[1] - 1
-                            string = orig_text_safe[start_char:end_char + 1]
-                            r = Region(node, start_char, end_char, string)
-                            regions.append(r)
+                _, spans = self._get_command_spans(text)
+                for span_start, span_end in spans:
+                    start_char = offset + span_start
+                    end_char = offset + span_end
+                    string = orig_text_safe[start_char:end_char + 1]
+                    r = Region(node, start_char, end_char, string)
+                    regions.append(r)
 
             offset += len(text)
 
         return regions
 
+    def _get_command_spans(self, text):
+        '''
+        Get whether cleaned bash text could be parsed, and the start and end offsets of
+        the target commands in it, first looking in the caches of earlier results.
+        '''
+        key = (self.cmdname, text)
+        result = command_spans.get(key)
+        if result is not None:
+            return result
+
+        shared_cache = None
+        if settings.BASH_COMMAND_CACHE is not None:
+            shared_cache = caches[settings.BASH_COMMAND_CACHE]
+            # Hash the key, as cache backends like memcached limit the length
+            # and characters of keys.
+            shared_key = 'bash_commands:' + hashlib.sha1(
+                (self.cmdname + '\0' + text).encode('utf-8')).hexdigest()
+            result = shared_cache.get(shared_key)
+
+        if result is None:
+            result = self._find_command_spans(text)
+            if shared_cache is not None:
+                shared_cache.set(shared_key, result)
+
+        command_spans.put(key, result)
+        return result
+
+    def _find_command_spans(self, text):
+
+        try:
+            tree = self.artifacts.get('bash_tree', text, bashlex.parse)
+            commands = self.artifacts.get(
+                'bash_commands', text, lambda _: get_bash_commands(tree))
+        except bashlex.errors.ParsingError:
+            return (False, ())
+        except Exception as e:
+            logging.error("Bash parsing error: %s, for script %s", str(e), text)
+            return (False, ())
+
+        spans = []
+        for c in commands:
+            if self._is_target_command(c, self.cmdname) and self._has_arguments(c):
+                spans.append((self._get_start(c, self.cmdname), c.pos[1] - 1))
+        return (True, tuple(spans))
+
+    def _prepare_for_bashlex(self, text):
+        text = self._replace_carats(text)
+        text = self._replace_leading_redirects(text)
+        return self._clean_for_bashlex(text)
+
     def _has_arguments(self, command):
         return len(command.parts) > 1
 
@@ -183,28 +442,17 @@ class CommandExtractor(object):
         procedure, which will push spaces *after* the first newline.
         '''
 
-        replace_space = lambda m: '\n' * len(m.group())
-        text = re.sub(" *$", replace_space, text, flags=re.MULTILINE)
+        # Each of these substitutions reads the text once, so cleaning takes time linear
+        # in the length of the text, even for long logs with many blank lines.
+        # Replacing comments and trailing spaces in one pass gives the same result as
+        # replacing trailing spaces first, as a comment runs until the end of its line.
+        to_newlines = lambda m: '\n' * len(m.group())
+        text = TRAILING_SPACES_OR_COMMENT_PATTERN.sub(to_newlines, text)
 
-        replace_comment = lambda m: '\n' * len(m.group())
-        text = re.sub("#.*$", replace_comment, text, flags=re.MULTILINE)
+        to_spaces = lambda m: ' ' * len(m.group())
+        text = LEADING_NEWLINES_PATTERN.sub(to_spaces, text)
 
-        starting_newlines = 0
-        for c in text:
-            if c == '\n':
-                starting_newlines += 1
-            else:
-                break
-        text = ' ' * starting_newlines + text[starting_newlines:]
-
-        on_newline = False
-        for i, c in enumerate(text):
-            if on_newline:
-                if c == '\n':
-                    text = text[:i] + ' ' + text[i+1:]
-                elif not re.match('\s', c):
-                    on_newline = False
-            if not on_newline:
-                on_newline = (c == '\n')
+        # Within a stretch of whitespace, keep the first newline, and replace the rest.
+        text = EXTRA_NEWLINES_PATTERN.sub(lambda m: '\n' + m.group(1).replace('\n', ' '), text)
 
         return text
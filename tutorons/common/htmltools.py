@@ -3,10 +3,13 @@
 
 from __future__ import unicode_literals
 import logging
-from bs4 import BeautifulSoup
+import re
+import hashlib
+from bs4 import BeautifulSoup, NavigableString, Tag
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
+LINE_BREAK_PATTERN = re.compile(r'<br\s*/?>', re.IGNORECASE)
 
 
 class HtmlDocument(BeautifulSoup):
@@ -20,9 +23,55 @@ class HtmlDocument(BeautifulSoup):
         super(self.__class__, self).__init__(text, 'html5lib', *args, **kwargs)
 
 
+class BlockDocument(Tag):
+    '''
+    A document made of the blocks of text a client found in its page, sent in place of
+    the page itself.  Each block is a dictionary with the CSS 'selector' of the element
+    the text came from, the element's 'tag' name, and its 'text', with '<br>' marking
+    each line break.  Blocks become childless elements of the document that scanners
+    and extractors read like elements of a parsed page, without parsing any HTML.
+    '''
+    def __init__(self, blocks):
+        super(BlockDocument, self).__init__(name='[document]')
+        self.selectors = {}
+        self.block_hashes = {}
+        for block in blocks:
+            element = Tag(name=block['tag'].lower())
+            for i, line in enumerate(LINE_BREAK_PATTERN.split(block['text'])):
+                if i > 0:
+                    element.append(Tag(name='br'))
+                if line:
+                    element.append(NavigableString(line))
+            self.append(element)
+            self.selectors[id(element)] = block['selector']
+            self.block_hashes[id(element)] = get_block_hash(block)
+
+
+def get_block_hash(block):
+    '''
+    Get a hash of the content of a block sent by a client: the hex SHA-1 of its
+    lower-case tag name and its text, joined by a newline and encoded as UTF-8.
+    Blocks with the same content have the same regions wherever they are on a page,
+    so clients compute the same hash to tell us which blocks they have regions for.
+    '''
+    content = block['tag'].lower() + '\n' + block['text']
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def make_text_document(text):
+    ''' Make a document that holds some text, without parsing the text as HTML. '''
+    document = BeautifulSoup('', 'html.parser')
+    document.append(NavigableString(text))
+    return document
+
+
 def get_css_selector(tag):
     ''' Create a CSS selector that can choose this tag from the document. '''
 
+    # Clients give the selectors of the blocks they send
+    if isinstance(tag.parent, BlockDocument):
+        return tag.parent.selectors[id(tag)]
+
     elements = []
 
     element = tag
@@ -4,33 +4,195 @@
 from __future__ import unicode_literals
 import logging
 import os.path
+import time
+import threading
+import argparse
 from django.conf import settings
 
-from py4j.java_gateway import launch_gateway, JavaGateway,\
+from py4j.java_gateway import launch_gateway, JavaGateway, JavaMember,\
     GatewayParameters, CallbackServerParameters, is_instance_of
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
+HEALTH_CHECK_INTERVAL = 30  # seconds between checks that the JVM is still responding
 
 
-# Launch a gateway to the all Java JAR dependencies that we have
-classpath = ':'.join([
-    os.path.join(settings.DEPS_DIR, jar)
-    for jar in os.listdir('deps')
-])
-port_number = launch_gateway(
-    classpath=classpath,
-    die_on_exit=True,
-)
-gateway = JavaGateway(
-    gateway_parameters=GatewayParameters(port=port_number),
-    callback_server_parameters=CallbackServerParameters(port=0),
-)
-python_port = gateway.get_callback_server().get_listening_port()
-gateway.java_gateway_server.resetCallbackClient(
-    gateway.java_gateway_server.getCallbackClient().getAddress(),
-    python_port,
-)
+class GatewayManager(object):
+    '''
+    Owns the connection to the JVM that gives us access to the JARs in `deps`.
+
+    The JVM is launched lazily, on the first call to `get`, so that processes that never
+    call into Java (management commands, most tests, workers that only explain regular
+    expressions) never pay for JVM startup.  Every so often, `get` checks that the JVM
+    still responds, and launches a new one if it has died.
+
+    If `settings.JAVA_GATEWAY_PORT` is set, the manager connects to a long-lived gateway
+    already listening on that port (see `serve` below) instead of launching its own JVM,
+    so that all workers on a host can share one JVM.
+
+    Metrics on JVM startup and call latency are kept in `metrics`.  Many threads can
+    update them at once, so they are only read or written while holding `metrics_lock`.
+
+    One manager can be shared by all threads of a process: Py4J gives each thread its
+    own connection to the gateway, and the manager only launches one JVM at a time.
+    '''
+
+    def __init__(self):
+        self.gateway = None
+        self.last_health_check = None
+        self.lock = threading.Lock()
+        self.metrics_lock = threading.Lock()
+        self.metrics = {
+            'starts': 0,
+            'last_start_seconds': None,
+            'health_checks': 0,
+            'failed_health_checks': 0,
+            'calls': 0,
+            'total_call_seconds': 0.0,
+            'last_call_seconds': None,
+        }
+
+    def get(self):
+        with self.lock:
+            if self.gateway is None:
+                self.gateway = self._start()
+            elif time.time() - self.last_health_check > HEALTH_CHECK_INTERVAL:
+                if not self._is_healthy():
+                    logging.warn("Java gateway stopped responding.  Restarting it.")
+                    self._close()
+                    self.gateway = self._start()
+            return self.gateway
+
+    def shutdown(self, raise_exception=False):
+        with self.lock:
+            if self.gateway is not None:
+                # We only shut down the JVM if we launched it.  A shared gateway
+                # outlives the processes that connect to it.
+                if settings.JAVA_GATEWAY_PORT is None:
+                    self.gateway.shutdown(raise_exception=raise_exception)
+                else:
+                    self.gateway.close()
+                self.gateway = None
+
+    def timed_call(self, function, *args, **kwargs):
+        ''' Call a function that talks to the JVM, recording how long the call took. '''
+        start_time = time.time()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            call_seconds = time.time() - start_time
+            with self.metrics_lock:
+                self.metrics['calls'] += 1
+                self.metrics['total_call_seconds'] += call_seconds
+                self.metrics['last_call_seconds'] = call_seconds
+
+    def _start(self):
+
+        start_time = time.time()
+        shared_port = settings.JAVA_GATEWAY_PORT
+
+        if shared_port is not None:
+            gateway = JavaGateway(gateway_parameters=GatewayParameters(port=shared_port))
+        else:
+            port_number = launch_gateway(
+                classpath=get_classpath(),
+                die_on_exit=True,
+            )
+            gateway = JavaGateway(
+                gateway_parameters=GatewayParameters(port=port_number),
+                callback_server_parameters=CallbackServerParameters(port=0),
+            )
+            python_port = gateway.get_callback_server().get_listening_port()
+            gateway.java_gateway_server.resetCallbackClient(
+                gateway.java_gateway_server.getCallbackClient().getAddress(),
+                python_port,
+            )
+
+        start_seconds = time.time() - start_time
+        with self.metrics_lock:
+            self.metrics['starts'] += 1
+            self.metrics['last_start_seconds'] = start_seconds
+        self.last_health_check = time.time()
+        logging.info(
+            "Connected to Java gateway in %.3f seconds (%s)", start_seconds,
+            "shared on port %d" % shared_port if shared_port is not None else "launched")
+        return gateway
+
+    def _is_healthy(self):
+        with self.metrics_lock:
+            self.metrics['health_checks'] += 1
+        self.last_health_check = time.time()
+        try:
+            self.timed_call(self.gateway.jvm.java.lang.System.currentTimeMillis)
+            return True
+        except Exception as e:
+            with self.metrics_lock:
+                self.metrics['failed_health_checks'] += 1
+            logging.warn("Java gateway health check failed: %s", str(e))
+            return False
+
+    def _close(self):
+        try:
+            self.gateway.close()
+        except Exception:
+            pass
+        self.gateway = None
+
+
+def get_classpath():
+    ''' Classpath with all Java JAR dependencies that we have. '''
+    return ':'.join([
+        os.path.join(settings.DEPS_DIR, jar)
+        for jar in os.listdir(settings.DEPS_DIR)
+    ])
+
+
+gateway_manager = GatewayManager()
+
+
+class JavaProxy(object):
+    '''
+    Stands in for a Java class or object that lives in the JVM.
+
+    A module can't hold on to Java objects from one gateway, as they go stale when the
+    manager relaunches the JVM.  A proxy instead looks up its object with `resolve_func`,
+    which is passed the current gateway, and looks it up again whenever the gateway changes.
+    Calls to the object's methods (and to the object itself, for constructors) go through
+    `gateway_manager.timed_call`, so they are counted in the call latency metrics.
+    '''
+
+    def __init__(self, resolve_func, manager=None):
+        self._resolve_func = resolve_func
+        self._manager = manager if manager is not None else gateway_manager
+        self._gateway = None
+        self._java_object = None
+
+    def resolve(self):
+        ''' Get the Java object from the current gateway, launching the JVM if needed. '''
+        gateway = self._manager.get()
+        if gateway is not self._gateway:
+            self._java_object = self._resolve_func(gateway)
+            self._gateway = gateway
+        return self._java_object
+
+    def __getattr__(self, name):
+        attribute = getattr(self.resolve(), name)
+        if isinstance(attribute, JavaMember):
+            return lambda *args, **kwargs: self._manager.timed_call(attribute, *args, **kwargs)
+        return attribute
+
+    def __call__(self, *args, **kwargs):
+        return self._manager.timed_call(self.resolve(), *args, **kwargs)
+
+
+def get_gateway():
+    ''' Get a running gateway to the JVM, launching or relaunching it if needed. '''
+    return gateway_manager.get()
+
+
+def shutdown_gateway(raise_exception=False):
+    ''' Shut down the gateway if it was ever started.  Safe to call if it wasn't. '''
+    gateway_manager.shutdown(raise_exception=raise_exception)
 
 
 def java_isinstance(java_object, java_class):
@@ -39,4 +201,27 @@ def java_isinstance(java_object, java_class):
     Py4J `is_instance_of` method, which is documented here:
     https://www.py4j.org/py4j_java_gateway.html#javaobject
     '''
-    return is_instance_of(gateway, java_object, java_class)
+    if isinstance(java_object, JavaProxy):
+        java_object = java_object.resolve()
+    if isinstance(java_class, JavaProxy):
+        java_class = java_class.resolve()
+    return gateway_manager.timed_call(is_instance_of, get_gateway(), java_object, java_class)
+
+
+def serve(port):
+    '''
+    Run a long-lived gateway that workers can share by setting `JAVA_GATEWAY_PORT`.
+    The JVM lives as long as this process, so it can be kept alive by a process supervisor.
+    '''
+    launch_gateway(port=port, classpath=get_classpath(), die_on_exit=True)
+    logging.info("Serving Java gateway on port %d", port)
+    while True:
+        time.sleep(HEALTH_CHECK_INTERVAL)
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(
+        description="Run a Java gateway that can be shared by all Tutorons workers on a host")
+    argument_parser.add_argument('--port', type=int, default=25333)
+    args = argument_parser.parse_args()
+    serve(args.port)
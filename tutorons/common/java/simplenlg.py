@@ -5,26 +5,38 @@ from __future__ import unicode_literals
 import logging
 from py4j.java_gateway import java_import
 
-from tutorons.common.java.gateway import gateway
+from tutorons.common.java.gateway import JavaProxy
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
+def _import_simplenlg(gateway):
+    java_import(gateway.jvm, 'simplenlg.features.*')
+    java_import(gateway.jvm, 'simplenlg.realiser.english.*')
+    java_import(gateway.jvm, 'simplenlg.framework.*')
+    java_import(gateway.jvm, 'simplenlg.lexicon.*')
+    java_import(gateway.jvm, 'simplenlg.phrasespec.*')
+    return gateway.jvm
+
+
 # Load all of the SimpleNLG dependencies we might want to access from Python code.
 # The variables assigned below can be imported as if they were Python classes.
-java_import(gateway.jvm, 'simplenlg.features.*')
-java_import(gateway.jvm, 'simplenlg.realiser.english.*')
-java_import(gateway.jvm, 'simplenlg.framework.*')
-java_import(gateway.jvm, 'simplenlg.lexicon.*')
-java_import(gateway.jvm, 'simplenlg.phrasespec.*')
-
-lexicon = gateway.jvm.Lexicon.getDefaultLexicon()
-factory = gateway.jvm.NLGFactory(lexicon)
-realiser = gateway.jvm.Realiser(lexicon)
-NumberAgreement = gateway.jvm.NumberAgreement
-Feature = gateway.jvm.Feature
-Form = gateway.jvm.Form
-DiscourseFunction = gateway.jvm.DiscourseFunction
-NPPhraseSpec = gateway.jvm.NPPhraseSpec
-SPhraseSpec = gateway.jvm.SPhraseSpec
+# They are proxies, so the JVM is only launched the first time one of them is used,
+# and they keep working if the JVM is relaunched.
+jvm = JavaProxy(_import_simplenlg)
+
+
+def _simplenlg_class(name):
+    return JavaProxy(lambda gateway: getattr(jvm.resolve(), name))
+
+
+lexicon = JavaProxy(lambda gateway: jvm.resolve().Lexicon.getDefaultLexicon())
+factory = JavaProxy(lambda gateway: jvm.resolve().NLGFactory(lexicon.resolve()))
+realiser = JavaProxy(lambda gateway: jvm.resolve().Realiser(lexicon.resolve()))
+NumberAgreement = _simplenlg_class('NumberAgreement')
+Feature = _simplenlg_class('Feature')
+Form = _simplenlg_class('Form')
+DiscourseFunction = _simplenlg_class('DiscourseFunction')
+NPPhraseSpec = _simplenlg_class('NPPhraseSpec')
+SPhraseSpec = _simplenlg_class('SPhraseSpec')
@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import threading
+import ply.yacc
+from slimit import lextab, yacctab
+from slimit.lexer import Lexer as JsLexer
+from slimit.parser import Parser as JsParser
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+'''
+Lexers and parsers for JavaScript that are created once for each thread and reused.
+
+Creating a slimit lexer compiles its token patterns, and creating a slimit parser
+loads its parse tables and builds two more lexers.  Extractors used to pay for all
+of this for every HTML node they scanned.  The instances here are built once, from
+the precomputed tables that ship with slimit, and are reset before each input.
+'''
+
+
+class JavascriptLexer(JsLexer):
+    '''
+    A slimit lexer built from precomputed tables, that can be reset for each input.
+    It remembers the tokens it has read from the current input, so that the tokens
+    read by a parser while parsing can be used without lexing the text again.
+    '''
+    def __init__(self):
+        self.prev_token = None
+        self.cur_token = None
+        self.next_tokens = []
+        self.tokens_read = []
+        self.build(optimize=True, lextab=lextab)
+
+    def input(self, text):
+        self.prev_token = None
+        self.cur_token = None
+        self.next_tokens = []
+        self.tokens_read = []
+        self.lexer.begin('INITIAL')
+        self.lexer.lineno = 1
+        super(JavascriptLexer, self).input(text)
+
+    def token(self):
+        token = super(JavascriptLexer, self).token()
+        # When the parser inserts a semicolon, the lexer gives back the token it
+        # read before the semicolon a second time.  We only remember it once.
+        if token is not None and not (self.tokens_read and token is self.tokens_read[-1]):
+            self.tokens_read.append(token)
+        return token
+
+
+class JavascriptParser(JsParser):
+    ''' A slimit parser built from precomputed tables, that can be reset for each input. '''
+
+    def __init__(self):
+        self.lex_optimize = True
+        self.lextab = lextab
+        self.yacc_optimize = True
+        self.yacctab = yacctab
+        self.yacc_debug = False
+        self.lexer = JavascriptLexer()
+        self.tokens = self.lexer.tokens
+        self.parser = ply.yacc.yacc(
+            module=self, optimize=True, debug=False, write_tables=False,
+            tabmodule=yacctab, start='program')
+        self._error_tokens = {}
+
+    def parse(self, text, debug=False):
+        self._error_tokens = {}
+        return super(JavascriptParser, self).parse(text, debug=debug)
+
+
+_instances = threading.local()
+
+
+def get_lexer():
+    if not hasattr(_instances, 'lexer'):
+        _instances.lexer = JavascriptLexer()
+    return _instances.lexer
+
+
+def get_parser():
+    if not hasattr(_instances, 'parser'):
+        _instances.parser = JavascriptParser()
+    return _instances.parser
+
+
+def lex_javascript(text):
+    '''
+    Lex JavaScript text.  Returns a tuple of the tokens that were read, and
+    whether all of the text could be lexed.  If it couldn't, the tokens read
+    before the lexing error are still returned.
+    '''
+    lexer = get_lexer()
+    lexer.input(text)
+    try:
+        while lexer.token():
+            pass
+    except (TypeError, AttributeError):
+        return lexer.tokens_read, False
+    return lexer.tokens_read, True
+
+
+def parse_javascript(text):
+    '''
+    Parse JavaScript text.  Returns a tuple of whether the text was parsed
+    successfully, and the tokens that the parser read.  Tokens are only
+    complete when the text was parsed successfully.
+    '''
+    parser = get_parser()
+    try:
+        parser.parse(text)
+    except (SyntaxError, TypeError):
+        return False, parser.lexer.tokens_read
+    return True, parser.lexer.tokens_read
@@ -0,0 +1,100 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+import threading
+import time
+import datetime
+from multiprocessing.pool import ThreadPool
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from tutorons.common.models import ScanJob
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+SAVE_INTERVAL = 0.5  # seconds between saves of the regions a job has found so far
+CLEANUP_INTERVAL = 10 * 60  # seconds between deletions of old jobs by each process
+
+
+class ScanJobRunner(object):
+    '''
+    Runs scans of large documents in a pool of background threads, so that the request
+    that started a scan can return right away.  Each scan is a `ScanJob` in the database,
+    so a client can poll for its results through any worker process.
+
+    The pool is started on the first scan, so that it is created in the worker process
+    that uses it and not in a parent process that forks the workers.
+
+    Jobs older than `settings.SCAN_JOB_MAX_AGE` are deleted every so often when jobs
+    are submitted.
+    '''
+
+    def __init__(self):
+        self.pool = None
+        self.lock = threading.Lock()
+        self.last_cleanup_time = None
+
+    def submit(self, query, scan_regions):
+        '''
+        Start a job for a scan.  `scan_regions` is a function that yields explained regions
+        as they are found.  Returns the job, which will be pending until a thread starts it.
+        '''
+        self._delete_old_jobs()
+        job = ScanJob.objects.create(query=query)
+        if settings.SCAN_JOB_WORKERS == 0:
+            self._run(job.id, scan_regions)
+        else:
+            self._get_pool().apply_async(self._run, (job.id, scan_regions))
+        return job
+
+    def _get_pool(self):
+        with self.lock:
+            if self.pool is None:
+                self.pool = ThreadPool(settings.SCAN_JOB_WORKERS)
+            return self.pool
+
+    def _delete_old_jobs(self):
+        now = time.time()
+        with self.lock:
+            if self.last_cleanup_time is not None and\
+                    now - self.last_cleanup_time < CLEANUP_INTERVAL:
+                return
+            self.last_cleanup_time = now
+        oldest_time = timezone.now() - datetime.timedelta(seconds=settings.SCAN_JOB_MAX_AGE)
+        ScanJob.objects.filter(created_time__lt=oldest_time).delete()
+
+    def _run(self, job_id, scan_regions):
+
+        # Errors raised in the pool's threads are dropped, so every error has to be
+        # caught here and the job marked failed, or it would never finish.
+        jobs = ScanJob.objects.filter(id=job_id)
+        regions = []
+        status = ScanJob.FAILED
+        try:
+            jobs.update(status=ScanJob.RUNNING, updated_time=timezone.now())
+            last_save_time = time.time()
+            for region in scan_regions():
+                regions.append(region)
+                if time.time() - last_save_time > SAVE_INTERVAL:
+                    jobs.update(regions=json.dumps(regions), updated_time=timezone.now())
+                    last_save_time = time.time()
+            status = ScanJob.DONE
+        except Exception:
+            logging.exception("Error running scan job %s", job_id)
+        finally:
+            try:
+                jobs.update(
+                    status=status, regions=json.dumps(regions), updated_time=timezone.now())
+            except Exception:
+                logging.exception("Error saving scan job %s", job_id)
+            # Each thread has its own database connection, which Django only closes
+            # at the end of requests.  Jobs run outside of requests.
+            if settings.SCAN_JOB_WORKERS != 0:
+                close_old_connections()
+
+
+scan_job_runner = ScanJobRunner()
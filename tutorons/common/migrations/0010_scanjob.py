@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_auto_20160402_2358'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScanJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, serialize=False, editable=False, primary_key=True)),
+                ('created_time', models.DateTimeField(auto_now_add=True)),
+                ('updated_time', models.DateTimeField(auto_now=True)),
+                ('status', models.CharField(default=b'pending', max_length=10)),
+                ('regions', models.TextField(default=b'[]')),
+                ('query', models.ForeignKey(on_delete=django.db.models.deletion.SET_NULL, to='common.ServerQuery', null=True)),
+            ],
+        ),
+    ]
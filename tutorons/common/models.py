@@ -1,7 +1,11 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import uuid
+import datetime
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.encoding import python_2_unicode_compatible
 
 
@@ -94,3 +98,38 @@ class View(models.Model):
             self.action,
             self.server_query,
             self.time)
+
+
+@python_2_unicode_compatible
+class ScanJob(models.Model):
+    ''' A scan of a large document that runs in the background while the client polls it. '''
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    query = models.ForeignKey(ServerQuery, on_delete=models.SET_NULL, null=True)
+    created_time = models.DateTimeField(auto_now_add=True)
+    updated_time = models.DateTimeField(auto_now=True)
+    status = models.CharField(max_length=10, default=PENDING)
+    regions = models.TextField(default='[]')  # JSON list of the regions explained so far
+
+    def fail_if_lost(self):
+        '''
+        Mark this job failed if it hasn't finished and hasn't made progress for longer than
+        `settings.SCAN_JOB_TIMEOUT`.  Jobs are lost when the worker running them stops.
+        '''
+        if self.status not in (self.PENDING, self.RUNNING):
+            return
+        timeout = datetime.timedelta(seconds=settings.SCAN_JOB_TIMEOUT)
+        if timezone.now() - self.updated_time > timeout:
+            self.status = self.FAILED
+            self.save()
+
+    def __str__(self):
+        return "ID:%s, Status:%s, Query:%s" % (
+            self.id,
+            self.status,
+            self.query)
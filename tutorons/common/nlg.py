@@ -0,0 +1,320 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import re
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+'''
+A small, in-process sentence realiser that covers the subset of SimpleNLG
+that our explainers use: noun phrases with determiners and plurals, verb
+phrases with particles, adjective and prepositional phrases, clauses with
+a verb, object and complements, and coordinated phrases.
+
+The classes and methods here mirror the names of SimpleNLG's Java API
+(`factory.createClause()`, `phrase.setFeature(...)`, `realiser.realise(...)`),
+so that code written against SimpleNLG through Py4J can use this module as a
+drop-in replacement without paying for a round-trip to the JVM on every call.
+The morphology and ordering rules are ported from SimpleNLG 4.4 so that
+realisations stay identical.
+'''
+
+
+class Feature(object):
+    NUMBER = 'number'
+
+
+class NumberAgreement(object):
+    SINGULAR = 'singular'
+    PLURAL = 'plural'
+
+
+IRREGULAR_PLURAL_NOUNS = {
+    'child': 'children',
+}
+
+IRREGULAR_PRESENT_VERBS = {
+    # base form: (third person singular, plural)
+    'be': ('is', 'are'),
+    'have': ('has', 'have'),
+}
+
+
+def pluralize_noun(noun):
+    ''' Regular plural inflection rules, ported from SimpleNLG's MorphologyRules. '''
+    if noun in IRREGULAR_PLURAL_NOUNS:
+        return IRREGULAR_PLURAL_NOUNS[noun]
+    if re.search(r'[b-df-hj-np-tv-z]y$', noun):
+        return noun[:-1] + 'ies'
+    if re.search(r'([szx]|[cs]h)$', noun):
+        return noun + 'es'
+    return noun + 's'
+
+
+def conjugate_verb(verb, plural):
+    ''' Present tense inflection of a verb in the third person. '''
+    if verb in IRREGULAR_PRESENT_VERBS:
+        singular_form, plural_form = IRREGULAR_PRESENT_VERBS[verb]
+        return plural_form if plural else singular_form
+    if plural:
+        return verb
+    # SimpleNLG's pattern for this rule is the character class [szx(ch)(sh)],
+    # which matches any word ending in one of 's', 'z', 'x', 'c', or 'h'.
+    if re.search(r'[szxch]$', verb):
+        return verb + 'es'
+    if re.search(r'[b-df-hj-np-tv-z]y$', verb):
+        return verb[:-1] + 'ies'
+    return verb + 's'
+
+
+def requires_an(word):
+    ''' Decide whether the indefinite article before this word should be 'an'. '''
+    lowercase = word.lower()
+    return re.match('[aeiou]', lowercase) is not None and not lowercase.startswith('one')
+
+
+class NLGElement(object):
+
+    def __init__(self):
+        self.features = {}
+
+    def setFeature(self, feature, value):
+        self.features[feature] = value
+
+    def getFeature(self, feature):
+        return self.features.get(feature)
+
+    def isPlural(self):
+        return self.getFeature(Feature.NUMBER) == NumberAgreement.PLURAL
+
+
+class StringElement(NLGElement):
+
+    def __init__(self, text):
+        super(StringElement, self).__init__()
+        self.text = text
+
+
+class PhraseElement(NLGElement):
+
+    def __init__(self):
+        super(PhraseElement, self).__init__()
+        self.pre_modifiers = []
+        self.complements = []
+
+    def addPreModifier(self, modifier):
+        self.pre_modifiers.append(_as_element(modifier))
+
+    def setPreModifier(self, modifier):
+        self.pre_modifiers = [_as_element(modifier)]
+
+    def getPreModifiers(self):
+        return self.pre_modifiers
+
+    def addComplement(self, complement):
+        self.complements.append(_as_element(complement))
+
+    def setComplement(self, complement):
+        self.complements = [_as_element(complement)]
+
+
+class NPPhraseSpec(PhraseElement):
+
+    def __init__(self, noun=None):
+        super(NPPhraseSpec, self).__init__()
+        self.noun = _as_element(noun)
+        self.determiner = None
+
+    def setNoun(self, noun):
+        self.noun = _as_element(noun)
+
+    def setDeterminer(self, determiner):
+        self.determiner = determiner
+
+
+class VPPhraseSpec(PhraseElement):
+
+    def __init__(self, verb=None):
+        super(VPPhraseSpec, self).__init__()
+        self.verb = None
+        self.particle = None
+        self.object_ = None
+        if verb is not None:
+            self.setVerb(verb)
+
+    def setVerb(self, verb):
+        # Like SimpleNLG, a verb given with a space (e.g., 'belong to')
+        # is split into a verb and a particle, so that only the verb is inflected.
+        parts = verb.split(' ', 1)
+        self.verb = parts[0]
+        self.particle = parts[1] if len(parts) > 1 else None
+
+    def setObject(self, object_):
+        self.object_ = _as_element(object_)
+
+
+class AdjPhraseSpec(PhraseElement):
+
+    def __init__(self, adjective=None):
+        super(AdjPhraseSpec, self).__init__()
+        self.adjective = adjective
+
+
+class PPPhraseSpec(PhraseElement):
+
+    def __init__(self, preposition=None):
+        super(PPPhraseSpec, self).__init__()
+        self.preposition = preposition
+
+    def setPreposition(self, preposition):
+        self.preposition = preposition
+
+
+class SPhraseSpec(NLGElement):
+    '''
+    A clause without a subject.  As in SimpleNLG, the object and complements
+    of a clause are held by its verb phrase.
+    '''
+    def __init__(self):
+        super(SPhraseSpec, self).__init__()
+        self.verb_phrase = VPPhraseSpec()
+
+    def setVerb(self, verb):
+        if isinstance(verb, VPPhraseSpec):
+            verb.object_ = verb.object_ or self.verb_phrase.object_
+            verb.complements = verb.complements or self.verb_phrase.complements
+            self.verb_phrase = verb
+        else:
+            self.verb_phrase.setVerb(verb)
+
+    def setObject(self, object_):
+        self.verb_phrase.setObject(object_)
+
+    def addComplement(self, complement):
+        self.verb_phrase.addComplement(complement)
+
+    def setComplement(self, complement):
+        self.verb_phrase.setComplement(complement)
+
+
+class CoordinatedPhraseElement(NLGElement):
+
+    def __init__(self, conjunction='and'):
+        super(CoordinatedPhraseElement, self).__init__()
+        self.conjunction = conjunction
+        self.coordinates = []
+
+    def addCoordinate(self, coordinate):
+        self.coordinates.append(_as_element(coordinate))
+
+
+def _as_element(value):
+    if value is None or isinstance(value, NLGElement):
+        return value
+    return StringElement(value)
+
+
+class NLGFactory(object):
+    ''' Creates phrases, with the same method names as SimpleNLG's NLGFactory. '''
+
+    def createClause(self):
+        return SPhraseSpec()
+
+    def createNounPhrase(self, noun=None):
+        return NPPhraseSpec(noun)
+
+    def createVerbPhrase(self, verb=None):
+        return VPPhraseSpec(verb)
+
+    def createAdjectivePhrase(self, adjective=None):
+        return AdjPhraseSpec(adjective)
+
+    def createPrepositionPhrase(self, preposition=None):
+        return PPPhraseSpec(preposition)
+
+    def createCoordinatedPhrase(self):
+        return CoordinatedPhraseElement()
+
+
+class Realiser(object):
+    '''
+    Realises phrases as text.  Clauses that appear as complements of other
+    phrases are subordinate, and are introduced with the complementiser 'that'.
+    '''
+    def realise(self, element):
+        return self._realise(element)
+
+    def _realise(self, element, subordinate=False, number=None):
+
+        if element is None:
+            return ''
+        elif isinstance(element, StringElement):
+            return element.text
+        elif isinstance(element, NPPhraseSpec):
+            return self._realise_noun_phrase(element)
+        elif isinstance(element, VPPhraseSpec):
+            return self._realise_verb_phrase(element, element.isPlural())
+        elif isinstance(element, AdjPhraseSpec):
+            return self._join(self._realise_all(element.pre_modifiers) + [element.adjective])
+        elif isinstance(element, PPPhraseSpec):
+            return self._join(
+                self._realise_all(element.pre_modifiers) +
+                [element.preposition] +
+                self._realise_all(element.complements, subordinate=True)
+            )
+        elif isinstance(element, SPhraseSpec):
+            plural = (number or element.getFeature(Feature.NUMBER)) == NumberAgreement.PLURAL
+            return self._join([
+                'that' if subordinate else None,
+                self._realise_verb_phrase(element.verb_phrase, plural),
+            ])
+        elif isinstance(element, CoordinatedPhraseElement):
+            # Coordinates inherit the number of the phrase that coordinates them
+            number = element.getFeature(Feature.NUMBER) or number
+            coordinates = self._realise_all(element.coordinates, subordinate, number)
+            if len(coordinates) <= 1:
+                return self._join(coordinates)
+            return ', '.join(coordinates[:-1]) + ' ' + element.conjunction + ' ' + coordinates[-1]
+
+    def _realise_all(self, elements, subordinate=False, number=None):
+        return [self._realise(e, subordinate, number) for e in elements]
+
+    def _realise_noun_phrase(self, phrase):
+
+        if isinstance(phrase.noun, StringElement) and phrase.isPlural():
+            head = pluralize_noun(phrase.noun.text)
+        else:
+            head = self._realise(phrase.noun)
+
+        words = self._realise_all(phrase.pre_modifiers) + [head]
+        words = [w for w in words if w]
+
+        # The indefinite article agrees with the word that follows it
+        determiner = phrase.determiner
+        if determiner == 'a' and len(words) > 0:
+            if phrase.isPlural():
+                determiner = 'some'
+            elif requires_an(words[0]):
+                determiner = 'an'
+
+        return self._join(
+            [determiner] + words + self._realise_all(phrase.complements, subordinate=True))
+
+    def _realise_verb_phrase(self, phrase, plural):
+        verb = conjugate_verb(phrase.verb, plural) if phrase.verb is not None else None
+        return self._join(
+            self._realise_all(phrase.pre_modifiers) +
+            [verb, phrase.particle, self._realise(phrase.object_)] +
+            self._realise_all(phrase.complements, subordinate=True)
+        )
+
+    def _join(self, words):
+        return ' '.join([w for w in words if w])
+
+
+factory = NLGFactory()
+realiser = Realiser()
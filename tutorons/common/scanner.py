@@ -7,9 +7,11 @@ import re
 import copy
 from bs4 import Tag
 
+from tutorons.common.artifacts import ArtifactStore
+from tutorons.common.extractor import get_text_blocks
+
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
-RARE_CHARACTER = '\u3222'  # A character we never expect to appear on an HTML page
 
 
 class InvalidCommandException(Exception):
@@ -21,11 +23,16 @@ class InvalidCommandException(Exception):
 
 
 class NodeScanner(object):
-    ''' Scans document for explainable regions inside node types.'''
+    '''
+    Scans document for explainable regions inside node types.
+    Scanners and extractors that are given the same artifact store share the
+    copies of nodes they make, and the representations they derive from them.
+    '''
 
-    def __init__(self, extractor, tags):
+    def __init__(self, extractor, tags, artifacts=None):
         self.extractor = extractor
         self.tags = tags
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
 
     def scan(self, document):
         return self.visit(document)
@@ -46,10 +53,13 @@ class NodeScanner(object):
         # 'blank out' tags in which regions have been detected when examining
         # their parent for regions.
         if type(node) is Tag and node.name in self.tags and self.extract_allowed(node):
-            node_clone = copy.copy(node)
-            for c in node_clone.children:
-                if c in children_with_regions:
-                    c.replace_with(' ' * len(c.text))
+            if children_with_regions:
+                node_clone = copy.copy(node)
+                for c in node_clone.children:
+                    if c in children_with_regions:
+                        c.replace_with(' ' * len(c.text))
+            else:
+                node_clone = self.artifacts.get('node_clone', node, copy.copy)
 
             # As the clone is detached from the rest of the document, we need
             # to reset the region's parent node to the original node, even though
@@ -99,12 +109,8 @@ class CommandScanner(NodeScanner):
 
     def _node_has_pattern(self, node, pattern):
 
-        ''' Make a copy of the node and split on <br> tags. '''
-        node_copy = copy.copy(node)
-        for br in node_copy.select('br'):
-            br.replace_with(RARE_CHARACTER)
-        node_text = node_copy.text
-        text_blocks = node_text.split(RARE_CHARACTER)
+        ''' Split on <br> tags. '''
+        text_blocks = self.artifacts.get('text_blocks', node, get_text_blocks)
 
         for block in text_blocks:
             if re.search(pattern, block):
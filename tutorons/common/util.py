@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 import logging
+import threading
+from collections import OrderedDict
 
 from tutorons.common.htmltools import get_css_selector
 
@@ -31,3 +33,68 @@ def get_descendants(x):
         return [i for child in x for i in get_descendants(child)]
     else:
         return []
+
+
+class LruCache(object):
+    '''
+    A bounded map that evicts the least recently used entry when it is full.
+    Counts hits and misses so that we can see whether a cache is the right size.
+    If a `sizeof` function is given, it is called with each key and value that is stored
+    to estimate how many bytes the entry takes, and the total is kept in `size`.
+    '''
+    def __init__(self, maxsize, sizeof=None):
+        self.maxsize = maxsize
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                # Move the entry to the most recently used end of the ordering
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self.hits += 1
+                return value
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            if key in self._entries:
+                self._forget(key, self._entries.pop(key))
+            elif len(self._entries) >= self.maxsize:
+                self._forget(*self._entries.popitem(last=False))
+            self._entries[key] = value
+            if self.sizeof is not None:
+                self.size += self.sizeof(key, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.size = 0
+
+    def stats(self):
+        ''' Get a snapshot of how full the cache is and how often it has been hit. '''
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': float(self.hits) / lookups if lookups else None,
+                'size': self.size if self.sizeof is not None else None,
+            }
+
+    def _forget(self, key, value):
+        if self.sizeof is not None:
+            self.size -= self.sizeof(key, value)
+
+    def __len__(self):
+        return len(self._entries)
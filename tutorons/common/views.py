@@ -3,16 +3,65 @@
 
 from __future__ import unicode_literals
 import logging
+import time
+import urllib
+import hashlib
 
-from django.http import HttpResponse
+from django.conf import settings
+from django.core.urlresolvers import get_callable
+from django.db import transaction
+from django.template import Context
+from django.template.loader import get_template
+from django.http import HttpResponse, HttpResponseBadRequest, HttpResponseNotModified,\
+    HttpResponsePermanentRedirect, Http404
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
 import json
 
 from tutorons.common.extractor import Region
-from tutorons.common.htmltools import get_css_selector, HtmlDocument
+from tutorons.common.htmltools import get_css_selector, get_block_hash, make_text_document,\
+    BlockDocument, HtmlDocument
 from tutorons.common.dblogger import DbLogger
+from tutorons.common.jobs import scan_job_runner
+from tutorons.common.models import ScanJob
+from tutorons.common.util import LruCache
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
+SCAN_JOB_POLL_INTERVAL = 0.25  # seconds between checks for new results while long-polling
+MAX_DEFERRED_KEY_LENGTH = 1000  # regions with longer text are always explained during the scan
+RENDERED_REGION_CACHE_SIZE = 2000
+RENDERED_SNIPPET_CACHE_SIZE = 2000
+MAX_SNIPPET_BATCH_SIZE = 1000
+
+
+class ErrorDocument(unicode):
+    ''' A document that says that a snippet couldn't be explained. '''
+
+
+def render_error(text, type_):
+    ''' Render the message that `text` couldn't be explained as a `type_`. '''
+    error_template = get_template('error.html')
+    return ErrorDocument(error_template.render(Context({'text': text, 'type': type_})))
+
+
+def _patch_explanation_cache_control(response, document):
+    if isinstance(document, ErrorDocument):
+        max_age = settings.EXPLANATION_ERROR_MAX_AGE
+    else:
+        max_age = settings.EXPLANATION_MAX_AGE
+    patch_cache_control(response, public=True, max_age=max_age)
+
+
+def _dumps(data):
+    # Without indentation, the json module can use its C encoder
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _get_document_hash(document):
+    return hashlib.sha1(document.encode('utf-8')).hexdigest()
 
 
 def _get_resource_url(request, resource):
@@ -30,79 +79,485 @@ def _package_region(region, document, region_id, query_id):
     }
 
 
-def pagescan(scan_func):
+def _compact_regions(regions):
+    '''
+    Move the explanations out of packaged regions into a table keyed by their hash, so
+    that an explanation shared by many regions (e.g., a selector used all over a
+    page) is only sent once.  Each region keeps the hash as its 'explanation_hash'.
+    '''
+    compact_regions = []
+    explanations = {}
+    for region in regions:
+        region = dict(region)
+        document = region.pop('document', None)
+        if document is not None:
+            document_hash = _get_document_hash(document)
+            explanations[document_hash] = document
+            region['explanation_hash'] = document_hash
+        compact_regions.append(region)
+    return compact_regions, explanations
+
+
+def _load_blocks(blocks_content):
+    try:
+        blocks = json.loads(blocks_content)
+    except ValueError:
+        return None
+    if not isinstance(blocks, list):
+        return None
+    for block in blocks:
+        if not isinstance(block, dict) or\
+                not all(isinstance(block.get(k), basestring) for k in ('selector', 'tag', 'text')):
+            return None
+    return blocks
+
+
+def _load_known_blocks(known_blocks_content):
+    try:
+        known_blocks = json.loads(known_blocks_content)
+    except ValueError:
+        return None
+    if not isinstance(known_blocks, list) or\
+            not all(isinstance(h, basestring) for h in known_blocks):
+        return None
+    return set(known_blocks)
+
+
+def _split_known_blocks(blocks, known_blocks):
+    '''
+    Split blocks into those that need to be scanned, and the hashes of the blocks the
+    client already has regions for (each listed once, in the order they appear).
+    '''
+    new_blocks = []
+    unchanged_blocks = []
+    seen_hashes = set()
+    for block in blocks:
+        block_hash = get_block_hash(block)
+        if block_hash not in known_blocks:
+            new_blocks.append(block)
+        elif block_hash not in seen_hashes:
+            unchanged_blocks.append(block_hash)
+            seen_hashes.add(block_hash)
+    return new_blocks, unchanged_blocks
+
+
+def _get_explanation_url(request, key):
+    # Explanations are served next to the scan view, e.g., '/css/explanation' for '/css/scan'
+    path = request.path_info.rsplit('/', 1)[0] + '/explanation'
+    return _get_resource_url(request, path + '?' + urllib.urlencode({'key': key.encode('utf-8')}))
+
+
+def pagescan(explain_region, can_explain_region):
     '''
     A wrapper around 'scan' views.
     Handles a lot of the "scanning" boilerplate of fetching request
     arguments, logging the request and its results, and returning the
     results as and HTTP response.
+    Scan views yield each region they find with its key, the text that `explain_region`
+    renders an explanation for.  Regions that can't be explained are left out.
+    If the client asks for it (with the `defer_explanations` argument), regions are
+    returned without explanations, each with the URL from which the client can fetch
+    its explanation when the user opens it (see `regionexplain`).  Instead of rendering
+    explanations, `can_explain_region` makes a quicker check of each key, so that the
+    same regions are left out as when explanations are sent with the regions.
+    If the client allows it (with the `allow_async` argument), documents longer than
+    `settings.ASYNC_SCAN_MIN_DOCUMENT_SIZE` are scanned in the background, and the
+    response has the URL of a scan job that the client can poll for the regions.
+    Instead of the page's HTML (the `document` argument), the client can send the blocks
+    of text in it that could be explained (the `blocks` argument, a JSON list described
+    in `BlockDocument`), so that the page doesn't have to be uploaded and parsed.
+    When rescanning a page, the client can also send the hashes of the blocks it
+    already has regions for (the `known_blocks` argument, a JSON list of the hashes
+    from `get_block_hash`).  Only the other blocks are scanned, each region has the
+    'block_hash' of its block, and the response lists the known blocks that are still
+    on the page as 'unchanged_blocks'.
+    If the client asks for it (with the `compact` argument), each explanation is sent
+    once in the response's 'explanations' table, instead of with every region.
+    Responses are compressed for clients that accept gzip.
     '''
-    def wrapper(request):
+    def decorator(scan_func):
+        @gzip_page
+        def wrapper(request):
+            return _scan_page(request, scan_func, explain_region, can_explain_region)
+        return wrapper
+    return decorator
 
-        document_content = request.POST.get('document')
-        client_req_time = request.POST.get('client_start_time')
 
-        # Log request information
-        db_logger = DbLogger()
-        query_record = db_logger.log_query(request)
+def _scan_page(request, scan_func, explain_region, can_explain_region):
+
+    document_content = request.POST.get('document')
+    blocks_content = request.POST.get('blocks')
+    client_req_time = request.POST.get('client_start_time')
+    allow_async = request.POST.get('allow_async') == 'true'
+    defer_explanations = request.POST.get('defer_explanations') == 'true'
+    compact = request.POST.get('compact') == 'true'
+
+    blocks = None
+    unchanged_blocks = None
+    if blocks_content is not None:
+        blocks = _load_blocks(blocks_content)
+        if blocks is None:
+            return HttpResponseBadRequest(
+                "Blocks must be a JSON list of objects with a selector, tag, and text")
+        document_content = blocks_content
+        known_blocks_content = request.POST.get('known_blocks')
+        if known_blocks_content is not None:
+            known_blocks = _load_known_blocks(known_blocks_content)
+            if known_blocks is None:
+                return HttpResponseBadRequest("Known blocks must be a JSON list of hashes")
+            blocks, unchanged_blocks = _split_known_blocks(blocks, known_blocks)
+
+    # Log request information
+    db_logger = DbLogger()
+    query_record = db_logger.log_query(request)
+
+    # Scan document with wrapped method to get regions
+    # and their explanations
+    def scan_regions():
+        if blocks is not None:
+            document = BlockDocument(blocks)
+        else:
+            document = HtmlDocument(document_content)
+        for region, key in scan_func(document):
+
+            if defer_explanations and len(key) <= MAX_DEFERRED_KEY_LENGTH:
+                if not can_explain_region(key):
+                    continue
+                explanation = None
+            else:
+                explanation = explain_region(key)
+                if explanation is None:
+                    continue
 
-        # Scan document with wrapped method to get regions
-        # and their explanations
-        document = HtmlDocument(document_content)
-        regions = scan_func(document)
-        regions_explained = []
-        for region, explanation in regions:
             region_record = db_logger.log_region(request, query_record, region)
-            regions_explained.append(
-                _package_region(region, explanation, region_record.id, query_record.id)
-            )
+            packaged_region = _package_region(
+                region, explanation, region_record.id, query_record.id)
+            if blocks is not None:
+                packaged_region['block_hash'] = document.block_hashes[id(region.node)]
+            if explanation is None:
+                del packaged_region['document']
+                packaged_region['explanation_key'] = key
+                packaged_region['explanation_url'] = _get_explanation_url(request, key)
+            yield packaged_region
 
         # Update the runtime of the scan
         db_logger.update_server_end_time(query_record)
 
-        # Send back a response
-        return HttpResponse(
-            json.dumps({
-                'regions': regions_explained,
-                'client_query_url': _get_resource_url(request, "/api/v1/client_query/"),
-                'view_url': _get_resource_url(request, "/api/v1/view/"),
-                'query_id': query_record.id,
-                'client_start_time': client_req_time,
-            }, indent=2))
+    response = {
+        'client_query_url': _get_resource_url(request, "/api/v1/client_query/"),
+        'view_url': _get_resource_url(request, "/api/v1/view/"),
+        'query_id': query_record.id,
+        'client_start_time': client_req_time,
+    }
+    if unchanged_blocks is not None:
+        response['unchanged_blocks'] = unchanged_blocks
+
+    min_async_size = settings.ASYNC_SCAN_MIN_DOCUMENT_SIZE
+    if allow_async and min_async_size is not None and\
+            len(document_content) >= min_async_size:
+        job = scan_job_runner.submit(query_record, scan_regions)
+        response['job_id'] = job.id.hex
+        response['job_url'] = _get_resource_url(
+            request, "/api/v1/scan_job/" + job.id.hex + "/")
+        return HttpResponse(_dumps(response), status=202)
+
+    # Send back a response
+    regions = list(scan_regions())
+    if compact:
+        regions, response['explanations'] = _compact_regions(regions)
+    response['regions'] = regions
+    return HttpResponse(_dumps(response))
+
+
+def regionexplain(explain_region):
+    '''
+    Make a view that renders the explanation of a region from a scan made with
+    `defer_explanations`.  The region is given by its key, the `key` argument of a GET
+    request.  Explanations only depend on the key, so they are cached here and can be
+    cached by browsers and proxies.
+    '''
+    rendered_regions = LruCache(RENDERED_REGION_CACHE_SIZE)
+
+    def wrapper(request):
+
+        key = request.GET.get('key')
+        if key is None:
+            return HttpResponseBadRequest("A region explanation needs a key")
+
+        document = rendered_regions.get(key)
+        if document is None:
+            document = explain_region(key)
+            if document is None:
+                raise Http404("No explanation for region " + key)
+            rendered_regions.put(key, document)
+
+        response = HttpResponse(json.dumps({
+            'key': key,
+            'document': document,
+        }, indent=2))
+        _patch_explanation_cache_control(response, document)
+        return response
 
     return wrapper
 
 
+@gzip_page
+def scan_job(request, job_id):
+    '''
+    Get the regions a background scan has explained so far.  A client that has already
+    seen some of the regions passes how many with `since`, and only gets the ones after
+    them.  To long-poll, the client passes `wait`, the number of seconds to wait for
+    new regions or for the scan to finish before responding.  As for scans, `compact`
+    asks for each explanation to be sent once in an 'explanations' table.
+    '''
+    try:
+        since = int(request.GET.get('since', 0))
+        wait = float(request.GET.get('wait', 0))
+    except ValueError:
+        return HttpResponseBadRequest("'since' must be an integer and 'wait' a number")
+    # Comparisons with NaN are false, so NaN isn't allowed either
+    if not (since >= 0 and wait >= 0):
+        return HttpResponseBadRequest("'since' and 'wait' can't be negative")
+    wait = min(wait, settings.SCAN_JOB_MAX_WAIT)
+    compact = request.GET.get('compact') == 'true'
+    give_up_time = time.time() + wait
+
+    while True:
+        try:
+            job = ScanJob.objects.get(id=job_id)
+        except (ScanJob.DoesNotExist, ValueError):
+            raise Http404("No scan job with ID " + job_id)
+        job.fail_if_lost()
+        regions = json.loads(job.regions)
+        finished = job.status in (ScanJob.DONE, ScanJob.FAILED)
+        if finished or len(regions) > since or time.time() >= give_up_time:
+            break
+        time.sleep(SCAN_JOB_POLL_INTERVAL)
+
+    response = {
+        'job_id': job.id.hex,
+        'status': job.status,
+        'regions': regions[since:],
+        'region_count': len(regions),
+        'query_id': job.query_id,
+    }
+    if compact:
+        response['regions'], response['explanations'] = _compact_regions(response['regions'])
+    return HttpResponse(_dumps(response))
+
+
+def _normalize_snippet_text(text):
+    # Selections of the same snippet often differ only in surrounding whitespace
+    return text.replace('\r\n', '\n').strip()
+
+
+def _get_snippet_query(text, edge_size):
+    params = [('text', text.encode('utf-8'))]
+    if edge_size > 0:
+        params.append(('edge_size', edge_size))
+    return urllib.urlencode(params)
+
+
+def _get_etag(document):
+    return quote_etag(_get_document_hash(document))
+
+
 def snippetexplain(explain_func):
     '''
     A wrapper around 'explaining' views.
     Handles a lot of the "explaining" boilerplate of fetching request
     arguments, logging the request and its results, and returning the
     results as and HTTP response.
+    Explanations of a snippet only depend on its text, so they can also be fetched with
+    a GET request that browsers and proxies can cache.  These requests aren't logged;
+    the client reports what it showed to the URL in `beacon_url` (see `snippetbeacon`).
+    The view's `explain_snippet` attribute explains a snippet with the view's cache, for
+    views that explain many snippets at once (see `snippetbatch`).
     '''
+    rendered_snippets = LruCache(RENDERED_SNIPPET_CACHE_SIZE)
+
+    def explain_snippet(text, edge_size):
+        document = rendered_snippets.get((text, edge_size))
+        if document is None:
+            document = explain_func(text, edge_size)
+            rendered_snippets.put((text, edge_size), document)
+        return document
+
     def wrapper(request):
+        if request.method == 'GET':
+            return _explain_snippet_cacheable(request, explain_snippet)
+        return _explain_snippet(request, explain_snippet)
 
-        text = request.POST.get('text')
-        client_start_time = request.POST.get('client_start_time')
+    wrapper.explain_snippet = explain_snippet
+    return wrapper
+
+
+def _explain_snippet(request, explain_func):
+
+    text = request.POST.get('text')
+    client_start_time = request.POST.get('client_start_time')
+    try:
         edge_size = int(request.POST.get('edge_size', 0))
+    except ValueError:
+        return HttpResponseBadRequest("'edge_size' must be an integer")
+
+    db_logger = DbLogger()
+    query_record = db_logger.log_query(request)
+
+    region = Region(HtmlDocument(text), 0, len(text) - 1, text)
+    explanation = explain_func(text, edge_size)
+    region_record = db_logger.log_region(request, query_record, region)
+    explained_region = _package_region(region, explanation, region_record.id, query_record.id)
+
+    # Update the runtime of the scan
+    db_logger.update_server_end_time(query_record)
+
+    return HttpResponse(json.dumps({
+        "region": explained_region,
+        "url": _get_resource_url(request, "/api/v1/client_query/"),
+        "sq_id": query_record.id,
+        "client_start_time": client_start_time,
+        "error": 0
+    }, indent=2))
+
+
+def _explain_snippet_cacheable(request, explain_func):
+
+    text = request.GET.get('text')
+    if text is None:
+        return HttpResponseBadRequest("A snippet explanation needs text")
+    try:
+        edge_size = int(request.GET.get('edge_size', 0))
+    except ValueError:
+        return HttpResponseBadRequest("'edge_size' must be an integer")
+
+    # Send every spelling of the same snippet to one URL, so that caches keep one copy.
+    # If the snippet has edges of context around it, it can't be changed without moving
+    # where the edges end.
+    normalized_text = _normalize_snippet_text(text) if edge_size <= 0 else text
+    if normalized_text != text:
+        return HttpResponsePermanentRedirect(
+            request.path_info + '?' + _get_snippet_query(normalized_text, edge_size))
+
+    document = explain_func(normalized_text, edge_size)
+    etag = _get_etag(document)
+
+    if_none_match = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    if etag.strip('"') in if_none_match or '*' in if_none_match:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(json.dumps({
+            "region": {
+                'start_index': 0,
+                'end_index': len(normalized_text) - 1,
+                'document': document,
+                'region_id': None,
+                'query_id': None,
+            },
+            "url": _get_resource_url(request, "/api/v1/client_query/"),
+            "beacon_url": _get_resource_url(
+                request, request.path_info.rsplit('/', 1)[0] + '/explain_beacon'),
+            "error": 0
+        }, indent=2))
+
+    response['ETag'] = etag
+    _patch_explanation_cache_control(response, document)
+    return response
+
+
+@csrf_exempt
+def snippetbeacon(request):
+    '''
+    Log a snippet explanation that a client fetched with a GET request, which may have
+    been answered by a cache without reaching us.  The client posts the same arguments
+    it would have posted to the 'explain' view, and gets back the IDs of the logged
+    query and region to report views of the explanation with.
+    '''
+    text = request.POST.get('text')
+    if text is None:
+        return HttpResponseBadRequest("A snippet beacon needs text")
+
+    db_logger = DbLogger()
+    query_record = db_logger.log_query(request)
+    region = Region(HtmlDocument(text), 0, len(text) - 1, text)
+    region_record = db_logger.log_region(request, query_record, region)
+    db_logger.update_server_end_time(query_record)
+
+    return HttpResponse(json.dumps({
+        "region_id": region_record.id,
+        "query_id": query_record.id,
+    }, indent=2))
+
+
+def snippetbatch(explain_views):
+    '''
+    Make a view that explains many snippets in one request, for clients that fetch
+    explanations ahead of time.  `explain_views` maps the name of each tutoron the view
+    explains snippets for to its 'explain' view (made with `snippetexplain`), or to
+    the view's dotted path to import it the first time it's needed.  The cache of each
+    'explain' view is shared with the batch.  The client posts `items`, a JSON list of objects
+    with the 'text' of each snippet, and optionally its 'edge_size' and the 'tutoron'
+    that should explain it (which can be left out if the view has only one tutoron).
+    Explanations are returned in the order of the items, and the batch is logged as
+    one query.
+    '''
+    def wrapper(request):
+
+        items = _load_batch_items(request.POST.get('items'), explain_views)
+        if items is None:
+            return HttpResponseBadRequest(
+                "Items must be a JSON list of at most %d snippets for tutorons: %s" %
+                (MAX_SNIPPET_BATCH_SIZE, ', '.join(sorted(explain_views))))
+        client_start_time = request.POST.get('client_start_time')
 
         db_logger = DbLogger()
         query_record = db_logger.log_query(request)
 
-        region = Region(HtmlDocument(text), 0, len(text) - 1, text)
-        explanation = explain_func(text, edge_size)
-        region_record = db_logger.log_region(request, query_record, region)
-        explained_region = _package_region(region, explanation, region_record.id, query_record.id)
+        explanations = []
+        for tutoron, text, edge_size in items:
+            explain_snippet = get_callable(explain_views[tutoron]).explain_snippet
+            explanations.append(explain_snippet(text, edge_size))
 
-        # Update the runtime of the scan
-        db_logger.update_server_end_time(query_record)
+        # Log all regions in one transaction, instead of committing each of them
+        explained_regions = []
+        with transaction.atomic():
+            for (tutoron, text, _), explanation in zip(items, explanations):
+                region = Region(make_text_document(text), 0, len(text) - 1, text)
+                region_record = db_logger.log_region(request, query_record, region)
+                explained_region = _package_region(
+                    region, explanation, region_record.id, query_record.id)
+                explained_region['tutoron'] = tutoron
+                explained_regions.append(explained_region)
+            db_logger.update_server_end_time(query_record)
 
-        return HttpResponse(json.dumps({
-            "region": explained_region,
+        return HttpResponse(_dumps({
+            "regions": explained_regions,
             "url": _get_resource_url(request, "/api/v1/client_query/"),
             "sq_id": query_record.id,
             "client_start_time": client_start_time,
             "error": 0
-        }, indent=2))
+        }))
 
-    return wrapper
+    return gzip_page(wrapper)
+
+
+def _load_batch_items(items_content, explain_views):
+    ''' Get the (tutoron, text, edge size) of each item in a batch, or None if it's invalid. '''
+    try:
+        items = json.loads(items_content)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(items, list) or len(items) > MAX_SNIPPET_BATCH_SIZE:
+        return None
+
+    default_tutoron = explain_views.keys()[0] if len(explain_views) == 1 else None
+    batch = []
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get('text'), basestring):
+            return None
+        tutoron = item.get('tutoron', default_tutoron)
+        edge_size = item.get('edge_size', 0)
+        if tutoron not in explain_views or not isinstance(edge_size, int):
+            return None
+        batch.append((tutoron, item['text'], edge_size))
+    return batch
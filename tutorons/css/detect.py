@@ -6,30 +6,33 @@ import logging
 from cssselect.parser import Element, SelectorSyntaxError
 import cssselect
 import re
+import string
 from bs4 import BeautifulSoup
 import tinycss
 
 from tutorons.common.extractor import JavascriptStringExtractor
 from tutorons.common.extractor import Region
 
-from tutorons.common.util import get_descendants
+from tutorons.common.util import get_descendants, LruCache
 from tutorons.css.tags import HTML_TAGS
 from tutorons.css.fileext import EXTENSIONS
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
-
-def filter_non_ascii(c):
-    if ord(c) > 127:
-        return ' '
-    return c
+# Most strings on a page are clearly not selectors, and the same strings recur across pages.
+# We remember verdicts for strings we've seen, and pre-screen new strings before parsing them.
+SELECTOR_VERDICT_CACHE_SIZE = 10000
+selector_verdicts = LruCache(SELECTOR_VERDICT_CACHE_SIZE)
+SELECTOR_START_CHARACTERS = frozenset(string.ascii_letters + string.digits + '_-#.[:*|\\')
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7f]')
+LEADING_WORD_PATTERN = re.compile(r'[ \t\r\n\f]*([A-Za-z0-9_-]+)(?=$|[ \t\r\n\f.#\[:,>+~])')
 
 
 class JavascriptSelectorExtractor(object):
 
-    def __init__(self):
-        self.js_string_extractor = JavascriptStringExtractor()
+    def __init__(self, artifacts=None):
+        self.js_string_extractor = JavascriptStringExtractor(artifacts)
 
     def extract(self, node):
         regions = self.js_string_extractor.extract(node)
@@ -40,43 +43,84 @@ class JavascriptSelectorExtractor(object):
 class StylesheetSelectorExtractor(object):
 
     def extract(self, node):
-        textfield = ''.join(map(filter_non_ascii, node.text))
-        textfield_as_list = textfield.split('\n')
+
+        textfield = filter_non_ascii_text(node.text)
         ss_offset = 0
 
         # sets textfield to the text in the style tag, if exists and adjusts the offset
-        if BeautifulSoup(textfield).style:
-            ss_offset = textfield.find("<style>") + len("<style>")
-            textfield = ''.join(map(filter_non_ascii, BeautifulSoup(textfield).style.text))
-            textfield_as_list = textfield.split('\n')
+        # We only parse the text as HTML if it could contain a style tag.
+        if '<style' in textfield.lower():
+            style = BeautifulSoup(textfield).style
+            if style:
+                ss_offset = textfield.find("<style>") + len("<style>")
+                textfield = filter_non_ascii_text(style.text)
 
         # parses textfield as a stylesheet
         parser = tinycss.make_parser()
         stylesheet = parser.parse_stylesheet(textfield)
+        line_starts = get_line_starts(textfield)
         valid_regions = []
 
-        # calculate the start index of the selector
         for rule in stylesheet.rules:
-            sel = rule.selector
-            ss_start = ss_offset
-            if sel.line > 1:
-                for l in xrange(sel.line - 1):
-                    # add 1 to account for newline characters
-                    ss_start += len(textfield_as_list[l]) + 1
-            ss_start += sel.column - 1
-            sel = rule.selector.as_css()
-            if rule.declarations:
+
+            # At-rules (e.g., '@media') don't have selectors
+            sel = getattr(rule, 'selector', None)
+            if sel is None or not rule.declarations:
+                continue
+
+            # calculate the start index of the selector
+            ss_start = ss_offset + line_starts[sel.line - 1] + sel.column - 1
+            sel = sel.as_css()
+
+            # check if the region found contains a valid selector
+            if is_selector(sel):
                 valid_regions.append(Region(node, ss_start, ss_start + len(sel) - 1, sel))
 
-        # check if the regions found contain valid selectors
-        for region in valid_regions:
-            if not is_selector(region.string):
-                valid_regions.remove(region)
         return valid_regions
 
 
+def filter_non_ascii_text(text):
+    return NON_ASCII_PATTERN.sub(' ', text)
+
+
+def get_line_starts(text):
+    ''' Get the character offset of the start of every line in the text. '''
+    line_starts = [0]
+    newline_index = text.find('\n')
+    while newline_index != -1:
+        line_starts.append(newline_index + 1)
+        newline_index = text.find('\n', newline_index + 1)
+    return line_starts
+
+
 def is_selector(string):
     ''' Check to see if string represents valid HTML selector. '''
+    verdict = selector_verdicts.get(string)
+    if verdict is None:
+        verdict = could_be_selector(string) and _parse_selector_and_check(string)
+        selector_verdicts.put(string, verdict)
+    return verdict
+
+
+def could_be_selector(string):
+    '''
+    A cheap test that rejects most strings that can't be selectors without parsing them.
+    This never rejects a string that `_parse_selector_and_check` would accept:
+    * A selector can only start with an element name, namespace, or one of '#.[:*'
+    * If it starts with an element name, that element name has to be a standard HTML tag
+    '''
+    stripped = string.lstrip(' \t\r\n\f')
+    if stripped == '':
+        return True
+    if ord(stripped[0]) < 128 and stripped[0] not in SELECTOR_START_CHARACTERS:
+        return False
+    leading_word_match = LEADING_WORD_PATTERN.match(string)
+    if leading_word_match and leading_word_match.group(1) not in HTML_TAGS:
+        return False
+    return True
+
+
+def _parse_selector_and_check(string):
     try:
         # cssselect doesn't like links, so we replace them.
         string = re.sub(r"(href.=)([^\]]*)\]", r"\1fakelink]", string)
@@ -4,8 +4,8 @@
 from __future__ import unicode_literals
 import logging
 from antlr4.error.ErrorListener import ErrorListener
-from bs4 import BeautifulSoup
 import re
+from lxml import etree
 from antlr4.tree.Tree import TerminalNodeImpl as TerminalNode
 # We use PyQuery here for constructing an HTML document as it replicates a lot
 # of the jQuery API.  I expect that most people who will maintain or change this
@@ -23,6 +23,26 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 # The following is the type of tag that all selected elements will have if their
 # tag hasn't been specified explicitly in the selector
 UNSPECIFIED_ELEMENT_TAG = 'div'
+SELECTION_START_TAG = "<span class='tutoron_selection'>"
+SELECTION_END_TAG = "</span>"
+# Tags that are rendered as a single self-closing tag when they have no contents
+EMPTY_ELEMENT_TAGS = frozenset(['br', 'hr', 'input', 'img', 'meta', 'spacer', 'link', 'frame', 'base'])
+# Tags with contents that are rendered inline, rather than one node per line
+PREFORMATTED_TAGS = frozenset(['pre'])
+# Attributes that hold a whitespace-separated list of values, by tag ('*' for all tags)
+LIST_ATTRIBUTES = {
+    '*': ['class', 'accesskey', 'dropzone'],
+    'a': ['rel', 'rev'],
+    'link': ['rel', 'rev'],
+    'td': ['headers'],
+    'th': ['headers'],
+    'form': ['accept-charset'],
+    'object': ['archive'],
+    'area': ['rel'],
+    'icon': ['sizes'],
+    'iframe': ['sandbox'],
+    'output': ['for'],
+}
 
 
 '''
@@ -425,6 +445,17 @@ def create_content_from_selectors_group(selectors_group_node):
 
 
 class HtmlRenderer(object):
+    '''
+    Renders generated HTML contents as escaped, indented text that can be shown
+    inside a code block.  The element tree is walked once, and each line of output
+    is emitted already escaped, instead of serializing the tree, parsing it again to
+    pretty-print it, and rewriting the pretty-printed text with regular expressions.
+
+    The layout follows the one we used to get from BeautifulSoup's `prettify`:
+    each tag, text node and comment goes on its own line, indented by one space
+    for each level of nesting, except for the contents of <pre> elements, which
+    are rendered inline.
+    '''
 
     def render_html_contents(self, contents, indent_level=2):
         '''
@@ -434,100 +465,196 @@ class HtmlRenderer(object):
         <span class='tutorons_selection'></span> span.
         The result is a pretty string.
         '''
-        # Join the contents into a single chunk of HTML
-        html = '\n'.join([P(element).outer_html() for element in contents])
-
-        # BeautifulSoup has a built-in prettifier that will get us most
-        # of the way to a presentable document
-        # We choose the 'html.parser' instead of the 'html5lib' parser because
-        # 1. We should be providing it valid HTML documents (no big need for leniency)
-        # 2. The documents are also small, so performance isn't that important right now.
-        # 3. 'html5lib' adds unwanted tags to make a document into valid HTML.
-        #    We're only interested in showing HTML fragments, not full documents.
-        soup_document = BeautifulSoup(html, 'html.parser')
-        prettified_text = soup_document.prettify()
-
-        # Apply a number of transformations to escape and indent the
-        # text to prepare it for presentation
-        stripped_text = prettified_text.strip()
-        escaped_text = self._escape(stripped_text)
-        marked_text = self._format_marked_content(escaped_text)
-        spans_unindented_text = self._unindent_spans(marked_text)
-        indented_text = self._indent(spans_unindented_text, indent_level)
-        return indented_text
-
-    def _indent(self, text, indent_level):
-
-        lines = text.split('\n')
-        for index, line in enumerate(lines):
-
-            # Detect the spaces at the start of each line, and the text that comes after it.
-            spaces, line_text = re.match('^( *)([^ ].*)', line).groups()
-
-            # Do nothing if this line only contains a span (I can't remember why, but
-            # it's probably because this is used for formatting only and won't be seen.
-            if re.match(r" *</?span", line):
-                line = line_text
-            # Otherwise, reset the number of spaces at the start of the line based
-            # on the number of spaces that were there before, multiplied by the indent level.
-            else:
-                new_spaces_count = len(spaces) * indent_level
-                escaped_spaces = new_spaces_count * '&nbsp;'
-                line = escaped_spaces + line_text + "<br>"
-
-            lines[index] = line
-
-        return '\n'.join(lines)
-
-    def _format_marked_content(self, text):
-        '''
-        Surround any marked content with a span that can be formatted on the page.
+        lines = []
+        for item in contents:
+            # Besides elements, contents can include snippets of HTML as strings (for
+            # example, the generated content of a '::before' pseudo-element) and selections.
+            element = item if isinstance(item, etree._Element) else P(item)[0]
+            self._render_node(element, 0, lines)
+        return self._indent(lines, indent_level)
+
+    def _render_node(self, node, depth, lines):
+
+        indentation = ' ' * depth
+
+        if node.tag is etree.Comment:
+            lines.extend((indentation + self._render_comment(node)).split('\n'))
+            return
+
+        # Marked content is shown as a span that can be formatted on the page.
+        if _get_tag_name(node) == 'mark':
+            lines.append(indentation + SELECTION_START_TAG)
+            self._render_children(node, depth + 1, lines)
+            lines.append(indentation + SELECTION_END_TAG)
+        # The contents of preformatted elements are kept together on one line.
+        elif _get_tag_name(node) in PREFORMATTED_TAGS:
+            lines.extend((indentation + self._render_inline(node)).split('\n'))
+        elif _is_empty_element(node):
+            lines.append(indentation + self._render_start_tag(node, empty=True))
+        else:
+            lines.append(indentation + self._render_start_tag(node))
+            self._render_children(node, depth + 1, lines)
+            lines.append(indentation + self._render_end_tag(node))
+
+    def _render_children(self, node, depth, lines):
+
+        indentation = ' ' * depth
+
+        def render_text(text):
+            # Whitespace around text is only there for formatting, so we strip it.
+            text = text.strip() if text is not None else None
+            if text:
+                lines.extend((indentation + _escape_text(text)).split('\n'))
+
+        render_text(node.text)
+        for child in node:
+            self._render_node(child, depth, lines)
+            render_text(child.tail)
+
+    def _render_inline(self, node):
+
+        if node.tag is etree.Comment:
+            return self._render_comment(node)
+
+        if _get_tag_name(node) == 'mark':
+            start_tag, end_tag = SELECTION_START_TAG, SELECTION_END_TAG
+        elif _is_empty_element(node):
+            return self._render_start_tag(node, empty=True)
+        else:
+            start_tag, end_tag = self._render_start_tag(node), self._render_end_tag(node)
+
+        parts = [start_tag]
+        if node.text:
+            parts.append(_escape_text(node.text))
+        for child in node:
+            parts.append(self._render_inline(child))
+            if child.tail:
+                parts.append(_escape_text(child.tail))
+        parts.append(end_tag)
+        return ''.join(parts)
+
+    def _render_start_tag(self, node, empty=False):
+
+        tag_name = _get_tag_name(node)
+
+        # Attribute names are shown in lowercase and in alphabetical order.
+        attributes = {}
+        for name, value in node.attrib.items():
+            attributes[name.lower()] = value
+        attributes.update(_get_namespace_declarations(node))
+
+        attribute_strings = []
+        for name, value in sorted(attributes.items()):
+            # Whitespace-separated lists of values (like 'class') are normalized
+            # to use a single space between each value.
+            if name in LIST_ATTRIBUTES.get('*', []) or name in LIST_ATTRIBUTES.get(tag_name, []):
+                value = re.sub(r'\s+', ' ', value)
+            attribute_strings.append(name + '=' + _quote_attribute_value(_escape_text(value)))
+
+        return '&lt;' + ' '.join([tag_name] + attribute_strings) + ('/' if empty else '') + '&gt;'
+
+    def _render_end_tag(self, node):
+        return '&lt;/' + _get_tag_name(node) + '&gt;'
+
+    def _render_comment(self, comment):
         '''
-        left_mark_replaced = re.sub(r"<mark>", "<span class='tutoron_selection'>", text)
-        marks_replaced = re.sub(r"</mark>", "</span>", left_mark_replaced)
-        return marks_replaced
-
-    def _escape(self, text):
-        '''
-        Escaped characters that have a special meaning in HTML to make sure
-        that they render as the right character from within a code block.
+        Comments are shown verbatim, except for the characters that have a special
+        meaning in HTML.  Marks in comments still become selection spans.
         '''
-        # When we escape ampersands, we avoid those that are already part of escaped chevrons.
-        ampersands_escaped = re.sub(r"&(?!(lt;|gt;))", "&amp;", text)
-        # When we escape the '<' and '>' characters, we make sure to avoid those that
-        # are attached to a 'mark' tag, as these need to be preserved to make sure that
-        # we can substitute them with a span with class "tutoron_selection"
-        left_bracket_escaped = re.sub(r"<(?!/?mark)", "&lt;", ampersands_escaped)
-        right_bracket_escaped = re.sub(r"(?<!mark)>", "&gt;", left_bracket_escaped)
-        all_escaped = right_bracket_escaped
-        return all_escaped
-
-    def _unindent_spans(self, text):
+        text = comment.text or ''
+        text = re.sub(r"&(?!(lt;|gt;))", "&amp;", text)
+        text = re.sub(r"<(?!/?mark)", "&lt;", text)
+        text = re.sub(r"(?<!mark)>", "&gt;", text)
+        text = text.replace('<mark>', SELECTION_START_TAG).replace('</mark>', SELECTION_END_TAG)
+        return '&lt;!--' + text + '--&gt;'
+
+    def _indent(self, lines, indent_level):
         '''
-        We want to make sure that after we have inserted our new spans for
-        marked content that we remove any indentations that came from them
-        being seen as elements to begin with.  This routine removes that indentation.
-        It also (I think) assumes that the only spans in the HTML tree are ones
-        that we have added to mark chosen content.
+        Convert the indentation of each line into non-breaking spaces, `indent_level`
+        for every space of indentation, and end every line with a line break.
+
+        Lines that only open or close a selection span are used for formatting only
+        and won't be seen, so they aren't given a line break.  They also shouldn't
+        add indentation to the lines they contain, so we remove one space of
+        indentation from every line for each span it is nested in.
         '''
         span_level = 0
-        lines = text.split('\n')
+        indented_lines = []
+
+        for line in lines:
 
-        for index, line in enumerate(lines):
+            line_text = line.lstrip(' ')
+            is_span_end = line_text.startswith('</span')
+            is_span_start = line_text.startswith('<span')
 
-            # Watch for the end of a span
-            if re.match(" *</span", line):
+            if not line_text:
+                raise ValueError("Rendered HTML contains an empty line")
+
+            if is_span_end:
                 span_level -= 1
+            spaces_count = len(line) - len(line_text)
+            if span_level > 0 and spaces_count >= span_level:
+                spaces_count -= span_level
 
-            # Remove one space for every level of span
-            new_line = re.sub('^' + ' ' * span_level, '', line)
-            lines[index] = new_line
+            if is_span_start or is_span_end:
+                indented_lines.append(line_text)
+            else:
+                indented_lines.append(
+                    '&nbsp;' * (spaces_count * indent_level) + line_text + '<br>')
 
-            # Watch for the start of a span
-            if re.match(" *<span", line):
+            if is_span_start:
                 span_level += 1
 
-        return '\n'.join(lines)
+        return '\n'.join(indented_lines)
+
+
+def _get_tag_name(element):
+    ''' Tag names are shown in lowercase, with the namespace prefix if there is one. '''
+    tag_name = etree.QName(element).localname
+    if element.prefix is not None:
+        tag_name = element.prefix + ':' + tag_name
+    return tag_name.lower()
+
+
+def _get_namespace_declarations(element):
+    '''
+    Get the 'xmlns' attributes needed to declare the namespaces that an element uses.
+    Namespaces that have already been declared by the element's parent are skipped.
+    '''
+    parent = element.getparent()
+    parent_namespaces = parent.nsmap if parent is not None else {}
+    declarations = {}
+    for prefix, url in element.nsmap.items():
+        if parent_namespaces.get(prefix) != url:
+            name = 'xmlns:' + prefix if prefix is not None else 'xmlns'
+            declarations[name.lower()] = url
+    return declarations
+
+
+def _is_empty_element(element):
+    return (
+        _get_tag_name(element) in EMPTY_ELEMENT_TAGS and
+        not element.text and
+        len(element) == 0
+    )
+
+
+def _escape_text(text):
+    '''
+    Escape characters that have a special meaning in HTML to make sure that they
+    render as the right character from within a code block.  Ampersands are
+    escaped twice, as they were by the prettifier we used to use.
+    '''
+    return text.replace('&', '&amp;amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _quote_attribute_value(value):
+    ''' Quote with double quotes, unless the value includes double quotes and no single quotes. '''
+    if '"' in value:
+        if "'" in value:
+            return '"' + value.replace('"', '&amp;quot;') + '"'
+        return "'" + value + "'"
+    return '"' + value + '"'
 
 
 class CssExampleGenerator(CssListener, ErrorListener):
@@ -7,8 +7,7 @@ import re
 from antlr4.error.ErrorListener import ErrorListener
 from antlr4.tree.Tree import TerminalNodeImpl as TerminalNode
 
-from tutorons.common.java.gateway import java_isinstance
-from tutorons.common.java.simplenlg import factory as nlg_factory,\
+from tutorons.common.nlg import factory as nlg_factory,\
     Feature, NumberAgreement, NPPhraseSpec, realiser
 from parsers.css.CssLexer import CssLexer
 from parsers.css.CssParser import CssParser
@@ -28,7 +27,7 @@ def explain(selector):
         for selector, clause in explainer.result.items():
             explanations[selector] =\
                 "The '" + selector + "'selector chooses " +\
-                str(realiser.realise(clause)) + "."
+                realiser.realise(clause) + "."
         return explanations
     except Exception as exception:
         # Although this is a pretty broad catch, we want the default
@@ -375,7 +374,7 @@ def explain_simple_selector_sequence(simple_selector_sequence_node, focus=True):
             modifier = explain_pseudo(selector)
             # If this is a noun, then we have found a pseudo-element, which
             # needs to be described as the subject, not a modifier.
-            if java_isinstance(modifier, NPPhraseSpec):
+            if isinstance(modifier, NPPhraseSpec):
                 pseudoelement_phrase = modifier
                 modifier = None
         elif isinstance(selector, CssParser.AttributeContext):
@@ -9,7 +9,7 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 # File extensions found on FileInfo: http://fileinfo.com/filetypes/common
-EXTENSIONS = [
+EXTENSIONS = frozenset([
     '3DM',
     '3DS',
     '3G2',
@@ -192,4 +192,4 @@ EXTENSIONS = [
     'YUV',
     'ZIP',
     'ZIPX',
-]
+])
@@ -9,7 +9,7 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 ''' We include None in this list because patterns that match all tags
     (e.g. ".klazz") yield an Element with property 'element' == None. '''
-HTML_TAGS = ['a', 'abbr', 'address', 'area', 'article', 'aside', 
+HTML_TAGS = frozenset(['a', 'abbr', 'address', 'area', 'article', 'aside', 
     'audio', 'b', 'base', 'bb', 'bdo', 'blockquote', 'body', 
     'br', 'button', 'canvas', 'caption', 'cite', 'code', 'col', 
     'colgroup', 'command', 'datagrid', 'datalist', 'dd', 'del', 
@@ -23,4 +23,4 @@ HTML_TAGS = ['a', 'abbr', 'address', 'area', 'article', 'aside',
     'small', 'source', 'span', 'strong', 'style', 'sub', 'sup', 
     'table', 'tbody', 'td', 'textarea', 'tfoot', 'th', 'thead', 
     'time', 'title', 'tr', 'ul', 'var', 'video', None,
-]
+])
@@ -5,4 +5,8 @@ urlpatterns = patterns(
     '',
     url(r'^scan$', 'tutorons.css.views.scan', name='css_scan'),
     url(r'^explain$', 'tutorons.css.views.explain', name='css_explain'),
+    url(r'^explain_batch$', 'tutorons.css.views.explain_batch', name='css_explain_batch'),
+    url(r'^explanation$', 'tutorons.css.views.explanation', name='css_explanation'),
+    url(r'^explain_beacon$', 'tutorons.common.views.snippetbeacon',
+        name='css_explain_beacon'),
 )
@@ -4,17 +4,17 @@
 from __future__ import unicode_literals
 import logging
 from django.views.decorators.csrf import csrf_exempt
-from django.template.loader import get_template
-from django.template import Context
 
 from tutorons.common.scanner import NodeScanner
+from tutorons.common.artifacts import ArtifactStore
 from tutorons.css.detect import find_jquery_selector, JavascriptSelectorExtractor,\
     StylesheetSelectorExtractor, is_selector
 from tutorons.css.explain import explain as css_explain
 from tutorons.css.render import render as css_render
 from tutorons.css.examples import generate_examples
 from tutorons.common.dblogger import DbLogger
-from tutorons.common.views import pagescan, snippetexplain
+from tutorons.common.views import pagescan, snippetexplain, snippetbatch, regionexplain,\
+    render_error
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -22,32 +22,36 @@ region_logger = logging.getLogger('region')
 db_logger = DbLogger()
 
 
+def explain_region(selector):
+    if not is_selector(selector):
+        return None
+    explanations = css_explain(selector)
+    examples = generate_examples(selector)
+    return css_render(explanations, examples)
+
+
 @csrf_exempt
-@pagescan
+@pagescan(explain_region, is_selector)
 def scan(html_doc):
 
-    js_extractor = JavascriptSelectorExtractor()
+    artifacts = ArtifactStore()
+    js_extractor = JavascriptSelectorExtractor(artifacts)
     stylesheet_extractor = StylesheetSelectorExtractor()
 
-    js_scanner = NodeScanner(js_extractor, ['code', 'pre'])
-    stylesheet_scanner = NodeScanner(stylesheet_extractor, ['code', 'pre', 'div'])
+    js_scanner = NodeScanner(js_extractor, ['code', 'pre'], artifacts)
+    stylesheet_scanner = NodeScanner(stylesheet_extractor, ['code', 'pre', 'div'], artifacts)
     regions = js_scanner.scan(html_doc) + stylesheet_scanner.scan(html_doc)
-    rendered_regions = []
     for r in regions:
-        explanations = css_explain(r.string)
-        examples = generate_examples(r.string)
-        document = css_render(explanations, examples)
-        rendered_regions.append((r, document))
+        yield r, r.string
+
 
-    return rendered_regions
+explanation = regionexplain(explain_region)
 
 
 @csrf_exempt
 @snippetexplain
 def explain(text, edge_size):
 
-    error_template = get_template('error.html')
-
     if edge_size > 0:
         text = find_jquery_selector(text, edge_size)
 
@@ -56,6 +60,9 @@ def explain(text, edge_size):
         examples = generate_examples(text)
         explanation = css_render(explanations, examples)
     else:
-        explanation = error_template.render(Context({'text': text, 'type': 'CSS selector'}))
+        explanation = render_error(text, 'CSS selector')
 
     return explanation
+
+
+explain_batch = csrf_exempt(snippetbatch({'css': explain}))
@@ -3,36 +3,136 @@
 
 from __future__ import unicode_literals
 import logging
-import ast
+import re
+import keyword
+import tokenize
+from StringIO import StringIO
 
 from tutorons.common.extractor import Region
 from tutorons.python.builtins import explanations
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
+PRINT_FUNCTION_PATTERN = re.compile(r'^\s*from\s+__future__\s+import\s+.*\bprint_function\b', re.MULTILINE)
+# A line of an interactive session, starting with a '>>>' or '...' prompt
+PROMPT_PATTERN = re.compile(r'^[ \t]*(>>>|\.\.\.)( |$)')
+# An interactive session starts with a '>>>' prompt
+TRANSCRIPT_PATTERN = re.compile(r'^\s*>>>( |$)')
+BRACKET_PAIRS = {')': '(', ']': '[', '}': '{'}
+# The builtin names and the pattern for calls to them, read from the documentation
+# store the first time they are needed rather than when this module is imported
+_builtins = None
 
-def find_offset(text, call):
-    """Takes in a text and function call and finds the start of call within text"""
-    text_list = text.split('\n')
-    offset = 0
-    for l in range(call.lineno - 1):
-        # add 1 to account for newline characters
-        offset += len(text_list[l]) + 1
-    offset += call.col_offset
-    return offset
 
+def _get_builtins():
+    '''
+    Get the names of builtins that can be called, and a quick check for a builtin name
+    followed by a parenthesis, so we can skip tokenizing blocks of text that can't contain
+    a call to a builtin.  Keywords (like 'print' in Python 2) are statements, even if they
+    are followed by parentheses, unless they are made into functions with a '__future__' import.
+    '''
+    global _builtins
+    if _builtins is None:
+        names = frozenset(name for name in explanations.keys() if not keyword.iskeyword(name))
+        call_pattern = re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in explanations.keys()) + r')\s*\(')
+        _builtins = (names, call_pattern)
+    return _builtins
 
-class BuiltInFinder(ast.NodeVisitor):
 
-    def __init__(self, builtin_names):
-        self.calls = []
-        self.builtin_names = builtin_names
+def _get_code_lines(text):
+    '''
+    Split text into the lines of code to tokenize.  For each line, we also return
+    the offset of the line in the text, and how many characters were removed from
+    the start of the line.  Indentation is removed so that blocks with inconsistent
+    indentation can still be tokenized.  If the text is a transcript of an interactive
+    session (it starts with a prompt), prompts are removed, and lines of output are replaced with blank lines.
+    '''
+    is_transcript = TRANSCRIPT_PATTERN.match(text) is not None
+    line_offset = 0
+    code_lines = []
 
-    def generic_visit(self, node):
-        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
-            if node.func.id in self.builtin_names:
-                self.calls.append(node)
-        super(BuiltInFinder, self).generic_visit(node)
+    for line in text.split('\n'):
+
+        code = line.rstrip('\r')
+        removed_length = 0
+        if is_transcript:
+            prompt_match = PROMPT_PATTERN.match(code)
+            if prompt_match is not None:
+                removed_length = prompt_match.end()
+                code = code[removed_length:]
+            else:
+                code = ''
+
+        stripped_code = code.lstrip(' \t\f')
+        removed_length += len(code) - len(stripped_code)
+        code_lines.append((stripped_code, line_offset, removed_length))
+
+        # Add 1 to account for newline characters
+        line_offset += len(line) + 1
+
+    return code_lines
+
+
+def find_builtin_calls(text, builtin_names=None):
+    '''
+    Find calls to builtins in a block of Python code in one pass over its tokens.
+    A call is a builtin name followed by a parenthesized list of arguments, where
+    the name isn't an attribute ('x.len(...)') or the name of a definition
+    ('def len(...)').  Unlike parsing the text, this tolerates blocks that aren't
+    valid Python, like snippets that include prompts and output from an interactive
+    session.  Calls that are never closed are skipped.
+    Returns a list of tuples of the builtin name and its offset in the text.
+    '''
+    default_builtin_names, builtin_call_pattern = _get_builtins()
+    if builtin_names is None:
+        builtin_names = default_builtin_names
+
+    if builtin_call_pattern.search(text) is None:
+        return []
+
+    if PRINT_FUNCTION_PATTERN.search(text) is not None:
+        builtin_names = builtin_names | frozenset(['print'])
+
+    code_lines = _get_code_lines(text)
+    readline = StringIO('\n'.join(line for line, _, _ in code_lines) + '\n').readline
+
+    calls = []
+    open_brackets = []  # pairs of an opening bracket and the call it starts, if any
+    previous_token = None
+    candidate = None
+
+    try:
+        for token_type, token, (row, column), _, _ in tokenize.generate_tokens(readline):
+
+            if token_type in (tokenize.NL, tokenize.COMMENT):
+                continue
+
+            if token_type == tokenize.OP and token in ('(', '[', '{'):
+                open_brackets.append((token, candidate if token == '(' else None))
+            elif token_type == tokenize.OP and token in BRACKET_PAIRS:
+                if open_brackets and open_brackets[-1][0] == BRACKET_PAIRS[token]:
+                    _, call = open_brackets.pop()
+                    if call is not None:
+                        calls.append(call)
+                else:
+                    # Brackets don't match, so we can't trust any of the open calls.
+                    open_brackets = []
+
+            candidate = None
+            if (token_type == tokenize.NAME and token in builtin_names and
+                    previous_token not in ('.', 'def', 'class')):
+                _, line_offset, removed_length = code_lines[row - 1]
+                candidate = (token, line_offset + removed_length + column)
+
+            previous_token = token
+
+    except tokenize.TokenError:
+        # The text ended in the middle of a statement or a string.
+        # The calls found until then are still valid.
+        pass
+
+    return sorted(calls, key=lambda call: call[1])
 
 
 class PythonBuiltInExtractor(object):
@@ -40,19 +140,6 @@ class PythonBuiltInExtractor(object):
     def extract(self, node):
         text = node.text.encode('ascii', 'ignore')
         valid_regions = []
-
-        # Parse text into an ast tree and add all call nodes in the tree to calls
-        try:
-            ast_tree = ast.parse(text)
-            finder = BuiltInFinder(explanations.keys())
-            finder.visit(ast_tree)
-            calls = finder.calls
-        except:
-            calls = []
-
-        # Package ast nodes as region objects
-        for call in calls:
-            built_in = call.func.id
-            start = find_offset(text, call)
+        for built_in, start in find_builtin_calls(text):
             valid_regions.append(Region(node, start, start + len(built_in) - 1, built_in))
         return valid_regions
@@ -0,0 +1,167 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import os
+import io
+import json
+import mmap
+import struct
+import tempfile
+import threading
+import errno
+import argparse
+import collections
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+'''
+A read-only store of documentation, where each name maps to a tuple of text fields, like
+the header, body, and URL of its documentation.
+
+The documentation lives in one file, which is memory-mapped rather than read into
+Python strings.  Only an index of names to offsets into the file is kept in memory.
+Pages of the file are loaded by the operating system as they are read, and they are
+shared by all processes that map the file, so forked workers don't each hold their own
+copy of the documentation, and memory use stays flat as the documentation grows.
+
+The store is built ahead of time, from a dictionary or a JSON file that maps each name to
+a list of its fields.  The layout of the built file is:
+* the magic string `MAGIC`
+* the length of the index, as a 4-byte unsigned big-endian integer
+* the index: a UTF-8 JSON object mapping each name to the offset of its entry and
+  the lengths of each of its fields
+* the entries: the UTF-8 fields for each name, one after another
+'''
+
+MAGIC = b'TUTDOCS1'
+INDEX_LENGTH_FORMAT = str('>I')
+
+
+def build_doc_store(source_path, store_path):
+    ''' Build a documentation store from a JSON file of documentation. '''
+
+    with io.open(source_path, encoding='utf-8') as source_file:
+        documentation = json.load(source_file)
+    write_doc_store(documentation, store_path)
+
+
+def write_doc_store(documentation, store_path):
+    ''' Write a documentation store for a dictionary from names to lists of text fields. '''
+
+    index = {}
+    entries = []
+    offset = 0
+    for name in sorted(documentation.keys()):
+        fields = [field.encode('utf-8') for field in documentation[name]]
+        index[name] = [offset] + [len(field) for field in fields]
+        entries.extend(fields)
+        offset += sum(len(field) for field in fields)
+
+    index_bytes = json.dumps(index, sort_keys=True).encode('utf-8')
+
+    # Write the store to a temporary file and move it into place, so that processes
+    # that are reading the store at the same time never see a partially written file.
+    store_dir = os.path.dirname(os.path.abspath(store_path))
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=store_dir)
+    with os.fdopen(file_descriptor, 'wb') as store_file:
+        store_file.write(MAGIC)
+        store_file.write(struct.pack(INDEX_LENGTH_FORMAT, len(index_bytes)))
+        store_file.write(index_bytes)
+        for entry in entries:
+            store_file.write(entry)
+    os.chmod(temporary_path, 0o644)
+    os.rename(temporary_path, store_path)
+
+
+class DocStore(collections.Mapping):
+    '''
+    Documentation in a memory-mapped store, which can be read like a dictionary from
+    names to tuples of their fields.
+
+    The store is opened the first time it is read.  It should be built before the server
+    is started.  If `build_func` is given, it is called to build the store when the store
+    is first read and it is missing or older than any of `source_paths`, so that a store
+    that wasn't built, or a source that was edited, can't leave us without documentation
+    or with stale documentation.  Otherwise, reading a store that hasn't been built is an error.
+    '''
+
+    def __init__(self, store_path, source_paths=(), build_func=None):
+        self.store_path = store_path
+        self.source_paths = source_paths
+        self.build_func = build_func
+        self.lock = threading.Lock()
+        self._index = None
+        self._data = None
+        self._data_start = None
+
+    def __getitem__(self, name):
+        index = self._get_index()
+        entry = index[name]
+        start = self._data_start + entry[0]
+        fields = []
+        for length in entry[1:]:
+            fields.append(self._data[start:start + length].decode('utf-8'))
+            start += length
+        return tuple(fields)
+
+    def __contains__(self, name):
+        return name in self._get_index()
+
+    def __iter__(self):
+        return iter(self._get_index())
+
+    def __len__(self):
+        return len(self._get_index())
+
+    def _get_index(self):
+        if self._index is None:
+            with self.lock:
+                if self._index is None:
+                    self._open()
+        return self._index
+
+    def _is_stale(self):
+        if not os.path.exists(self.store_path):
+            return True
+        store_time = os.path.getmtime(self.store_path)
+        return any(os.path.getmtime(path) > store_time for path in self.source_paths)
+
+    def _open(self):
+
+        if self.build_func is not None and self._is_stale():
+            logging.warning(
+                "Documentation store %s is missing or older than its sources.  Building it now; "
+                "build it ahead of time to avoid the delay.", self.store_path)
+            self.build_func()
+
+        try:
+            store_file = open(self.store_path, 'rb')
+        except IOError as e:
+            if e.errno == errno.ENOENT:
+                raise IOError(e.errno, "Documentation store %s hasn't been built" % self.store_path)
+            raise
+        with store_file:
+            data = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("%s is not a documentation store" % self.store_path)
+
+        index_start = len(MAGIC) + struct.calcsize(INDEX_LENGTH_FORMAT)
+        index_length, = struct.unpack(INDEX_LENGTH_FORMAT, data[len(MAGIC):index_start])
+        index = json.loads(data[index_start:index_start + index_length].decode('utf-8'))
+
+        self._data = data
+        self._data_start = index_start + index_length
+        self._index = dict((name, tuple(entry)) for name, entry in index.items())
+
+
+if __name__ == '__main__':
+    argument_parser = argparse.ArgumentParser(
+        description="Build a memory-mapped documentation store from a JSON file")
+    argument_parser.add_argument('source', help="JSON file mapping names to lists of fields")
+    argument_parser.add_argument('store', help="Path of the store to build")
+    args = argument_parser.parse_args()
+    build_doc_store(args.source, args.store)
@@ -15,3 +15,14 @@ def render(builtin, header, explanation, url):
     context = {'builtin': builtin, 'hdr': header, 'exp': explanation, 'url': url}
     exp_html = python_template.render(Context(context))
     return exp_html
+
+
+def prerender_explanations(explanations):
+    '''
+    The explanation of a builtin only depends on its name.  So we render the
+    explanations of all builtins once, and can look them up when scanning pages.
+    '''
+    rendered_explanations = {}
+    for builtin, (header, explanation, url) in explanations.items():
+        rendered_explanations[builtin] = render(builtin, header, explanation, url)
+    return rendered_explanations
@@ -5,4 +5,8 @@ urlpatterns = patterns(
     '',
     url(r'^scan$', 'tutorons.python.views.scan', name='python_scan'),
     url(r'^explain$', 'tutorons.python.views.explain', name='python_explain'),
+    url(r'^explain_batch$', 'tutorons.python.views.explain_batch', name='python_explain_batch'),
+    url(r'^explanation$', 'tutorons.python.views.explanation', name='python_explanation'),
+    url(r'^explain_beacon$', 'tutorons.common.views.snippetbeacon',
+        name='python_explain_beacon'),
 )
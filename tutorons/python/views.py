@@ -4,16 +4,13 @@
 from __future__ import unicode_literals
 import logging
 from django.views.decorators.csrf import csrf_exempt
-from django.template.loader import get_template
-from django.template import Context
 
 from tutorons.common.scanner import NodeScanner
 from tutorons.python.detect import PythonBuiltInExtractor
-from tutorons.python.explain import explain as python_explain
-from tutorons.python.render import render as python_render
-from tutorons.python.builtins import explanations
+from tutorons.python.builtins import explanations, rendered_explanations
 from tutorons.common.dblogger import DbLogger
-from tutorons.common.views import pagescan, snippetexplain
+from tutorons.common.views import pagescan, snippetexplain, snippetbatch, regionexplain,\
+    render_error
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -21,33 +18,50 @@ region_logger = logging.getLogger('region')
 db_logger = DbLogger()
 
 
+def render_explanation(builtin):
+    '''
+    The explanation of a builtin only depends on its name, so explanations are rendered
+    when the stores of builtins are built, and looked up here.  Workers share the pages
+    of the memory-mapped store instead of each holding a rendered copy.
+    '''
+    document, = rendered_explanations[builtin]
+    return document
+
+
+def can_explain_region(builtin):
+    return builtin in explanations
+
+
+def explain_region(builtin):
+    return render_explanation(builtin) if can_explain_region(builtin) else None
+
+
 @csrf_exempt
-@pagescan
+@pagescan(explain_region, can_explain_region)
 def scan(html_doc):
     builtin_extractor = PythonBuiltInExtractor()
     builtin_scanner = NodeScanner(builtin_extractor, ['code', 'pre'])
     regions = builtin_scanner.scan(html_doc)
-    rendered_regions = []
     for r in regions:
         # log_region(r, origin)
-        hdr, exp, url = python_explain(r.string)
-        document = python_render(r.string, hdr, exp, url)
-        rendered_regions.append((r, document))
+        yield r, r.string
     # db_logger.update_server_end_time(qid)
-    return rendered_regions
+
+
+explanation = regionexplain(explain_region)
 
 
 @csrf_exempt
 @snippetexplain
 def explain(text, edge_size):
 
-    error_template = get_template('error.html')
-
     if text in explanations:
-        hdr, exp, url = python_explain(text)
-        explanation = python_render(text, hdr, exp, url)
+        explanation = render_explanation(text)
     else:
         logging.error("Error processing python built-in %s", text)
-        explanation = error_template.render(Context({'text': text, 'type': 'python built-in'}))
+        explanation = render_error(text, 'python built-in')
 
     return explanation
+
+
+explain_batch = csrf_exempt(snippetbatch({'python': explain}))
@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+# encoding: utf-8
+
+from __future__ import unicode_literals
+import logging
+import string
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class CharacterClass(object):
+    '''
+    A set of characters that a node of a regular expression can match, stored as a
+    bitset where bit `i` is set if the character with code point `i` is in the set.
+    Unions, intersections and differences of classes are single operations on integers,
+    no matter how many characters are in each class.  The characters themselves are
+    only listed when an example needs to pick one of them, and the list is kept.
+    Classes should not be changed once they are made.
+    '''
+    __slots__ = ('bits', '_chars')
+
+    def __init__(self, bits=0):
+        self.bits = bits
+        self._chars = None
+
+    @classmethod
+    def from_chars(cls, chars):
+        bits = 0
+        for c in chars:
+            bits |= 1 << ord(c)
+        return cls(bits)
+
+    @classmethod
+    def from_range(cls, lo, hi):
+        ''' Make a class of all characters with code points from `lo` to `hi`, inclusive. '''
+        if hi < lo:
+            return cls()
+        return cls(((1 << (hi - lo + 1)) - 1) << lo)
+
+    @property
+    def chars(self):
+        ''' The characters in this class, ordered by code point. '''
+        if self._chars is None:
+            digits = bin(self.bits)[:1:-1]
+            self._chars = ''.join([unichr(i) for i, d in enumerate(digits) if d == '1'])
+        return self._chars
+
+    def lower(self):
+        ''' Get a class with the ASCII upper-case letters of this class made lower-case. '''
+        upper = self.bits & UPPERCASE.bits
+        return CharacterClass((self.bits & ~upper) | (upper << (ord('a') - ord('A'))))
+
+    def __or__(self, other):
+        return CharacterClass(self.bits | other.bits)
+
+    def __and__(self, other):
+        return CharacterClass(self.bits & other.bits)
+
+    def __sub__(self, other):
+        return CharacterClass(self.bits & ~other.bits)
+
+    def __contains__(self, char):
+        return bool((self.bits >> ord(char)) & 1)
+
+    def __len__(self):
+        return bin(self.bits).count('1')
+
+    def __nonzero__(self):
+        return self.bits != 0
+
+    def __eq__(self, other):
+        return isinstance(other, CharacterClass) and self.bits == other.bits
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __repr__(self):
+        return "CharacterClass(%r)" % self.chars
+
+
+EMPTY = CharacterClass()
+PRINTABLE = CharacterClass.from_chars(string.printable)
+LETTERS = CharacterClass.from_chars(string.ascii_letters)
+UPPERCASE = CharacterClass.from_chars(string.ascii_uppercase)
+DIGITS = CharacterClass.from_chars(string.digits)
+WHITESPACE = CharacterClass.from_chars(string.whitespace)
+NEWLINES = CharacterClass.from_chars(['\n', '\r', '\x0b', '\x0c'])
@@ -3,13 +3,18 @@
 
 from __future__ import unicode_literals
 import argparse
+import hashlib
 import logging
 import random
-import string
+import threading
+from collections import Counter
 from django.conf import settings
 import sre_constants
 
 import tutorons.regex.parse as regex_parse
+from tutorons.common.util import LruCache
+from tutorons.regex.charclass import CharacterClass, EMPTY, PRINTABLE, LETTERS, DIGITS,\
+    WHITESPACE, NEWLINES
 from tutorons.regex.nodes import InNode, RepeatNode, LiteralNode, BranchNode,\
     RangeNode, CategoryNode, AnyNode
 
@@ -18,22 +23,53 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 RANDOM_WORD_LEN = 5
 SYMBOLS_ADDED = 2
 
+'''
+Patterns like 'a{5000}' or '(x{100}){100}' ask for examples that are too long to read
+and that take a long time to make.  Examples are cut off once they are this long, or
+once this many nodes have been visited to make them, and end with the marker.
+'''
+MAX_EXAMPLE_LENGTH = 100
+MAX_EXAMPLE_STEPS = 10000
+TRUNCATION_MARKER = '\u2026'
 
-def get_examples(regex, count=1, dictionary=None):
+'''
+Pattern trees are immutable, so the tree parsed for a pattern is kept and shared by
+every later request that generates examples for the same pattern.
+'''
+PATTERN_TREE_CACHE_SIZE = 1000
+pattern_trees = LruCache(PATTERN_TREE_CACHE_SIZE)
+
+
+def get_pattern_tree(regex):
+    ''' Get the parse tree for a regular expression, parsing it only if it isn't cached. '''
+    tree = pattern_trees.get(regex)
+    if tree is None:
+        tree = regex_parse.parse_regex(regex)
+        pattern_trees.put(regex, tree)
+    return tree
+
+
+def get_pattern_seed(regex):
+    ''' Get a seed for generating examples that is always the same for a pattern. '''
+    return int(hashlib.sha1(regex.encode('utf-8')).hexdigest()[:16], 16)
+
+
+def get_examples(regex, count=1, dictionary=None, seed=None):
     '''
     Generate representative, readable examples of string that matches a regular expression.
     If dictionary is set to None, use the default dictionary.
+    Examples are chosen with a random number generator seeded with `seed`, or with a
+    seed made from the pattern if no seed is given, so the same pattern always gets
+    the same examples.
     '''
-    tree = regex_parse.parse_regex(regex)
+    tree = get_pattern_tree(regex)
     dictionary = get_default_dict() if dictionary is None else dictionary
-    example_visitor = ExampleVisitor(dictionary)
+    rand = random.Random(get_pattern_seed(regex) if seed is None else seed)
+    example_visitor = ExampleVisitor(dictionary, rand=rand)
 
     examples = []
-    state_permutations = tree.get_state_permutations()
-    random.shuffle(state_permutations)
-    for perm in state_permutations[:count]:
-        tree.set_state(perm)
-        example = example_visitor.visit(tree)
+    for state in tree.sample_state_permutations(count, rand):
+        example = example_visitor.visit(tree, state)
         examples.append(example)
 
     return examples
@@ -43,151 +79,265 @@ class ExampleVisitor(object):
     '''
     Visitor for parsed regular expression that generates a representative, readable example of a
     string that matches the regular expression.
+    A state from `PatternTree.get_state_permutations` can be passed in to fix which
+    branches are chosen and how many times subpatterns are repeated.  Without one,
+    the visitor chooses for itself.
+    Each example is made within an `ExampleBudget` of `max_length` characters and
+    `max_steps` node visits.  Examples that run over the budget are truncated.
+    Random choices are made with `rand`, a `random.Random`, or with the `random`
+    module if it isn't given.
     '''
-    def __init__(self, dictionary, messy_words=True):
-        self.word_builder = WordBuilder(dictionary)
+    def __init__(self, dictionary, messy_words=True,
+                 max_length=MAX_EXAMPLE_LENGTH, max_steps=MAX_EXAMPLE_STEPS, rand=None):
+        self.rand = rand if rand is not None else random
+        self.word_builder = WordBuilder(dictionary, self.rand)
         self.messy_words = messy_words
-
-    def visit(self, tree):
-        return self.visit_node(tree.root)
-
-    def visit_node(self, node):
+        self.max_length = max_length
+        self.max_steps = max_steps
+        self.budget = ExampleBudget(max_length, max_steps)
+
+    def visit(self, tree, state=None):
+        self.budget = ExampleBudget(self.max_length, self.max_steps)
+        example = self.visit_node(tree.root, state)
+        budget_stats.record(self.budget)
+        if self.budget.exceeded:
+            example += TRUNCATION_MARKER
+        return example
+
+    def visit_node(self, node, state=None):
+        if not self.budget.visit():
+            return ''
         if isinstance(node, RepeatNode):
-            return self.visit_repeat(node)
+            return self.visit_repeat(node, state)
         elif isinstance(node, InNode):
             return self.visit_in(node)
         elif isinstance(node, LiteralNode):
             return self.visit_literal(node)
         elif isinstance(node, BranchNode):
-            return self.visit_branch(node)
+            return self.visit_branch(node, state)
         elif isinstance(node, AnyNode):
             return self.visit_any(node)
         else:
-            return ''.join([self.visit_node(ch) for ch in node.children])
+            return ''.join([self.visit_node(ch, state) for ch in node.children])
+
+    def _get_state_value(self, node, state):
+        if state is None or node.id is None:
+            return None
+        return state[node.id]
 
-    def visit_repeat(self, node):
+    def visit_repeat(self, node, state=None):
         # As far as I can tell, a repeat node only ever has exactly 1 child
         child = node.children[0]
-        reps = node.repetitions
+        reps = self._get_state_value(node, state)
         if (isinstance(child, InNode) or
                 isinstance(child, AnyNode) or
                 isinstance(child, CategoryNode) and child.classname == 'word'):
             messy = self.messy_words if isinstance(child, InNode) else False
-            chars = get_valid_characters(child)
+            charclass = get_character_class(child)
             if reps is None and node.max_repeat != sre_constants.MAXREPEAT:
                 reps = node.min_repeat
-            return self.word_builder.build_word(chars, messy=messy, length=reps)
+            if reps:
+                reps = self.budget.clamp_length(reps)
+                if reps == 0:
+                    return ''
+            return self.budget.take(
+                self.word_builder.build_word(charclass, messy=messy, length=reps))
         else:
             reps = max(1, node.min_repeat) if reps is None else reps
-            return ''.join([self.visit_node(child) for _ in range(reps)])
-
-    def visit_branch(self, node):
-        if node.choice is None:
-            chosen_child = random.choice(node.children)
+            parts = []
+            # Repeat counts can be in the billions, so don't make a list of them
+            for _ in xrange(reps):
+                if self.budget.exceeded:
+                    break
+                parts.append(self.visit_node(child, state))
+            return ''.join(parts)
+
+    def visit_branch(self, node, state=None):
+        choice = self._get_state_value(node, state)
+        if choice is None:
+            chosen_child = self.rand.choice(node.children)
         else:
-            chosen_child = node.children[node.choice]
-        return self.visit_node(chosen_child)
+            chosen_child = node.children[choice]
+        return self.visit_node(chosen_child, state)
 
     def visit_in(self, node):
-        chars = get_valid_characters(node)
-        return self.word_builder.build_word(chars, length=1)
+        charclass = get_character_class(node)
+        return self.budget.take(self.word_builder.build_word(charclass, length=1))
 
     def visit_literal(self, node):
-        return unichr(node.value)
+        return self.budget.take(unichr(node.value))
 
     def visit_any(self, node):
-        return random.choice(get_valid_characters(node))
+        return self.budget.take(self.rand.choice(get_character_class(node).chars))
+
+
+class ExampleBudget(object):
+    '''
+    How many more characters an example can have, and how many more nodes can be
+    visited to make it.  `exceeded` holds the names of the limits that were hit
+    ('length' or 'steps').  Once any limit has been hit, no more nodes are visited.
+    '''
+    def __init__(self, max_length=MAX_EXAMPLE_LENGTH, max_steps=MAX_EXAMPLE_STEPS):
+        self.length = max_length
+        self.steps = max_steps
+        self.exceeded = set()
+
+    def visit(self):
+        ''' Count a visit to a node, returning False if the node shouldn't be visited. '''
+        if self.exceeded:
+            return False
+        if self.steps <= 0:
+            self.exceeded.add('steps')
+            return False
+        self.steps -= 1
+        return True
+
+    def clamp_length(self, length):
+        ''' Get the most characters up to `length` that can still be added. '''
+        if length > self.length:
+            self.exceeded.add('length')
+            return self.length
+        return length
+
+    def take(self, text):
+        ''' Add text to the example, cutting off what doesn't fit. '''
+        if len(text) > self.length:
+            self.exceeded.add('length')
+            text = text[:self.length]
+        self.length -= len(text)
+        return text
+
+
+class ExampleBudgetStats(object):
+    '''
+    Counts of how many examples have been generated, and of how many of them were
+    truncated because they hit each limit of their budget.
+    '''
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, budget):
+        with self._lock:
+            self._counts['examples'] += 1
+            for limit in budget.exceeded:
+                self._counts[limit] += 1
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'examples': self._counts['examples'],
+                'truncated_by_length': self._counts['length'],
+                'truncated_by_steps': self._counts['steps'],
+            }
+
+
+budget_stats = ExampleBudgetStats()
 
 
 class WordBuilder(object):
 
-    def __init__(self, dictionary):
+    def __init__(self, dictionary, rand=None):
         self.dictionary = dictionary
+        self.rand = rand if rand is not None else random
 
-    def build_word(self, chars, length=None, messy=True):
+    def build_word(self, charclass, length=None, messy=True):
         if length:
-            return ''.join([random.choice(chars) for _ in range(length)])
+            chars = charclass.chars
+            return ''.join([self.rand.choice(chars) for _ in range(length)])
         else:
-            word = self._get_dict_term(chars)
+            word = self._get_dict_term(charclass)
             if messy:
-                word = self.add_nonalpha(word, chars)
+                word = self.add_nonalpha(word, charclass)
             return word
 
-    def add_nonalpha(self, word, chars, count=2):
-        non_alpha = list(set(chars) - set(string.ascii_letters))
+    def add_nonalpha(self, word, charclass, count=2):
+        non_alpha = (charclass - LETTERS).chars
         new_word = list(word)
         if len(non_alpha) > 0:
             for _ in range(count):
-                rand_symbol = random.choice(non_alpha)
-                rand_index = random.randint(0, len(word))
+                rand_symbol = self.rand.choice(non_alpha)
+                rand_index = self.rand.randint(0, len(word))
                 new_word.insert(rand_index, rand_symbol)
         return ''.join(new_word)
 
-    def _get_dict_term(self, chars):
+    def _get_dict_term(self, charclass):
 
         # If we can, we get a dictionary word that satisfies the pattern.
         # Otherwise, return a random word
-        dict_shuf = sorted(self.dictionary, key=lambda k: random.random())
-        chars_lower = [c.lower() for c in chars]
+        dict_shuf = sorted(self.dictionary, key=lambda k: self.rand.random())
+        charclass_lower = charclass.lower()
 
         # We match with lower-case versions of dictionary words.  If it
         # matches, then we shift the output to be mixed upper and lower
         # as specified by the pattern
         for term in dict_shuf:
             term = term.lower()
-            match = all([c in chars_lower for c in term])
+            match = all([c in charclass_lower for c in term])
             if match:
                 clist = list(term)
                 for i in range(len(clist)):
                     c = clist[i]
-                    if c.upper() in chars and c.lower() in chars:
-                        clist[i] = random.choice([c.upper(), c.lower()])
-                    elif c.upper() in chars:
+                    if c.upper() in charclass and c.lower() in charclass:
+                        clist[i] = self.rand.choice([c.upper(), c.lower()])
+                    elif c.upper() in charclass:
                         clist[i] = c.upper()
-                    elif c.lower() in chars:
+                    elif c.lower() in charclass:
                         clist[i] = c.lower()
                 return ''.join(clist)
-        return self._make_random_word(chars)
+        return self._make_random_word(charclass)
 
-    def _make_random_word(self, chars):
+    def _make_random_word(self, charclass):
         # Try to make readable word by only using alphanumeric chars.
-        choices = list(set(chars).intersection(set(string.ascii_letters)))
+        choices = (charclass & LETTERS).chars
         if len(choices) == 0:
             return ''
         else:
-            return ''.join([random.choice(choices) for _ in range(RANDOM_WORD_LEN)])
+            return ''.join([self.rand.choice(choices) for _ in range(RANDOM_WORD_LEN)])
 
 
-def get_valid_characters(node):
-    ''' Get the list of characters that can be used to match a character node. '''
+def get_character_class(node):
+    '''
+    Get the class of characters that can be used to match a character node.
+    Once a node belongs to a pattern tree, its class is kept on the node.
+    '''
+    charclass = node.charclass
+    if charclass is None:
+        charclass = _make_character_class(node)
+        if node.id is not None:
+            node.charclass = charclass
+    return charclass
+
+
+def _make_character_class(node):
 
     if isinstance(node, InNode):
-        if node.negated:
-            op = lambda clist, c: clist.remove(c)
-            chars = list(string.printable)
-        else:
-            op = lambda clist, c: clist.append(c)
-            chars = []
+        charclass = EMPTY
         for child in node.children:
-            child_chars = get_valid_characters(child)
-            for cc in child_chars:
-                op(chars, cc)
+            charclass = charclass | get_character_class(child)
+        if node.negated:
+            charclass = PRINTABLE - charclass
+        return charclass
 
     elif isinstance(node, LiteralNode):
-        return [unichr(node.value)]
+        return CharacterClass(1 << node.value)
 
     elif isinstance(node, RangeNode):
-        return [unichr(val) for val in range(node.lo, node.hi+1)]
+        return CharacterClass.from_range(node.lo, node.hi)
 
     elif isinstance(node, CategoryNode):
         if node.classname == 'word':
-            return string.ascii_letters
+            return LETTERS
         elif node.classname == 'space':
-            return string.whitespace
+            return WHITESPACE
         elif node.classname == 'digit':
-            return string.digits
+            return DIGITS
         else:
-            return []
+            return EMPTY
 
     elif isinstance(node, AnyNode):
         # According to Python documentation:
@@ -196,16 +346,10 @@ def get_valid_characters(node):
         # We approximate this by replace a 'dot' with a character from the 'printable'
         #  attribute of the 'string' module, ignoring characters that will insert
         #  new lines to make sure that examples can be read on one line.
-        NEWLINE_CHARS = ['\n', '\r', '\x0b', '\x0c']
-        printable_chars = string.printable
-        for char in NEWLINE_CHARS:
-            printable_chars.replace(char, '')
-        return printable_chars
+        return PRINTABLE - NEWLINES
 
     else:
-        return []
-
-    return chars
+        return EMPTY
 
 
 def get_default_dict():
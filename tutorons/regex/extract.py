@@ -4,13 +4,14 @@
 from __future__ import unicode_literals
 import logging
 import re
-from slimit.lexer import Lexer as JsLexer
-from slimit.parser import Parser as JsParser
 import os.path
 import subprocess
 import bashlex
 
-from tutorons.common.extractor import Region, LineExtractor, CommandExtractor
+from tutorons.common.extractor import Region, LineExtractor, CommandExtractor,\
+    scan_javascript_literals
+from tutorons.common.artifacts import ArtifactStore
+from tutorons.common.javascript import parse_javascript
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -32,10 +33,15 @@ class RegexRegion(Region):
         self.pattern = pattern
 
 
-def get_arguments(command, cmd_pattern):
-    ''' Given a single command, return a list of its arguments. '''
-
-    parse_tree = bashlex.parse(command)
+def get_arguments(command, cmd_pattern, artifacts=None):
+    '''
+    Given a single command, return a list of its arguments.
+    If an artifact store is given, the command's parse tree is shared through it.
+    '''
+    if artifacts is not None:
+        parse_tree = artifacts.get('bash_tree', command, bashlex.parse)
+    else:
+        parse_tree = bashlex.parse(command)
     cmd_node = parse_tree[0]
     args = []
     after_command = False
@@ -55,8 +61,9 @@ def get_arguments(command, cmd_pattern):
 class GrepRegexExtractor(object):
     ''' Extracts regular expressions from grep command lines. '''
 
-    def __init__(self):
-        self.command_extractor = CommandExtractor(GREP_COMMAND_PATTERN)
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+        self.command_extractor = CommandExtractor(GREP_COMMAND_PATTERN, self.artifacts)
 
     def extract(self, node):
         '''
@@ -74,7 +81,7 @@ class GrepRegexExtractor(object):
         for cr in command_regions:
 
             command = cr.string
-            args = [GREP] + get_arguments(command, GREP_COMMAND_PATTERN)
+            args = [GREP] + get_arguments(command, GREP_COMMAND_PATTERN, self.artifacts)
             try:
                 output = subprocess.check_output(args, stderr=subprocess.STDOUT)
             except subprocess.CalledProcessError as cpe:
@@ -93,33 +100,36 @@ class GrepRegexExtractor(object):
 class JavascriptRegexExtractor(object):
     ''' Extracts regular expressions from Javascript. '''
 
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+
     def extract(self, node):
 
-        lexer = JsLexer()
-        lexer.input(node.text)
+        literals, scanned = self.artifacts.get(
+            'javascript_literals', node.text, scan_javascript_literals)
         regions = []
 
-        if not self._parse_succeeds(node.text):
+        if not scanned:
             return regions
 
-        while True:
-            try:
-                tok = lexer.token()
-                if not tok:
-                    break
-                if tok.type == "REGEX":
-                    start_char = tok.lexpos + 1
-                    regex_parts = tok.value.split('/')
-                    string = regex_parts[1]
-                    flags = regex_parts[2]
-                    if not self._are_flags_valid(flags):
-                        continue
-                    end_char = start_char + len(string) - 1
-                    r = RegexRegion(string, node, start_char, end_char, string)
-                    regions.append(r)
-            except (TypeError, AttributeError):
-                logging.warn("Failed to parse text: %s...", node.text[:100])
-                break
+        for literal in literals:
+            if literal.type == "REGEX":
+                start_char = literal.lexpos + 1
+                regex_parts = literal.value.split('/')
+                string = regex_parts[1]
+                flags = regex_parts[2]
+                if not self._are_flags_valid(flags):
+                    continue
+                end_char = start_char + len(string) - 1
+                r = RegexRegion(string, node, start_char, end_char, string)
+                regions.append(r)
+
+        # We only trust the regular expressions we found if the text is a valid script.
+        # Parsing is slow, so we only parse the text if we found any.
+        if regions:
+            parsed, _ = parse_javascript(node.text)
+            if not parsed:
+                return []
 
         return regions
 
@@ -136,15 +146,6 @@ class JavascriptRegexExtractor(object):
             seen_flags.append(f)
         return True
 
-    def _parse_succeeds(self, text):
-        try:
-            parser = JsParser()
-            parser.parse(text)
-        except (SyntaxError, TypeError):
-            return False
-        else:
-            return True
-
 
 class ApacheConfigRegexExtractor(LineExtractor):
     ''' Extracts regular expressions from mod_rewrite rules. '''
@@ -209,8 +210,9 @@ class ApacheConfigRegexExtractor(LineExtractor):
 
 class SedRegexExtractor(object):
 
-    def __init__(self):
-        self.sed_extractor = CommandExtractor(SED_COMMAND_PATTERN)
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+        self.sed_extractor = CommandExtractor(SED_COMMAND_PATTERN, self.artifacts)
 
     def extract(self, node):
 
@@ -229,7 +231,7 @@ class SedRegexExtractor(object):
         for cr in command_regions:
 
             command = cr.string
-            args = [SED] + get_arguments(command, SED_COMMAND_PATTERN)
+            args = [SED] + get_arguments(command, SED_COMMAND_PATTERN, self.artifacts)
             try:
                 output = subprocess.check_output(args, stderr=subprocess.STDOUT)
             except subprocess.CalledProcessError as cpe:
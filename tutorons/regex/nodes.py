@@ -10,8 +10,19 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 class Node(object):
+    '''
+    A node of a parsed regular expression.  Nodes are built up by appending to their
+    `children`, and then frozen when they are added to a `PatternTree`: the children
+    become a tuple and the node is given an `id`, its index in the tree's list of nodes.
+    Nodes hold no state for example generation, so one tree can be shared by many
+    generators at once.  The only thing set on a node after it is frozen is `charclass`,
+    the class of characters it matches, computed the first time it is needed.
+    '''
+    __slots__ = ('id', 'text', 'children', 'charclass')
 
     def __init__(self, text=''):
+        self.id = None
+        self.charclass = None
         self.children = []
         self.text = text
 
@@ -28,6 +39,7 @@ class Node(object):
 
 
 class LiteralNode(Node):
+    __slots__ = ('value',)
 
     def __init__(self, value, *args, **kwargs):
         super(LiteralNode, self).__init__(*args, **kwargs)
@@ -35,6 +47,7 @@ class LiteralNode(Node):
 
 
 class CategoryNode(Node):
+    __slots__ = ('classname',)
 
     def __init__(self, classname, *args, **kwargs):
         super(CategoryNode, self).__init__(*args, **kwargs)
@@ -42,10 +55,11 @@ class CategoryNode(Node):
 
 
 class AnyNode(Node):
-    pass
+    __slots__ = ()
 
 
 class RangeNode(Node):
+    __slots__ = ('lo', 'hi')
 
     def __init__(self, lo, hi, *args, **kwargs):
         super(RangeNode, self).__init__(*args, **kwargs)
@@ -54,10 +68,11 @@ class RangeNode(Node):
 
 
 class NegateNode(Node):
-    pass
+    __slots__ = ()
 
 
 class InNode(Node):
+    __slots__ = ()
 
     @property
     def negated(self):
@@ -68,25 +83,22 @@ class InNode(Node):
 
 
 class BranchNode(Node):
-
-    def __init__(self, *args, **kwargs):
-        super(BranchNode, self).__init__(*args, **kwargs)
-        self.choice = None
+    __slots__ = ()
 
 
 class ChoiceNode(Node):
-    pass
+    __slots__ = ()
 
 
 class GroupNode(Node):
-    pass
+    __slots__ = ()
 
 
 class RepeatNode(Node):
+    __slots__ = ('ranged', 'min_repeat', 'max_repeat')
 
     def __init__(self, ranged, min_repeat, max_repeat, *args, **kwargs):
         super(RepeatNode, self).__init__(*args, **kwargs)
         self.min_repeat = min_repeat
         self.max_repeat = max_repeat
         self.ranged = ranged
-        self.repetitions = None
@@ -5,8 +5,7 @@ from __future__ import unicode_literals
 import logging
 import argparse
 import re
-import sys
-from cStringIO import StringIO
+import sre_parse
 from enum import Enum
 
 
@@ -39,23 +38,80 @@ class LineType(Enum):
         return None
 
 
-def capture_stdout(func):
+class _DebugPrinter(object):
+    '''
+    Collects text the way the `print` statement writes it to a file, including the
+    'soft space' written between items printed by consecutive statements that end in
+    a comma.  This lets us build the description that `re.DEBUG` prints as a string.
+    '''
+    def __init__(self):
+        self.parts = []
+        self.softspace = False
+
+    def print_(self, *items, **kwargs):
+        for item in items:
+            text = item if isinstance(item, basestring) else str(item)
+            if self.softspace:
+                self.parts.append(' ')
+            self.parts.append(text)
+            self.softspace = not (text and text[-1].isspace() and text[-1] != ' ')
+        if kwargs.get('newline', True):
+            self.parts.append('\n')
+            self.softspace = False
+
+    def getvalue(self):
+        return ''.join(self.parts)
+
+
+def _describe_subpattern(subpattern, printer, level=0):
+    # This mirrors `sre_parse.SubPattern.dump`, which prints the description.
+    for op, av in subpattern.data:
+        printer.print_(level*"  " + op, newline=False)
+        if op == sre_parse.IN:
+            printer.print_()
+            for op, a in av:
+                printer.print_((level+1)*"  " + op, a)
+        elif op == sre_parse.BRANCH:
+            printer.print_()
+            for i, a in enumerate(av[1]):
+                if i:
+                    printer.print_(level*"  " + "or")
+                _describe_subpattern(a, printer, level+1)
+        elif op == sre_parse.GROUPREF_EXISTS:
+            condgroup, item_yes, item_no = av
+            printer.print_(condgroup)
+            _describe_subpattern(item_yes, printer, level+1)
+            if item_no:
+                printer.print_(level*"  " + "else")
+                _describe_subpattern(item_no, printer, level+1)
+        elif isinstance(av, (tuple, list)):
+            nl = False
+            for a in av:
+                if isinstance(a, sre_parse.SubPattern):
+                    if not nl:
+                        printer.print_()
+                    _describe_subpattern(a, printer, level+1)
+                    nl = True
+                else:
+                    printer.print_(a, newline=False)
+                    nl = False
+            if not nl:
+                printer.print_()
+        else:
+            printer.print_(av)
 
-    def _outer(*args, **kwargs):
-        orig_stdout = sys.stdout
-        stdout_buffer = StringIO()
-        sys.stdout = stdout_buffer
-        func(*args, **kwargs)
-        sys.stdout = orig_stdout
-        return stdout_buffer.getvalue()
 
-    return _outer
-
-
-@capture_stdout
 def describe_regex(regex):
-    re.purge()
-    re.compile(regex, re.DEBUG)
+    '''
+    Describe how a regular expression is parsed, in the format that compiling it with
+    `re.DEBUG` prints.  The description is built as a string rather than captured from
+    `sys.stdout`, which is shared by all threads.
+    '''
+    # Compile the pattern first so that invalid patterns raise the same errors as before
+    re.compile(regex)
+    printer = _DebugPrinter()
+    _describe_subpattern(sre_parse.parse(regex), printer)
+    return printer.getvalue()
 
 
 def _count_indents(line):
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 import logging
 import itertools
+import random
 
 from tutorons.regex.nodes import BranchNode, RepeatNode
 
@@ -12,20 +13,31 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
 class PatternTree(object):
-
+    '''
+    A parsed regular expression.  The tree is immutable once it is made: each node is
+    numbered with its position in a post-order walk of the tree, and anything that
+    changes from one example to the next (which branch is chosen, how many times a
+    subpattern repeats) is kept outside of the tree in a 'state', a tuple with one value
+    for each node indexed by the node's `id`.  This lets a tree be cached and used by
+    several example generators at the same time.
+    '''
     def __init__(self, root):
         self.root = root
+        self.nodes = tuple(self._freeze(root, []))
+
+    def _freeze(self, node, nodes):
+        if node.id is not None:
+            raise ValueError("Node already belongs to a pattern tree: " + node.text)
+        for c in node.children:
+            self._freeze(c, nodes)
+        node.children = tuple(node.children)
+        node.id = len(nodes)
+        nodes.append(node)
+        return nodes
 
     def get_nodes(self):
         ''' Collect all nodes of a Regex parse tree. '''
-        return self._get_node_descendants(self.root)
-
-    def _get_node_descendants(self, node):
-        desc = []
-        for c in node.children:
-            desc.extend(self._get_node_descendants(c))
-        desc.append(node)
-        return desc
+        return list(self.nodes)
 
     def get_state_attributes(self):
         '''
@@ -35,9 +47,8 @@ class PatternTree(object):
         of a subpattern.
         Returns a list of (node, attribute-name) tuples.
         '''
-        nodes = self.get_nodes()
         attributes = []
-        for n in nodes:
+        for n in self.nodes:
             if isinstance(n, BranchNode):
                 attributes.append((n, 'choice'))
             elif isinstance(n, RepeatNode):
@@ -48,32 +59,75 @@ class PatternTree(object):
         '''
         Get all combinations of tree states that will alter the types of examples
         that can be generated for a tree.
-        Returns a list of lists of assignments, where each item is:
-        (node, attribute-name, value)
-        And each list is a 'state', or a set of assignments that can be applied to a tree
-        to prepare it for example generation.
+        Returns a list of states, where each state is a tuple with the value for each
+        node, indexed by node ID (None for nodes without a state attribute).
         For now, different assignments are limited in the following ways:
         * repetitions can only be any value between [lower_bound:min(lower_bound+2, upper_bound)]
         '''
-        states = []
+        assignments = []
         attributes = self.get_state_attributes()
 
         val_generator = AttributeValueGenerator()
         for attr in attributes:
+            node, _ = attr
             values = val_generator.get_values(attr)
-            states.append([attr + (val,) for val in values])
+            assignments.append([(node, val) for val in values])
 
-        permutations = [_ for _ in itertools.product(*states)]
-        return permutations
+        return [self.make_state(a) for a in itertools.product(*assignments)]
 
-    def set_state(self, state):
+    def sample_state_permutations(self, count, rand=random):
+        '''
+        Pick up to `count` different states from those returned by
+        get_state_permutations(), in random order, using the random number generator
+        `rand`.  Only the chosen states are made, so this is fast even for patterns with
+        many branches and repetitions, which can have millions of permutations.
+        '''
+        val_generator = AttributeValueGenerator()
+        choices = []
+        for attr in self.get_state_attributes():
+            node, _ = attr
+            choices.append((node, list(val_generator.get_values(attr))))
+
+        total = 1
+        for _, values in choices:
+            total *= len(values)
+
+        if total <= count:
+            indexes = range(total)
+            rand.shuffle(indexes)
+        else:
+            indexes = []
+            chosen = set()
+            while len(indexes) < count:
+                index = rand.randrange(total)
+                if index not in chosen:
+                    chosen.add(index)
+                    indexes.append(index)
+
+        # Each index is read as a number whose digits are the positions of the values
+        # for each attribute, with the last attribute as the lowest digit, so that
+        # index i is the same state as get_state_permutations()[i].
+        states = []
+        for index in indexes:
+            assignments = []
+            for node, values in reversed(choices):
+                index, position = divmod(index, len(values))
+                assignments.append((node, values[position]))
+            states.append(self.make_state(assignments))
+        return states
+
+    def make_state(self, assignments=()):
         '''
-        Apply a list of state attributes and values to the nodes in a tree.
-        The list should be one that was returned by the
-        get_state_permutations() method.
+        Make a state for this tree from a list of (node, value) pairs.  Nodes that
+        aren't assigned a value have the value None, which leaves it to the example
+        generator to choose one.
         '''
-        for node, attr, value in state:
-            setattr(node, attr, value)
+        state = [None] * len(self.nodes)
+        for node, value in assignments:
+            if node.id is None or node.id >= len(self.nodes) or self.nodes[node.id] is not node:
+                raise ValueError("Node does not belong to this pattern tree: " + node.text)
+            state[node.id] = value
+        return tuple(state)
 
 
 class AttributeValueGenerator(object):
@@ -5,4 +5,8 @@ urlpatterns = patterns(
     '',
     url(r'^scan$', 'tutorons.regex.views.scan', name='regex_scan'),
     url(r'^explain$', 'tutorons.regex.views.explain', name='regex_explain'),
+    url(r'^explain_batch$', 'tutorons.regex.views.explain_batch', name='regex_explain_batch'),
+    url(r'^explanation$', 'tutorons.regex.views.explanation', name='regex_explanation'),
+    url(r'^explain_beacon$', 'tutorons.common.views.snippetbeacon',
+        name='regex_explain_beacon'),
 )
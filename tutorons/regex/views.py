@@ -4,17 +4,17 @@
 from __future__ import unicode_literals
 import logging
 from django.views.decorators.csrf import csrf_exempt
-from django.template.loader import get_template
-from django.template import Context
 
 from tutorons.common.scanner import NodeScanner
+from tutorons.common.artifacts import ArtifactStore
 from tutorons.regex.extract import GrepRegexExtractor, SedRegexExtractor, JavascriptRegexExtractor,\
     ApacheConfigRegexExtractor
 from tutorons.regex.explain import InvalidRegexException, visualize as regex_viz
-from tutorons.regex.examples import get_examples
+from tutorons.regex.examples import get_examples, get_pattern_tree
 from tutorons.regex.render import render as regex_render
 from tutorons.common.dblogger import DbLogger
-from tutorons.common.views import pagescan, snippetexplain
+from tutorons.common.views import pagescan, snippetexplain, snippetbatch, regionexplain,\
+    render_error
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -22,38 +22,56 @@ region_logger = logging.getLogger('region')
 db_logger = DbLogger()
 
 
+def explain_region(pattern):
+
+    try:
+        svg = regex_viz(pattern)
+    except InvalidRegexException as e:
+        logging.error("Error processing regex %s: %s", pattern, e)
+        svg = None
+
+    try:
+        examples = get_examples(pattern, count=4)
+    except Exception as e:
+        logging.error("Error processing regex %s: %s", pattern, e)
+        examples = None
+
+    if examples is not None or svg is not None:
+        return regex_render(pattern, svg, examples)
+    return None
+
+
+def can_explain_region(pattern):
+    # Patterns we can parse always get examples.  Fetching a visualization for
+    # patterns we can't parse is too slow to do for every region in a scan.
+    try:
+        get_pattern_tree(pattern)
+    except Exception:
+        return False
+    return True
+
+
 @csrf_exempt
-@pagescan
+@pagescan(explain_region, can_explain_region)
 def scan(html_doc):
 
+    # Extractors share the bash parses and other representations of the nodes they scan
+    artifacts = ArtifactStore()
     extractors = [
-        GrepRegexExtractor(),
-        SedRegexExtractor(),
-        JavascriptRegexExtractor(),
-        ApacheConfigRegexExtractor(),
+        GrepRegexExtractor(artifacts),
+        SedRegexExtractor(artifacts),
+        JavascriptRegexExtractor(artifacts),
+        ApacheConfigRegexExtractor(artifacts),
     ]
 
-    rendered_regions = []
     for extractor in extractors:
-        scanner = NodeScanner(extractor, ['code', 'pre'])
+        scanner = NodeScanner(extractor, ['code', 'pre'], artifacts)
         regions = scanner.scan(html_doc)
         for r in regions:
-            try:
-                svg = regex_viz(r.pattern)
-            except InvalidRegexException as e:
-                logging.error("Error processing regex %s: %s", r.pattern, e)
-                svg = None
+            yield r, r.pattern
 
-            try:
-                examples = get_examples(r.pattern, count=4)
-            except Exception as e:
-                logging.error("Error processing regex %s: %s", r.pattern, e)
-                examples = None
 
-            if examples is not None or svg is not None:
-                document = regex_render(r.pattern, svg, examples)
-                rendered_regions.append((r, document))
-    return rendered_regions
+explanation = regionexplain(explain_region)
 
 
 @csrf_exempt
@@ -64,7 +82,9 @@ def explain(text, edge_size):
         svg = regex_viz(text)
         explanation = regex_render(svg)
     except InvalidRegexException:
-        error_template = get_template('error.html')
-        explanation = error_template.render(Context({'text': text, 'type': 'regular expression'}))
+        explanation = render_error(text, 'regular expression')
 
     return explanation
+
+
+explain_batch = csrf_exempt(snippetbatch({'regex': explain}))
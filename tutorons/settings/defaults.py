@@ -8,6 +8,34 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 DEPS_DIR = os.path.join(BASE_DIR, 'deps')
 REGEX_SVG_ENDPOINT = "http://regexsvg.tutorons.com/"
 
+# Port of a long-lived Java gateway shared by all workers on this host.
+# If None, each process launches its own JVM the first time it needs one.
+JAVA_GATEWAY_PORT = None
+
+# Name of a cache in CACHES through which workers share the bash commands found in text.
+# If None, each process only remembers the commands it has found itself.
+BASH_COMMAND_CACHE = None
+
+# Documents with at least this many characters are scanned in the background if the client
+# allows it, and the client polls /api/v1/scan_job/<id> for the results.  If None, all
+# documents are scanned before responding.
+ASYNC_SCAN_MIN_DOCUMENT_SIZE = 100000
+# Threads in each process that run background scans.  If 0, background scans are run
+# before responding to the request that started them, which is useful for testing.
+SCAN_JOB_WORKERS = 4
+# Longest time, in seconds, that a client can wait on a scan job for new results.
+SCAN_JOB_MAX_WAIT = 20
+# Scan jobs that haven't saved progress for this many seconds were lost (e.g., when their
+# worker restarted), and are marked failed when polled.
+SCAN_JOB_TIMEOUT = 5 * 60
+# Scan jobs are deleted this many seconds after they were started.
+SCAN_JOB_MAX_AGE = 24 * 60 * 60
+# Time, in seconds, that browsers and proxies can cache explanations of regions.
+EXPLANATION_MAX_AGE = 7 * 24 * 60 * 60
+# Time, in seconds, that they can cache messages that a snippet couldn't be explained,
+# which is short so that fixes to the tutorons reach clients soon.
+EXPLANATION_ERROR_MAX_AGE = 5 * 60
+
 
 # Security
 
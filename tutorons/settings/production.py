@@ -17,6 +17,7 @@ CACHES = {
         'TIMEOUT': None,
     }
 }
+BASH_COMMAND_CACHE = 'default'
 
 LOGGING = {
     'version': 1,
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from tutorons.common.artifacts import ArtifactStore
+from tutorons.common.extractor import CommandExtractor
+from tutorons.common.htmltools import HtmlDocument
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class ArtifactStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = ArtifactStore()
+        self.computed = []
+
+    def _compute(self, key):
+        self.computed.append(key)
+        return len(key)
+
+    def test_compute_artifact_once(self):
+        self.assertEqual(self.store.get('length', 'abc', self._compute), 3)
+        self.assertEqual(self.store.get('length', 'abc', self._compute), 3)
+        self.assertEqual(self.computed, ['abc'])
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+
+    def test_artifacts_of_different_kinds_are_separate(self):
+        self.store.get('length', 'abc', self._compute)
+        self.store.get('other', 'abc', self._compute)
+        self.assertEqual(self.computed, ['abc', 'abc'])
+
+    def test_key_nodes_by_identity(self):
+        document = HtmlDocument("<div><p>a</p><p>a</p></div>")
+        first, second = document.find_all('p')
+        self.store.get('text', first, lambda node: node.text)
+        self.store.get('text', first, lambda node: node.text)
+        self.store.get('text', second, lambda node: node.text)
+        self.assertEqual(self.store.misses, 2)
+
+    def test_reraise_error_without_computing_again(self):
+
+        def fail(key):
+            self.computed.append(key)
+            raise ValueError(key)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.store.get('failure', 'abc', fail)
+        self.assertEqual(self.computed, ['abc'])
+
+
+class ShareArtifactsBetweenExtractorsTest(unittest.TestCase):
+
+    def test_parse_commands_once_for_all_extractors(self):
+
+        document = HtmlDocument("<pre>wget http://google.com<br>sed -e 's/a/b/' file.txt</pre>")
+        node = document.pre
+        store = ArtifactStore()
+
+        wget_regions = CommandExtractor('wget', store).extract(node)
+        misses = store.misses
+        sed_regions = CommandExtractor('sed', store).extract(node)
+
+        self.assertEqual(store.misses, misses)
+        self.assertEqual([r.string for r in wget_regions], ['wget http://google.com'])
+        self.assertEqual([r.string for r in sed_regions], ["sed -e 's/a/b/' file.txt"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+import unittest
+from django.test import TestCase, Client
+
+from tutorons.common.artifacts import ArtifactStore
+from tutorons.common.extractor import CommandExtractor
+from tutorons.common.htmltools import BlockDocument, HtmlDocument, get_css_selector,\
+    get_block_hash
+from tutorons.common.scanner import NodeScanner
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+DOCUMENT = "".join([
+    "<html> <body>",
+    "<p>Try these:</p>",
+    "<pre>$ wget http://google.com<br>$ sed -e 's/a/b/' file.txt</pre>",
+    "<code> p { background-color: lightblue; } h1 {color: navy;} </code>",
+    "</body> </html>"
+])
+BLOCKS = [
+    {'selector': 'HTML > BODY:nth-of-type(1) > P:nth-of-type(1)', 'tag': 'P', 'text': "Try these:"},
+    {
+        'selector': 'HTML > BODY:nth-of-type(1) > PRE:nth-of-type(1)',
+        'tag': 'PRE',
+        'text': "$ wget http://google.com<br>$ sed -e 's/a/b/' file.txt",
+    },
+    {
+        'selector': 'HTML > BODY:nth-of-type(1) > CODE:nth-of-type(1)',
+        'tag': 'CODE',
+        'text': " p { background-color: lightblue; } h1 {color: navy;} ",
+    },
+]
+
+
+class BlockDocumentTest(unittest.TestCase):
+
+    def test_blocks_read_like_parsed_elements(self):
+        document = BlockDocument(BLOCKS)
+        parsed_document = HtmlDocument(DOCUMENT)
+        for block, element in zip(document.children, parsed_document.body.children):
+            self.assertEqual(block.name, element.name)
+            self.assertEqual(block.text, element.text)
+            self.assertEqual(len(block.find_all('br')), len(element.find_all('br')))
+
+    def test_selector_of_block_is_from_client(self):
+        document = BlockDocument(BLOCKS)
+        self.assertEqual(
+            [get_css_selector(block) for block in document.children],
+            [block['selector'] for block in BLOCKS])
+
+    def test_scan_blocks_same_as_page(self):
+
+        def scan(document):
+            scanner = NodeScanner(CommandExtractor('sed', ArtifactStore()), ['pre'])
+            return [
+                (get_css_selector(r.node), r.start_offset, r.end_offset, r.string)
+                for r in scanner.scan(document)
+            ]
+
+        self.assertEqual(scan(BlockDocument(BLOCKS)), scan(HtmlDocument(DOCUMENT)))
+
+
+class ScanBlocksTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_scan_blocks_same_as_page(self):
+        page_response = self.client.post(
+            '/css/scan', data={'origin': 'www.test.com', 'document': DOCUMENT})
+        blocks_response = self.client.post(
+            '/css/scan', data={'origin': 'www.test.com', 'blocks': json.dumps(BLOCKS)})
+        page_regions = json.loads(page_response.content)['regions']
+        blocks_regions = json.loads(blocks_response.content)['regions']
+        self.assertEqual(len(blocks_regions), 2)
+        for page_region, blocks_region in zip(page_regions, blocks_regions):
+            for field in ['node', 'start_index', 'end_index', 'document']:
+                self.assertEqual(page_region[field], blocks_region[field])
+
+    def test_regions_have_hashes_of_their_blocks(self):
+        response = self.client.post(
+            '/css/scan', data={'origin': 'www.test.com', 'blocks': json.dumps(BLOCKS)})
+        regions = json.loads(response.content)['regions']
+        self.assertEqual([r['block_hash'] for r in regions], [get_block_hash(BLOCKS[2])] * 2)
+        self.assertNotIn('unchanged_blocks', json.loads(response.content))
+
+    def test_malformed_blocks_are_bad_request(self):
+        for blocks in ['[{"tag": "pre"', '{}', '[{"tag": "pre", "text": "wget"}]']:
+            response = self.client.post(
+                '/css/scan', data={'origin': 'www.test.com', 'blocks': blocks})
+            self.assertEqual(response.status_code, 400)
+
+
+class RescanBlocksTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.added_block = {
+            'selector': 'HTML > BODY:nth-of-type(1) > CODE:nth-of-type(2)',
+            'tag': 'CODE',
+            'text': "div.content {color: red;}",
+        }
+
+    def _rescan(self, blocks, known_blocks):
+        response = self.client.post('/css/scan', data={
+            'origin': 'www.test.com',
+            'blocks': json.dumps(blocks),
+            'known_blocks': json.dumps(known_blocks),
+        })
+        return json.loads(response.content)
+
+    def test_rescan_only_new_blocks(self):
+        known_blocks = [get_block_hash(block) for block in BLOCKS]
+        response = self._rescan(BLOCKS + [self.added_block], known_blocks)
+        self.assertEqual([r['node'] for r in response['regions']], [self.added_block['selector']])
+        self.assertEqual(response['unchanged_blocks'], known_blocks)
+
+    def test_rescan_of_unchanged_page_finds_nothing(self):
+        response = self._rescan(BLOCKS, [get_block_hash(block) for block in BLOCKS])
+        self.assertEqual(response['regions'], [])
+
+    def test_only_blocks_still_on_page_are_unchanged(self):
+        known_blocks = [get_block_hash(block) for block in BLOCKS] + ['0' * 40]
+        response = self._rescan(BLOCKS[1:], known_blocks)
+        self.assertEqual(response['unchanged_blocks'], known_blocks[1:3])
+
+    def test_changed_block_is_rescanned(self):
+        changed_block = dict(BLOCKS[2], text=" p { background-color: lightblue; }")
+        response = self._rescan(BLOCKS[:2] + [changed_block], [get_block_hash(b) for b in BLOCKS])
+        self.assertEqual(len(response['regions']), 1)
+        self.assertEqual(response['regions'][0]['block_hash'], get_block_hash(changed_block))
+
+    def test_malformed_known_blocks_are_bad_request(self):
+        response = self.client.post('/css/scan', data={
+            'origin': 'www.test.com',
+            'blocks': json.dumps(BLOCKS),
+            'known_blocks': '{"a": 1}',
+        })
+        self.assertEqual(response.status_code, 400)
@@ -4,14 +4,48 @@
 from __future__ import unicode_literals
 import logging
 import unittest
+import random
+import re
+from django.core.cache import caches
+from django.test.utils import override_settings
 from tutorons.common.htmltools import HtmlDocument
-from tutorons.common.extractor import CommandExtractor
+from tutorons.common.extractor import CommandExtractor, command_spans
 from tutorons.common.scanner import CommandScanner
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
+def _reference_clean_for_bashlex(text):
+    ''' The original, quadratic-time implementation of `_clean_for_bashlex`. '''
+
+    replace_space = lambda m: '\n' * len(m.group())
+    text = re.sub(" *$", replace_space, text, flags=re.MULTILINE)
+
+    replace_comment = lambda m: '\n' * len(m.group())
+    text = re.sub("#.*$", replace_comment, text, flags=re.MULTILINE)
+
+    starting_newlines = 0
+    for c in text:
+        if c == '\n':
+            starting_newlines += 1
+        else:
+            break
+    text = ' ' * starting_newlines + text[starting_newlines:]
+
+    on_newline = False
+    for i, c in enumerate(text):
+        if on_newline:
+            if c == '\n':
+                text = text[:i] + ' ' + text[i+1:]
+            elif not re.match('\s', c):
+                on_newline = False
+        if not on_newline:
+            on_newline = (c == '\n')
+
+    return text
+
+
 class CommandExtractorTest(unittest.TestCase):
 
     def test_extract_command(self):
@@ -134,6 +168,66 @@ class CommandExtractorTest(unittest.TestCase):
         self.assertEqual(r.start_offset, 1)
 
 
+class CommandSpansCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        command_spans.clear()
+
+    def test_reuse_spans_across_extractions(self):
+        CommandExtractor('wget').extract(HtmlDocument('<code>wget http://google.com</code>'))
+        regions = CommandExtractor('wget').extract(
+            HtmlDocument('<pre>wget http://google.com</pre>'))
+        self.assertEqual(command_spans.stats()['hits'], 1)
+        self.assertEqual([(r.start_offset, r.end_offset) for r in regions], [(0, 21)])
+
+    def test_remember_unparseable_text(self):
+        CommandExtractor('wget').extract(HtmlDocument('<code>wget (</code>'))
+        regions = CommandExtractor('wget').extract(HtmlDocument('<code>wget (</code>'))
+        self.assertEqual(regions, [])
+        self.assertEqual(command_spans.get(('wget', 'wget (')), (False, ()))
+
+    def test_spans_are_cached_per_command_name(self):
+        node = HtmlDocument('<code>wget http://google.com</code>')
+        CommandExtractor('wget').extract(node)
+        self.assertEqual(CommandExtractor('sed').extract(node), [])
+        self.assertEqual(len(command_spans), 2)
+        self.assertGreater(command_spans.stats()['size'], 0)
+
+    @override_settings(BASH_COMMAND_CACHE='default')
+    def test_share_spans_through_django_cache(self):
+        caches['default'].clear()
+        node = HtmlDocument('<code>wget http://google.com</code>')
+        CommandExtractor('wget').extract(node)
+        command_spans.clear()
+        # Spans can be found in the Django cache even if this process has forgotten them
+        extractor = CommandExtractor('wget')
+        extractor._find_command_spans = None
+        regions = extractor.extract(node)
+        self.assertEqual([r.string for r in regions], ['wget http://google.com'])
+
+
+class CleanForBashlexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = CommandExtractor('wget')
+
+    def test_replace_comments_and_extra_newlines(self):
+        text = "\n\nwget a  # comment\n\n  \nwget b"
+        self.assertEqual(
+            self.extractor._clean_for_bashlex(text),
+            "  wget a  \n             wget b"
+        )
+
+    def test_same_as_reference_for_random_text(self):
+        pieces = [' ', '  ', '\t', '\n', '\n\n', '\r', '\x0b', '#', '# c', 'wget', 'a', '\u00a0']
+        rand = random.Random(0)
+        for _ in range(3000):
+            text = ''.join(rand.choice(pieces) for _ in range(rand.randint(0, 30)))
+            cleaned = self.extractor._clean_for_bashlex(text)
+            self.assertEqual(cleaned, _reference_clean_for_bashlex(text), repr(text))
+            self.assertEqual(len(cleaned), len(text))
+
+
 class CommandScannerTest(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+import gzip
+from StringIO import StringIO
+from django.test import TestCase, Client, override_settings
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+DOCUMENT = "".join([
+    "<html> <body> <code>",
+    " p { background-color: lightblue; }  ",
+    "p {color: navy; margin-left: 20px;} ",
+    "h1 {color: navy;} ",
+    "</code> </body> </html>"
+])
+
+
+class CompactScanTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def _scan(self, compact, **extra):
+        data = {'origin': 'www.test.com', 'document': DOCUMENT}
+        if compact:
+            data['compact'] = 'true'
+        return self.client.post('/css/scan', data=data, **extra)
+
+    def test_send_each_explanation_once(self):
+        response = json.loads(self._scan(compact=True).content)
+        regions = response['regions']
+        self.assertEqual(len(regions), 3)
+        self.assertEqual(len(response['explanations']), 2)
+        self.assertEqual(regions[0]['explanation_hash'], regions[1]['explanation_hash'])
+        self.assertNotEqual(regions[0]['explanation_hash'], regions[2]['explanation_hash'])
+        for region in regions:
+            self.assertNotIn('document', region)
+
+    def test_compact_explanations_same_as_inline_explanations(self):
+        compact_response = json.loads(self._scan(compact=True).content)
+        inline_regions = json.loads(self._scan(compact=False).content)['regions']
+        explanations = compact_response['explanations']
+        self.assertEqual(
+            [explanations[r['explanation_hash']] for r in compact_response['regions']],
+            [r['document'] for r in inline_regions])
+
+    def test_response_not_indented(self):
+        self.assertNotIn(b'\n', self._scan(compact=False).content)
+
+    def test_compress_response_if_client_accepts_gzip(self):
+        response = self._scan(compact=True, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        content = gzip.GzipFile(fileobj=StringIO(response.content)).read()
+        self.assertEqual(len(json.loads(content)['regions']), 3)
+
+    def test_do_not_compress_response_if_client_does_not_accept_gzip(self):
+        response = self._scan(compact=True)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @override_settings(SCAN_JOB_WORKERS=0, ASYNC_SCAN_MIN_DOCUMENT_SIZE=len(DOCUMENT))
+    def test_send_each_explanation_once_from_scan_job(self):
+        job_url = json.loads(self.client.post('/css/scan', data={
+            'origin': 'www.test.com',
+            'document': DOCUMENT,
+            'allow_async': 'true',
+        }).content)['job_url']
+        job_path = job_url[job_url.index('/api/'):]
+        job = json.loads(self.client.get(job_path, {'compact': 'true'}).content)
+        self.assertEqual(len(job['regions']), 3)
+        self.assertEqual(len(job['explanations']), 2)
@@ -0,0 +1,77 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+from django.test import TestCase, Client
+
+from tutorons.common.models import Region as RegionModel
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+DOCUMENT = "".join([
+    "<html> <body> <code>",
+    " p { background-color: lightblue; }  ",
+    "h1 {color: navy; margin-left: 20px;} ",
+    "</code> </body> </html>"
+])
+
+
+class DeferredExplanationsTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def _scan(self, defer_explanations):
+        data = {'origin': 'www.test.com', 'document': DOCUMENT}
+        if defer_explanations:
+            data['defer_explanations'] = 'true'
+        return json.loads(self.client.post('/css/scan', data=data).content)
+
+    def test_scan_returns_regions_without_explanations(self):
+        regions = self._scan(defer_explanations=True)['regions']
+        self.assertEqual([r['explanation_key'] for r in regions], ['p', 'h1'])
+        for region in regions:
+            self.assertNotIn('document', region)
+            self.assertIn('/css/explanation?key=', region['explanation_url'])
+
+    def test_regions_are_logged_when_explanations_are_deferred(self):
+        self._scan(defer_explanations=True)
+        self.assertEqual(RegionModel.objects.count(), 2)
+
+    def test_fetch_explanation_same_as_inline_explanation(self):
+        inline_regions = self._scan(defer_explanations=False)['regions']
+        deferred_regions = self._scan(defer_explanations=True)['regions']
+        for inline_region, deferred_region in zip(inline_regions, deferred_regions):
+            response = self.client.get(
+                '/css/explanation', {'key': deferred_region['explanation_key']})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(json.loads(response.content)['document'], inline_region['document'])
+            self.assertIn('public', response['Cache-Control'])
+            self.assertIn('max-age=', response['Cache-Control'])
+
+    def test_leave_out_regions_that_cannot_be_explained(self):
+        response = self.client.post('/regex/scan', data={
+            'origin': 'www.test.com',
+            'document': "<pre>var good = /ab+c/; var bad = /a{2,1}/;</pre>",
+            'defer_explanations': 'true',
+        })
+        regions = json.loads(response.content)['regions']
+        self.assertEqual([r['explanation_key'] for r in regions], ['ab+c'])
+        self.assertEqual(RegionModel.objects.count(), 1)
+
+    def test_explanation_without_key_is_bad_request(self):
+        response = self.client.get('/css/explanation')
+        self.assertEqual(response.status_code, 400)
+
+    def test_explanation_for_unexplainable_key_not_found(self):
+        response = self.client.get('/python/explanation', {'key': 'not_a_builtin'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_explanation_for_non_selector_not_found(self):
+        for key in ['!!!', '', 'foo bar', 'java.lang.String']:
+            response = self.client.get('/css/explanation', {'key': key})
+            self.assertEqual(response.status_code, 404)
+            self.assertFalse(response.has_header('Cache-Control'))
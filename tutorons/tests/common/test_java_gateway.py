@@ -0,0 +1,76 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+import mock
+from py4j.java_gateway import JavaMember
+
+from tutorons.common.java import gateway as gateway_module
+from tutorons.common.java.gateway import GatewayManager, JavaProxy
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+@mock.patch.object(gateway_module, 'get_classpath', return_value='')
+@mock.patch.object(gateway_module, 'launch_gateway', return_value=25333)
+@mock.patch.object(gateway_module, 'JavaGateway')
+class GatewayManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = GatewayManager()
+
+    def test_launch_jvm_lazily_on_first_use(self, JavaGatewayMock, launch_mock, _):
+        self.assertEqual(launch_mock.call_count, 0)
+        self.manager.get()
+        self.manager.get()
+        self.assertEqual(launch_mock.call_count, 1)
+        self.assertEqual(self.manager.metrics['starts'], 1)
+        self.assertIsNotNone(self.manager.metrics['last_start_seconds'])
+
+    def test_relaunch_jvm_when_health_check_fails(self, JavaGatewayMock, launch_mock, _):
+        gateway = self.manager.get()
+        gateway.jvm.java.lang.System.currentTimeMillis.side_effect = Exception("JVM died")
+        self.manager.last_health_check = 0
+        self.manager.get()
+        self.assertEqual(launch_mock.call_count, 2)
+        self.assertEqual(self.manager.metrics['failed_health_checks'], 1)
+
+    def test_shutdown_does_nothing_if_jvm_never_launched(self, JavaGatewayMock, launch_mock, _):
+        self.manager.shutdown()
+        self.assertEqual(launch_mock.call_count, 0)
+        self.assertEqual(JavaGatewayMock.call_count, 0)
+
+    def test_proxy_resolves_java_object_lazily(self, JavaGatewayMock, launch_mock, _):
+        proxy = JavaProxy(lambda gateway: gateway.jvm.Realiser, manager=self.manager)
+        self.assertEqual(launch_mock.call_count, 0)
+        proxy.resolve()
+        self.assertEqual(launch_mock.call_count, 1)
+
+    def test_proxy_resolves_java_object_again_after_jvm_relaunch(
+            self, JavaGatewayMock, launch_mock, _):
+        JavaGatewayMock.side_effect = lambda **kwargs: mock.MagicMock()
+        proxy = JavaProxy(lambda gateway: gateway.jvm.Realiser, manager=self.manager)
+        first_object = proxy.resolve()
+        self.assertIs(proxy.resolve(), first_object)
+
+        self.manager.gateway.jvm.java.lang.System.currentTimeMillis.side_effect =\
+            Exception("JVM died")
+        self.manager.last_health_check = 0
+        self.assertIsNot(proxy.resolve(), first_object)
+        self.assertIs(proxy.resolve(), self.manager.gateway.jvm.Realiser)
+
+    def test_proxy_method_calls_are_timed(self, JavaGatewayMock, launch_mock, _):
+        java_object = mock.Mock()
+        java_object.realiseSentence = mock.Mock(spec=JavaMember, return_value="A sentence.")
+        proxy = JavaProxy(lambda gateway: java_object, manager=self.manager)
+        self.assertEqual(proxy.realiseSentence("clause"), "A sentence.")
+        self.assertEqual(java_object.realiseSentence.call_args, mock.call("clause"))
+        self.assertEqual(self.manager.metrics['calls'], 1)
+        self.assertIsNotNone(self.manager.metrics['last_call_seconds'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+import threading
+
+from tutorons.common.javascript import lex_javascript, parse_javascript, get_lexer, get_parser
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+def _describe(tokens):
+    return [(token.type, token.value, token.lexpos) for token in tokens]
+
+
+class LexJavascriptTest(unittest.TestCase):
+
+    def test_lex_tokens(self):
+        tokens, lexed = lex_javascript("var s = 'a' / 2;")
+        self.assertTrue(lexed)
+        self.assertEqual([t.type for t in tokens], ['VAR', 'ID', 'EQ', 'STRING', 'DIV', 'NUMBER', 'SEMI'])
+
+    def test_lexer_is_reset_between_inputs(self):
+        lex_javascript("x = 'unterminated")
+        # If state was carried over from the last input, the '/' would be read
+        # as a division rather than the start of a regular expression.
+        lex_javascript("a = b")
+        tokens, lexed = lex_javascript("/ab+c/g.test(s)")
+        self.assertTrue(lexed)
+        self.assertEqual(_describe(tokens)[0], ('REGEX', '/ab+c/g', 0))
+
+    def test_read_tokens_before_unterminated_string(self):
+        tokens, _ = lex_javascript("f('a'); x = 'unterminated")
+        self.assertIn(('STRING', "'a'", 2), _describe(tokens))
+
+
+class ParseJavascriptTest(unittest.TestCase):
+
+    def test_parser_reads_same_tokens_as_lexer(self):
+        text = "if (x)\n/re/.exec(y)\nvar z = a / b\nreturn"
+        parsed, parsed_tokens = parse_javascript(text)
+        self.assertTrue(parsed)
+        lexed_tokens, _ = lex_javascript(text)
+        self.assertEqual(_describe(parsed_tokens), _describe(lexed_tokens))
+
+    def test_parser_can_be_reused_after_error(self):
+        parsed, _ = parse_javascript("x = {")
+        self.assertFalse(parsed)
+        parsed, tokens = parse_javascript("x = 1;")
+        self.assertTrue(parsed)
+        self.assertEqual([t.type for t in tokens], ['ID', 'EQ', 'NUMBER', 'SEMI'])
+
+    def test_instances_are_reused_within_thread_but_not_shared_between_threads(self):
+        self.assertIs(get_parser(), get_parser())
+        self.assertIs(get_lexer(), get_lexer())
+        other_thread_instances = []
+        thread = threading.Thread(target=lambda: other_thread_instances.append(get_parser()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other_thread_instances[0], get_parser())
@@ -0,0 +1,115 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+import random
+import os
+import sys
+
+from tutorons.common.extractor import scan_javascript_literals
+from tutorons.common.javascript import lex_javascript
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+SNIPPETS = [
+    "var s = 'a' / 2;",
+    "a = b / c / d",
+    "x = /ab+c/gi.test(y)",
+    "return /re/.exec(s)",
+    "if (x) /re/.exec(y)",
+    "if (x)\n/re/.exec(y)",
+    "a\n/re/g",
+    "a /* comment */ / 2",
+    "f() // comment / not a regex\n/re/",
+    "x = y++ / 2; z = y-- / 3",
+    "x = this / 2; y = true / 3; z = null / 4",
+    "x = typeof /re/",
+    "o = {get a() { return 1 }, set b(v) {}}",
+    "x = a[1] / 2 + (b) / 3 + {} / 4",
+    "x = 1.5 / .5 / 0x1f / 012 / 1e3",
+    "s = \"double \\\"escaped\\\" quote\" + 'single \\' quote'",
+    "s = 'line\\\ncontinuation'",
+    "s = '\\x41\\u0041'",
+    "s = '\\0'",
+    "x = 'unterminated",
+    "a = # / 2 /",
+    "a = 'b' # /c/",
+    "x = /[/]/.test(y)",
+    "x = /a\\/b/g",
+    "x = a /= 2",
+    "x = /=/",
+    "/* unterminated comment / b",
+    "é = 1 / 2",
+    "x = 1 /",
+    "$ / _ / 'a'",
+]
+
+
+def _lex_literals(text):
+    # slimit prints a message for every character it can't read.
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        tokens, _ = lex_javascript(text)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return [(t.type, t.value, t.lexpos) for t in tokens if t.type in ('STRING', 'REGEX')]
+
+
+def _scan_literals(text):
+    literals, _ = scan_javascript_literals(text)
+    return [tuple(literal) for literal in literals]
+
+
+class ScanJavascriptLiteralsTest(unittest.TestCase):
+
+    def test_find_strings_and_regexes(self):
+        literals, scanned = scan_javascript_literals("x = 'a' + \"b\"; y = /re/g")
+        self.assertTrue(scanned)
+        self.assertEqual([tuple(l) for l in literals], [
+            ('STRING', "'a'", 4),
+            ('STRING', '"b"', 10),
+            ('REGEX', '/re/g', 19),
+        ])
+
+    def test_tell_division_from_regex(self):
+        self.assertEqual(_scan_literals("a = b / c / d"), [])
+        self.assertEqual(_scan_literals("return /c/"), [('REGEX', '/c/', 7)])
+
+    def test_stop_at_unterminated_regex(self):
+        literals, scanned = scan_javascript_literals("x = 'a'; y = /unterminated")
+        self.assertFalse(scanned)
+        self.assertEqual([tuple(l) for l in literals], [('STRING', "'a'", 4)])
+
+    def test_skip_template_literals(self):
+        self.assertEqual(_scan_literals("x = `it's /not/ a 'string'`"), [])
+
+    def test_scan_expressions_embedded_in_template_literals(self):
+        text = "x = `a ${ {k: 'v'}.k + f(/re/) } b` / 2"
+        self.assertEqual(_scan_literals(text), [
+            ('STRING', "'v'", 14),
+            ('REGEX', '/re/', 25),
+        ])
+
+    def test_find_same_literals_as_slimit_lexer(self):
+        for text in SNIPPETS:
+            self.assertEqual(_scan_literals(text), _lex_literals(text), text)
+
+    def test_find_same_literals_as_slimit_lexer_in_random_code(self):
+        pieces = [
+            'a', 'x', ' ', '\t', '\n', '/', '/', '(', ')', '{', '}', '[', ']', '*', '+', '++',
+            '--', '=', '.5', '1', '0x1f', "'s'", '"d\\"q"', "'", '"', '\\', '\\\n', '#', 'é',
+            'return', 'typeof', 'this', 'true', 'get', 'set', '/re/g', '//c', '/*c*/', '/*',
+        ]
+        rand = random.Random(0)
+        for _ in range(2000):
+            text = ''.join(rand.choice(pieces) for _ in range(rand.randint(1, 20)))
+            self.assertEqual(_scan_literals(text), _lex_literals(text), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
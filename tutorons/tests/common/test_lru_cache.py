@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from tutorons.common.util import LruCache
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class LruCacheTest(unittest.TestCase):
+
+    def test_get_stored_value(self):
+        cache = LruCache(2)
+        cache.put('key', 'value')
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertEqual(cache.hits, 1)
+
+    def test_return_default_on_miss(self):
+        cache = LruCache(2)
+        self.assertEqual(cache.get('key', 'default'), 'default')
+        self.assertEqual(cache.misses, 1)
+
+    def test_evict_least_recently_used_entry(self):
+        cache = LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_track_size_of_entries(self):
+        cache = LruCache(2, sizeof=lambda key, value: len(value))
+        cache.put('a', 'xx')
+        cache.put('b', 'yyy')
+        cache.put('a', 'z')
+        self.assertEqual(cache.size, 4)
+        cache.put('c', 'wwww')
+        self.assertEqual(cache.size, 5)
+
+    def test_report_hit_rate(self):
+        cache = LruCache(2)
+        self.assertIsNone(cache.stats()['hit_rate'])
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b')
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
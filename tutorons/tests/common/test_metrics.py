@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+from django.contrib.auth.models import User
+from django.test import TestCase, Client
+
+from tutorons.common.extractor import CommandExtractor, command_spans
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class MetricsTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        command_spans.clear()
+
+    def tearDown(self):
+        # Other tests expect to start with no command spans cached
+        command_spans.clear()
+
+    def test_staff_see_command_spans_cache_stats(self):
+        User.objects.create_superuser('admin', 'admin@test.com', 'password')
+        self.client.login(username='admin', password='password')
+        extractor = CommandExtractor('wget')
+        extractor._get_command_spans('wget http://google.com')
+        extractor._get_command_spans('wget http://google.com')
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        stats = json.loads(response.content)['bash_command_spans_cache']
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertGreater(stats['size'], 0)
+
+    def test_metrics_hidden_from_anonymous_users(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/admin/login/', response['Location'])
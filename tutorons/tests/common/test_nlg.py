@@ -0,0 +1,67 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from tutorons.common.nlg import factory, realiser, Feature, NumberAgreement
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class RealiseNounPhraseTest(unittest.TestCase):
+
+    def _plural_noun(self, noun):
+        phrase = factory.createNounPhrase(noun)
+        phrase.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+        return realiser.realise(phrase)
+
+    def test_pluralize_regular_nouns(self):
+        self.assertEqual(self._plural_noun('element'), 'elements')
+        self.assertEqual(self._plural_noun('bolded text segment'), 'bolded text segments')
+        self.assertEqual(self._plural_noun('box'), 'boxes')
+        self.assertEqual(self._plural_noun('entry'), 'entries')
+
+    def test_pluralize_irregular_nouns(self):
+        self.assertEqual(self._plural_noun('child'), 'children')
+
+    def test_indefinite_article_agrees_with_first_word(self):
+        phrase = factory.createNounPhrase('attribute')
+        phrase.setDeterminer('a')
+        self.assertEqual(realiser.realise(phrase), 'an attribute')
+        phrase.addPreModifier("'name'")
+        self.assertEqual(realiser.realise(phrase), "a 'name' attribute")
+
+
+class RealiseClauseTest(unittest.TestCase):
+
+    def _clause(self, verb, object_):
+        clause = factory.createClause()
+        clause.setVerb(factory.createVerbPhrase(verb))
+        clause.setObject(factory.createNounPhrase(object_))
+        return clause
+
+    def test_verb_agrees_with_clause_number(self):
+        clause = self._clause('belong to', "class 'klazz'")
+        self.assertEqual(realiser.realise(clause), "belongs to class 'klazz'")
+        clause.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+        self.assertEqual(realiser.realise(clause), "belong to class 'klazz'")
+
+    def test_coordinated_complement_clauses_are_subordinate(self):
+        noun = factory.createNounPhrase('element')
+        coordinated_phrase = factory.createCoordinatedPhrase()
+        coordinated_phrase.setFeature(Feature.NUMBER, NumberAgreement.PLURAL)
+        coordinated_phrase.addCoordinate(self._clause('match', "'a'"))
+        coordinated_phrase.addCoordinate(self._clause('match', "'b'"))
+        coordinated_phrase.addCoordinate(self._clause('have', "'c'"))
+        noun.addComplement(coordinated_phrase)
+        self.assertEqual(
+            realiser.realise(noun),
+            "element that match 'a', that match 'b' and that have 'c'"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
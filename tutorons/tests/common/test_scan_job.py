@@ -0,0 +1,199 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+import datetime
+import os
+import shutil
+import tempfile
+import threading
+import time
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import SimpleTestCase, TestCase, Client, override_settings
+from django.utils import timezone
+
+from tutorons.common.jobs import scan_job_runner
+from tutorons.common.models import ScanJob
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+# Long enough that scanning it takes several times `jobs.SAVE_INTERVAL`
+LONG_DOCUMENT = "<html><body>" + "".join(
+    "<code>div.c%d > a[href^='http://'] { color: red; }</code>" % i for i in range(300)
+) + "</body></html>"
+DOCUMENT = "".join([
+    "<html> <body> <code>",
+    " p { background-color: lightblue; }  ",
+    "h1 {color: navy; margin-left: 20px;} ",
+    "</code> </body> </html>"
+])
+
+
+@override_settings(SCAN_JOB_WORKERS=0, ASYNC_SCAN_MIN_DOCUMENT_SIZE=len(DOCUMENT))
+class ScanJobTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def _scan(self, document, allow_async=True):
+        data = {'origin': 'www.test.com', 'document': document}
+        if allow_async:
+            data['allow_async'] = 'true'
+        return self.client.post('/css/scan', data=data)
+
+    def test_scan_short_document_before_responding(self):
+        response = self._scan(DOCUMENT[:-1])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)['regions']), 2)
+
+    def test_scan_long_document_before_responding_if_client_does_not_allow_job(self):
+        response = self._scan(DOCUMENT, allow_async=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)['regions']), 2)
+
+    def test_start_job_for_long_document(self):
+        response = self._scan(DOCUMENT)
+        self.assertEqual(response.status_code, 202)
+        content = json.loads(response.content)
+        self.assertNotIn('regions', content)
+        self.assertTrue(content['job_url'].endswith('/api/v1/scan_job/' + content['job_id'] + '/'))
+
+        job_response = self.client.get('/api/v1/scan_job/' + content['job_id'] + '/')
+        job = json.loads(job_response.content)
+        self.assertEqual(job['status'], ScanJob.DONE)
+        self.assertEqual(job['region_count'], 2)
+        self.assertEqual(job['query_id'], content['query_id'])
+        self.assertEqual(
+            [r['node'] for r in job['regions']],
+            ['HTML > BODY:nth-of-type(1) > CODE:nth-of-type(1)'] * 2)
+
+    def test_get_only_regions_after_those_already_seen(self):
+        job_id = json.loads(self._scan(DOCUMENT).content)['job_id']
+        job_response = self.client.get('/api/v1/scan_job/' + job_id + '/', {'since': 1})
+        job = json.loads(job_response.content)
+        self.assertEqual(len(job['regions']), 1)
+        self.assertEqual(job['region_count'], 2)
+
+    def test_malformed_poll_arguments_are_bad_request(self):
+        job_id = json.loads(self._scan(DOCUMENT).content)['job_id']
+        for arguments in [{'since': 'x'}, {'wait': 'x'}, {'since': -1}, {'wait': 'nan'}]:
+            job_response = self.client.get('/api/v1/scan_job/' + job_id + '/', arguments)
+            self.assertEqual(job_response.status_code, 400)
+
+    def test_missing_job_not_found(self):
+        response = self.client.get('/api/v1/scan_job/0123456789abcdef0123456789abcdef/')
+        self.assertEqual(response.status_code, 404)
+
+    def _make_old(self, job_id, **fields):
+        old_time = timezone.now() - datetime.timedelta(days=2)
+        ScanJob.objects.filter(id=job_id).update(**dict((f, old_time) for f in fields))
+
+    def test_lost_job_marked_failed_when_polled(self):
+        job = ScanJob.objects.create(status=ScanJob.RUNNING)
+        self._make_old(job.id, updated_time=True)
+        job_response = self.client.get('/api/v1/scan_job/' + job.id.hex + '/')
+        self.assertEqual(json.loads(job_response.content)['status'], ScanJob.FAILED)
+
+    def test_recent_unfinished_job_not_failed(self):
+        job = ScanJob.objects.create(status=ScanJob.PENDING)
+        job_response = self.client.get('/api/v1/scan_job/' + job.id.hex + '/')
+        self.assertEqual(json.loads(job_response.content)['status'], ScanJob.PENDING)
+
+    def test_job_failed_if_scan_raises(self):
+
+        def scan_regions():
+            yield {'node': 'HTML'}
+            raise ValueError("Scan failed")
+
+        job = scan_job_runner.submit(None, scan_regions)
+        job = ScanJob.objects.get(id=job.id)
+        self.assertEqual(job.status, ScanJob.FAILED)
+        self.assertEqual(json.loads(job.regions), [{'node': 'HTML'}])
+
+    def test_delete_old_jobs(self):
+        old_job = ScanJob.objects.create(status=ScanJob.DONE)
+        self._make_old(old_job.id, created_time=True)
+        scan_job_runner.last_cleanup_time = None
+        new_job_id = json.loads(self._scan(DOCUMENT).content)['job_id']
+        self.assertEqual([j.id.hex for j in ScanJob.objects.all()], [new_job_id])
+
+
+@override_settings(SCAN_JOB_WORKERS=2, ASYNC_SCAN_MIN_DOCUMENT_SIZE=1)
+class ScanJobThreadsTest(SimpleTestCase):
+    '''
+    Run scan jobs in a real pool of threads.  Each thread has its own database connection,
+    and the in-memory test database can't be shared between connections, so the test runs
+    against a database file.
+    '''
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database_settings = connections.databases['default']
+        self.test_database_name = self.database_settings['NAME']
+
+    def tearDown(self):
+        self.database_settings['NAME'] = self.test_database_name
+        if scan_job_runner.pool is not None:
+            scan_job_runner.pool.close()
+            scan_job_runner.pool.join()
+            scan_job_runner.pool = None
+        shutil.rmtree(self.directory)
+
+    def _run_with_database_file(self, function):
+        '''
+        Run a function in a new thread, so that it and the scan jobs it starts connect to
+        a database file.  This thread keeps its connection to the test database.
+        '''
+        self.database_settings['NAME'] = os.path.join(self.directory, 'db.sqlite3')
+        results = []
+
+        def run():
+            try:
+                call_command('migrate', verbosity=0)
+                results.append(function())
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertEqual(len(results), 1, "The function failed; see the error above")
+        return results[0]
+
+    def _scan_and_poll(self):
+        client = Client()
+        response = json.loads(client.post('/css/scan', data={
+            'origin': 'www.test.com',
+            'document': LONG_DOCUMENT,
+            'allow_async': 'true',
+        }).content)
+        job_path = '/api/v1/scan_job/' + response['job_id'] + '/'
+
+        polls = []
+        regions = []
+        while True:
+            start_time = time.time()
+            job = json.loads(client.get(job_path, {'since': len(regions), 'wait': 10}).content)
+            polls.append((job['status'], job['region_count'], time.time() - start_time))
+            regions.extend(job['regions'])
+            if job['status'] in (ScanJob.DONE, ScanJob.FAILED):
+                return polls, regions
+
+    def test_poll_regions_while_job_runs(self):
+        polls, regions = self._run_with_database_file(self._scan_and_poll)
+
+        # The job saved some of its regions before it finished
+        self.assertEqual(polls[-1][:2], (ScanJob.DONE, 300))
+        self.assertTrue(any(status == ScanJob.RUNNING and 0 < count < 300
+                            for status, count, _ in polls))
+        # Long polls returned as soon as there were new regions, not after waiting out 'wait'
+        self.assertTrue(all(seconds < 10 for _, _, seconds in polls))
+        # Each region was returned once, in order
+        self.assertEqual(len(regions), 300)
+        self.assertEqual(
+            [r['node'] for r in regions[:2]],
+            ['HTML > BODY:nth-of-type(1) > CODE:nth-of-type(1)',
+             'HTML > BODY:nth-of-type(1) > CODE:nth-of-type(2)'])
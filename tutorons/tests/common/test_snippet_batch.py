@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+from django.test import TestCase, Client
+
+from tutorons.common.models import Region as RegionModel, ServerQuery
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class SnippetBatchTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def _explain(self, path, text):
+        response = self.client.post(path, {'origin': 'www.test.com', 'text': text})
+        return json.loads(response.content)['region']['document']
+
+    def _explain_batch(self, path, items):
+        return self.client.post(path, {'origin': 'www.test.com', 'items': json.dumps(items)})
+
+    def test_explain_batch_in_order(self):
+        response = self._explain_batch('/python/explain_batch', [
+            {'text': 'zip'}, {'text': 'len'}, {'text': 'zip()'}])
+        documents = [r['document'] for r in json.loads(response.content)['regions']]
+        self.assertEqual(
+            documents,
+            [self._explain('/python/explain', t) for t in ['zip', 'len', 'zip()']])
+
+    def test_explain_batch_for_many_tutorons(self):
+        response = self._explain_batch('/explain_batch', [
+            {'tutoron': 'python', 'text': 'zip'},
+            {'tutoron': 'css', 'text': 'div.content'},
+        ])
+        regions = json.loads(response.content)['regions']
+        self.assertEqual([r['tutoron'] for r in regions], ['python', 'css'])
+        self.assertEqual(regions[0]['document'], self._explain('/python/explain', 'zip'))
+        self.assertEqual(regions[1]['document'], self._explain('/css/explain', 'div.content'))
+
+    def test_log_batch_as_one_query(self):
+        response = self._explain_batch('/python/explain_batch', [{'text': 'zip'}, {'text': 'len'}])
+        content = json.loads(response.content)
+        self.assertEqual(ServerQuery.objects.count(), 1)
+        self.assertEqual(
+            list(RegionModel.objects.order_by('id').values_list('string', 'query_id')),
+            [('zip', content['sq_id']), ('len', content['sq_id'])])
+        self.assertEqual(
+            [r['region_id'] for r in content['regions']],
+            list(RegionModel.objects.order_by('id').values_list('id', flat=True)))
+
+    def test_malformed_batch_is_bad_request(self):
+        for items in [
+                [{'tutoron': 'python'}],
+                [{'text': 'zip', 'edge_size': 'a'}],
+                [{'tutoron': 'java', 'text': 'zip'}],
+                {'text': 'zip'}]:
+            response = self._explain_batch('/explain_batch', items)
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(ServerQuery.objects.count(), 0)
+
+    def test_tutoron_required_when_batch_is_for_many_tutorons(self):
+        response = self._explain_batch('/explain_batch', [{'text': 'zip'}])
+        self.assertEqual(response.status_code, 400)
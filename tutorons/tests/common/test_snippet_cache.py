@@ -0,0 +1,98 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import json
+from django.conf import settings
+from django.test import TestCase, Client
+
+from tutorons.common.models import Region as RegionModel, ServerQuery
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class CacheableSnippetExplanationTest(TestCase):
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_get_explanation_same_as_post(self):
+        post_response = self.client.post('/python/explain', {'origin': 'www.test.com', 'text': 'zip'})
+        get_response = self.client.get('/python/explain', {'text': 'zip'})
+        self.assertEqual(get_response.status_code, 200)
+        self.assertEqual(
+            json.loads(get_response.content)['region']['document'],
+            json.loads(post_response.content)['region']['document'])
+
+    def test_get_explanation_is_cacheable(self):
+        response = self.client.get('/python/explain', {'text': 'zip'})
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('max-age=', response['Cache-Control'])
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertEqual(self.client.get('/python/explain', {'text': 'zip'})['ETag'], response['ETag'])
+
+    def test_different_snippets_have_different_etags(self):
+        zip_response = self.client.get('/python/explain', {'text': 'zip'})
+        len_response = self.client.get('/python/explain', {'text': 'len'})
+        self.assertNotEqual(zip_response['ETag'], len_response['ETag'])
+
+    def test_not_modified_if_client_has_explanation(self):
+        etag = self.client.get('/python/explain', {'text': 'zip'})['ETag']
+        response = self.client.get('/python/explain', {'text': 'zip'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_modified_if_client_has_other_explanation(self):
+        response = self.client.get('/python/explain', {'text': 'zip'}, HTTP_IF_NONE_MATCH='"abc"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_redirect_to_normalized_text(self):
+        response = self.client.get('/python/explain', {'text': '  zip\r\n'})
+        self.assertEqual(response.status_code, 301)
+        self.assertTrue(response['Location'].endswith('/python/explain?text=zip'))
+
+    def test_keep_whitespace_in_edges_of_snippet(self):
+        data = {'text': '   p.klazz {}', 'edge_size': 3}
+        get_response = self.client.get('/css/explain', data)
+        post_response = self.client.post('/css/explain', dict(data, origin='www.test.com'))
+        self.assertEqual(get_response.status_code, 200)
+        document = json.loads(get_response.content)['region']['document']
+        self.assertEqual(document, json.loads(post_response.content)['region']['document'])
+        self.assertNotIn("could not be explained", document)
+
+    def test_errors_are_cached_briefly(self):
+        explanation_response = self.client.get('/python/explain', {'text': 'zip'})
+        error_response = self.client.get('/python/explain', {'text': 'notabuiltin'})
+        self.assertIn(
+            'max-age=%d' % settings.EXPLANATION_MAX_AGE, explanation_response['Cache-Control'])
+        self.assertIn(
+            'max-age=%d' % settings.EXPLANATION_ERROR_MAX_AGE, error_response['Cache-Control'])
+
+    def test_get_explanation_not_logged(self):
+        self.client.get('/python/explain', {'text': 'zip'})
+        self.assertEqual(ServerQuery.objects.count(), 0)
+
+    def test_beacon_logs_explanation(self):
+        beacon_url = json.loads(
+            self.client.get('/python/explain', {'text': 'zip'}).content)['beacon_url']
+        self.assertTrue(beacon_url.endswith('/python/explain_beacon'))
+
+        response = self.client.post(
+            '/python/explain_beacon', {'origin': 'www.test.com', 'text': 'zip'})
+        ids = json.loads(response.content)
+        region = RegionModel.objects.get(id=ids['region_id'])
+        self.assertEqual(region.query_id, ids['query_id'])
+        self.assertEqual(region.string, 'zip')
+
+    def test_get_explanation_without_text_is_bad_request(self):
+        self.assertEqual(self.client.get('/python/explain').status_code, 400)
+
+    def test_malformed_edge_size_is_bad_request(self):
+        response = self.client.get('/python/explain', {'text': 'zip', 'edge_size': 'x'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post(
+            '/python/explain', {'origin': 'www.test.com', 'text': 'zip', 'edge_size': 'x'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+import logging
+import sys
+import unittest
+from multiprocessing.pool import ThreadPool
+
+from tutorons.common.artifacts import ArtifactStore
+from tutorons.common.extractor import CommandExtractor
+from tutorons.common.htmltools import HtmlDocument
+from tutorons.common.scanner import NodeScanner
+from tutorons.css.explain import explain as explain_css
+from tutorons.regex.examples import get_examples
+from tutorons.regex.extract import JavascriptRegexExtractor
+from tutorons.regex.parse import describe_regex
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+THREAD_COUNT = 8
+ROUNDS = 10
+
+PATTERNS = [
+    r'^[a-z0-9_-]{3,16}$', r'[\w\-\.]+@[a-z]+\.[a-z]{2,3}', r'(foo|bar|baz)+(\.txt|\.log)?',
+    r'([0-9A-F]{2}[:-]){5}([0-9A-F]{2})', r'[^aeiou\s]{2,}ing\b', r'a{5000}',
+]
+
+DOCUMENTS = [
+    "<pre>wget -r -np http://example.com/files/<br>wget -O out.html http://google.com</pre>",
+    "<code>$ wget --mirror http://example.com</code><p>Not wget http://example.com</p>",
+    "<pre>var r = /ab+c/gi; s = 'str'.replace(/\\s+/g, ' ');</pre>",
+    "<pre>if (x) /re/.exec(y) / 2; z = a / b / c;</pre>",
+]
+
+SELECTORS = [
+    "div.content", "#main-nav li > a", "input[type='text']:checked", "a[href^='http://']",
+]
+
+
+def _scan(document):
+    artifacts = ArtifactStore()
+    regions = []
+    for extractor in [CommandExtractor('wget', artifacts), JavascriptRegexExtractor(artifacts)]:
+        scanner = NodeScanner(extractor, ['code', 'pre'], artifacts)
+        regions.extend(r.string for r in scanner.scan(HtmlDocument(document)))
+    return regions
+
+
+def _get_examples(pattern):
+    return get_examples(pattern, 4, ["aaaa", "bbbb", "gfed", "yxxy"])
+
+
+class ConcurrentPipelineTest(unittest.TestCase):
+    '''
+    Run each stage of the scan and explain pipeline in many threads at once, and check
+    that every call gets the same result it gets when nothing else is running.
+    '''
+    def setUp(self):
+        # Switch between threads as often as possible to make races more likely
+        self.check_interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+
+    def tearDown(self):
+        sys.setcheckinterval(self.check_interval)
+
+    def _assert_same_results_in_threads(self, function, inputs):
+        expected = [function(input_) for input_ in inputs]
+        pool = ThreadPool(THREAD_COUNT)
+        try:
+            results = pool.map(function, inputs * ROUNDS, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertEqual(results, expected * ROUNDS)
+
+    def test_describe_regexes(self):
+        self._assert_same_results_in_threads(describe_regex, PATTERNS)
+
+    def test_generate_regex_examples(self):
+        self._assert_same_results_in_threads(_get_examples, PATTERNS)
+
+    def test_scan_documents(self):
+        self._assert_same_results_in_threads(_scan, DOCUMENTS)
+
+    def test_explain_css_selectors(self):
+        self._assert_same_results_in_threads(explain_css, SELECTORS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,8 @@ from __future__ import unicode_literals
 import logging
 import unittest
 
-from tutorons.css.detect import JavascriptSelectorExtractor
+from tutorons.css.detect import JavascriptSelectorExtractor, StylesheetSelectorExtractor,\
+    is_selector, could_be_selector, _parse_selector_and_check, selector_verdicts
 from tutorons.common.htmltools import HtmlDocument
 
 
@@ -43,3 +44,74 @@ class SelectorExtractionTest(unittest.TestCase):
     def test_skip_regular_expression(self):
         regions = self.extractor.extract(HtmlDocument("<code>var b = '^ab*';</code>"))
         self.assertEqual(len(regions), 0)
+
+
+class SelectorPrescreenTest(unittest.TestCase):
+
+    def test_reject_strings_that_start_with_non_html_words(self):
+        self.assertFalse(could_be_selector("use strict"))
+        self.assertFalse(could_be_selector("click"))
+        self.assertFalse(could_be_selector("http://example.com"))
+
+    def test_reject_strings_that_start_with_non_selector_characters(self):
+        self.assertFalse(could_be_selector("/static/js/app.js"))
+        self.assertFalse(could_be_selector("%s: %d"))
+
+    def test_pass_selectors_to_full_check(self):
+        self.assertTrue(could_be_selector("p"))
+        self.assertTrue(could_be_selector("input.klazz"))
+        self.assertTrue(could_be_selector("  ul li:first-child"))
+        self.assertTrue(could_be_selector("svg|a"))
+        self.assertTrue(could_be_selector("[href^='http://']"))
+
+    def test_never_reject_strings_that_parse_as_selectors(self):
+        strings = [
+            "p", "div.content", "#main-nav li > a", "input[type='text']", ".klazz",
+            "a[href^='http://']", "*", "*|a", "a,b", "p ~ p", "td:nth-child(2n)", "",
+            "use strict", "nothtml", "^ab*", "3d", "-a", "a\\:b", "Loading...",
+        ]
+        for string in strings:
+            if _parse_selector_and_check(string):
+                self.assertTrue(could_be_selector(string), string)
+
+    def test_remember_verdicts(self):
+        selector_verdicts.clear()
+        is_selector("p.klazz")
+        is_selector("p.klazz")
+        self.assertEqual(selector_verdicts.hits, 1)
+        self.assertEqual(selector_verdicts.misses, 1)
+
+
+class StylesheetSelectorExtractionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.extractor = StylesheetSelectorExtractor()
+
+    def test_find_offsets_of_selectors_on_later_lines(self):
+        node = HtmlDocument('\n'.join([
+            '<pre>p { color: red; }',
+            '',
+            '  div.klazz { color: blue; }</pre>',
+        ])).pre
+        regions = self.extractor.extract(node)
+        self.assertEqual(len(regions), 2)
+        self.assertEqual(regions[1].start_offset, 21)
+        self.assertEqual(regions[1].end_offset, 29)
+        self.assertEqual(regions[1].string, 'div.klazz')
+
+    def test_keep_valid_selector_after_invalid_selector(self):
+        node = HtmlDocument('\n'.join([
+            '<pre>nothtml { color: red; }',
+            'p { color: blue; }</pre>',
+        ])).pre
+        regions = self.extractor.extract(node)
+        self.assertEqual(len(regions), 1)
+        self.assertEqual(regions[0].string, 'p')
+
+    def test_skip_at_rules(self):
+        node = HtmlDocument('\n'.join([
+            '<pre>@media print { p { color: red; } }',
+            'div { color: blue; }</pre>',
+        ])).pre
+        regions = self.extractor.extract(node)
+        self.assertEqual([r.string for r in regions], ['div'])
@@ -414,3 +414,47 @@ class HtmlRendererTest(unittest.TestCase):
             "&lt;a href=\"&lt;pattern&gt;\"&gt;<br>",
             "&lt;/a&gt;<br>",
         ]))
+
+    def test_render_attributes_in_order_with_quotes_escaped(self):
+        element = P('<div title=\'say "hi"\' class="b  a" ID="x"></div>')
+        html = self._render(element)
+        self.assertEqual(html, '\n'.join([
+            "&lt;div class=\"b a\" id=\"x\" title='say \"hi\"'&gt;<br>",
+            "&lt;/div&gt;<br>",
+        ]))
+
+    def test_render_comment_and_text_on_their_own_lines(self):
+        element = P('<p><!--A comment-->Some text</p>')
+        html = self._render(element, indent_level=2)
+        self.assertEqual(html, '\n'.join([
+            "&lt;p&gt;<br>",
+            "&nbsp;&nbsp;&lt;!--A comment--&gt;<br>",
+            "&nbsp;&nbsp;Some text<br>",
+            "&lt;/p&gt;<br>",
+        ]))
+
+    def test_render_namespaced_element_with_namespace_declaration(self):
+        element = P('<ns:p xmlns:ns="https://namespace-site.com"></ns:p>', parser='xml')
+        html = self._render(element)
+        self.assertEqual(html, '\n'.join([
+            "&lt;ns:p xmlns:ns=\"https://namespace-site.com\"&gt;<br>",
+            "&lt;/ns:p&gt;<br>",
+        ]))
+
+    def test_render_preformatted_contents_inline(self):
+        element = P('<pre><mark>first line</mark>\nsecond line</pre>')
+        html = self._render(element)
+        self.assertEqual(html, '\n'.join([
+            "&lt;pre&gt;<span class='tutoron_selection'>first line</span><br>",
+            "second line&lt;/pre&gt;<br>",
+        ]))
+
+    def test_render_generated_content_given_as_html_string(self):
+        html = self._render(P(["<mark>Generated content</mark>", P('<p></p>')[0]]))
+        self.assertEqual(html, '\n'.join([
+            "<span class='tutoron_selection'>",
+            "Generated content<br>",
+            "</span>",
+            "&lt;p&gt;<br>",
+            "&lt;/p&gt;<br>",
+        ]))
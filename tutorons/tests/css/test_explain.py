@@ -5,7 +5,7 @@ from __future__ import unicode_literals
 import logging
 import unittest
 
-from tutorons.common.java.simplenlg import realiser
+from tutorons.common.nlg import realiser
 from tutorons.css.explain import explain_attribute, explain_class, explain_hash,\
     explain_type_selector, explain_universal, explain_pseudo, explain_simple_selector_sequence,\
     explain_selector, explain_selectors_group
@@ -32,7 +32,7 @@ class AttributeExplanationTest(unittest.TestCase):
         attribute = parse_selector('[myattr=foo]', 'attribute')
         clause = explain_attribute(attribute)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "has a 'myattr' attribute that equals 'foo'"
         )
 
@@ -40,8 +40,8 @@ class AttributeExplanationTest(unittest.TestCase):
         attribute = parse_selector('[href^=\'http://\']', 'attribute')
         clause = explain_attribute(attribute)
         self.assertEqual(
-            str(realiser.realise(clause)),
-            "has a link that starts with 'http://'"
+            realiser.realise(clause),
+            "has an URL that starts with 'http://'"
         )
 
 
@@ -51,7 +51,7 @@ class ClassExplanationTest(unittest.TestCase):
         class_ = parse_selector('.klazz', 'class_')
         clause = explain_class(class_)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "belongs to class 'klazz'"
         )
 
@@ -62,7 +62,7 @@ class HashExplanationTest(unittest.TestCase):
         hash_ = parse_selector('#my-id', 'hash_')
         clause = explain_hash(hash_)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "has ID 'my-id'"
         )
 
@@ -73,7 +73,7 @@ class UniversalSelectorExplanationTest(unittest.TestCase):
         universal = parse_selector('*', 'universal')
         noun = explain_universal(universal)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'elements'
         )
 
@@ -81,7 +81,7 @@ class UniversalSelectorExplanationTest(unittest.TestCase):
         universal = parse_selector('namespace|*', 'universal')
         noun = explain_universal(universal)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'elements'
         )
 
@@ -92,7 +92,7 @@ class TypeSelectorExplanationTest(unittest.TestCase):
         type_selector = parse_selector('html', 'type_selector')
         noun = explain_type_selector(type_selector)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             '\'html\' elements'
         )
 
@@ -100,7 +100,7 @@ class TypeSelectorExplanationTest(unittest.TestCase):
         type_selector = parse_selector('p', 'type_selector')
         noun = explain_type_selector(type_selector)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'paragraphs'
         )
 
@@ -108,7 +108,7 @@ class TypeSelectorExplanationTest(unittest.TestCase):
         type_selector = parse_selector('namespace|p', 'type_selector')
         noun = explain_type_selector(type_selector)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'paragraphs'
         )
 
@@ -119,7 +119,7 @@ class PseudoclassExplanationTest(unittest.TestCase):
         pseudo = parse_selector(':checked', 'pseudo')
         clause = explain_pseudo(pseudo)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             'is checked'
         )
 
@@ -127,7 +127,7 @@ class PseudoclassExplanationTest(unittest.TestCase):
         pseudo = parse_selector(':ath-child(4n)', 'pseudo')
         clause = explain_pseudo(pseudo)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             'satisfies the function \'ath-child(4n)\''
         )
 
@@ -135,7 +135,7 @@ class PseudoclassExplanationTest(unittest.TestCase):
         pseudo = parse_selector('::before', 'pseudo')
         noun = explain_pseudo(pseudo)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'generated content before the element\'s content'
         )
 
@@ -143,7 +143,7 @@ class PseudoclassExplanationTest(unittest.TestCase):
         pseudo = parse_selector('::cheese', 'pseudo')
         noun = explain_pseudo(pseudo)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'content that matches the pseudo-element \'::cheese\''
         )
 
@@ -154,14 +154,14 @@ class PseudoclassExplanationTest(unittest.TestCase):
         pseudo = parse_selector('::attr(href)', 'pseudo')
         noun = explain_pseudo(pseudo)
         self.assertEqual(
-            str(realiser.realise(noun)),
+            realiser.realise(noun),
             'the value of the \'href\' attribute'
         )
 
     def test_explain_text_pseudoelement(self):
         pseudo = parse_selector('::text', 'pseudo')
         noun = explain_pseudo(pseudo)
-        self.assertEqual(str(realiser.realise(noun)), 'text content')
+        self.assertEqual(realiser.realise(noun), 'text content')
 
 
 class SimpleSelectorSequenceExplanationTest(unittest.TestCase):
@@ -170,16 +170,16 @@ class SimpleSelectorSequenceExplanationTest(unittest.TestCase):
         sequence = parse_selector('p.klazz[href^=\'http://\']', 'simple_selector_sequence')
         clause = explain_simple_selector_sequence(sequence)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all paragraphs that belong to class 'klazz' and that " +
-            "have a link that starts with 'http://'"
+            "have an URL that starts with 'http://'"
         )
 
     def test_shift_subject_with_pseudoelement_and_class(self):
         sequence = parse_selector('.klazz::before', 'simple_selector_sequence')
         clause = explain_simple_selector_sequence(sequence)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "generated content before the element's content for " +
             "all elements that belong to class 'klazz'"
         )
@@ -188,7 +188,7 @@ class SimpleSelectorSequenceExplanationTest(unittest.TestCase):
         sequence = parse_selector('unknown_element', 'simple_selector_sequence')
         clause = explain_simple_selector_sequence(sequence)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all 'unknown_element' elements"
         )
 
@@ -203,7 +203,7 @@ class SelectorExplanationTest(unittest.TestCase):
         selector = parse_selector('.klazz p', 'selector')
         clause = explain_selector(selector)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all paragraphs from elements that belong to class 'klazz'"
         )
 
@@ -211,7 +211,7 @@ class SelectorExplanationTest(unittest.TestCase):
         selector = parse_selector('.klazz > p', 'selector')
         clause = explain_selector(selector)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all paragraphs that are children of elements that belong to class 'klazz'"
         )
 
@@ -219,7 +219,7 @@ class SelectorExplanationTest(unittest.TestCase):
         selector = parse_selector('.klazz + p', 'selector')
         clause = explain_selector(selector)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all paragraphs that are siblings of and that appear right after " +
             "elements that belong to class 'klazz'"
         )
@@ -228,7 +228,7 @@ class SelectorExplanationTest(unittest.TestCase):
         selector = parse_selector('.klazz ~ p', 'selector')
         clause = explain_selector(selector)
         self.assertEqual(
-            str(realiser.realise(clause)),
+            realiser.realise(clause),
             "all paragraphs that are siblings of and that eventually appear " +
             "after elements that belong to class 'klazz'"
         )
@@ -241,10 +241,10 @@ class SelectorsGroupExplanationTest(unittest.TestCase):
         clauses = explain_selectors_group(selectors_group)
         self.assertEqual(len(clauses), 2)
         self.assertEqual(
-            str(realiser.realise(clauses['p'])),
+            realiser.realise(clauses['p']),
             "all paragraphs"
         )
         self.assertEqual(
-            str(realiser.realise(clauses['p > .klazz'])),
+            realiser.realise(clauses['p > .klazz']),
             "all elements that belong to class 'klazz' that are children of paragraphs"
         )
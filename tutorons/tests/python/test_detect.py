@@ -7,6 +7,8 @@ import unittest
 import json
 from django.test import Client
 
+from tutorons.python.detect import find_builtin_calls
+
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 
@@ -96,3 +98,33 @@ class PythonBuiltInDetectionTest(unittest.TestCase):
         r = regions[0]
         self.assertEqual(r['start_index'], 6)
         self.assertEqual(r['end_index'], 8)
+
+
+class FindBuiltinCallsTest(unittest.TestCase):
+
+    def test_find_calls_with_offsets(self):
+        calls = find_builtin_calls("x = 2\nx += abs(len([1, 2]))")
+        self.assertEqual(calls, [('abs', 11), ('len', 15)])
+
+    def test_skip_attributes_definitions_and_names_that_are_not_called(self):
+        calls = find_builtin_calls("def len(x):\n    return x.len() + abs")
+        self.assertEqual(calls, [])
+
+    def test_skip_builtins_in_strings_and_comments(self):
+        calls = find_builtin_calls("s = 'len(x)'  # abs(x)\n'''\nmax(y)\n'''")
+        self.assertEqual(calls, [])
+
+    def test_skip_print_statement(self):
+        self.assertEqual(find_builtin_calls("print(len(x))"), [('len', 6)])
+
+    def test_find_print_function_after_future_import(self):
+        calls = find_builtin_calls("from __future__ import print_function\nprint(x)")
+        self.assertEqual(calls, [('print', 38)])
+
+    def test_find_calls_in_invalid_code(self):
+        calls = find_builtin_calls("$ python script.py\n    len(x)\n  abs(y)")
+        self.assertEqual(calls, [('len', 23), ('abs', 32)])
+
+    def test_find_calls_in_interactive_session(self):
+        calls = find_builtin_calls(">>> len([1, 2])\n2\n>>> for i in range(2):\n...     abs(i)")
+        self.assertEqual(calls, [('len', 4), ('range', 31), ('abs', 49)])
@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+# encoding: utf-8
+
+from __future__ import unicode_literals
+import logging
+import unittest
+import tempfile
+import shutil
+import os.path
+import io
+import json
+import time
+
+from tutorons.python.docstore import DocStore, build_doc_store, write_doc_store
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class DocStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.directory, 'docs.json')
+        self.store_path = os.path.join(self.directory, 'docs.docs')
+        self._write_source({
+            'abs': ["<dt>abs(x)</dt>", "<dd>Absolute value — of x</dd>", "https://docs/abs"],
+            'len': ["<dt>len(s)</dt>", "<dd>Length</dd>", "https://docs/len"],
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write_source(self, documentation):
+        with io.open(self.source_path, 'w', encoding='utf-8') as source_file:
+            source_file.write(json.dumps(documentation, ensure_ascii=False))
+
+    def test_read_documentation_from_built_store(self):
+        build_doc_store(self.source_path, self.store_path)
+        store = DocStore(self.store_path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(set(store.keys()), set(['abs', 'len']))
+        self.assertIn('len', store)
+        self.assertNotIn('max', store)
+        self.assertEqual(
+            store['abs'],
+            ("<dt>abs(x)</dt>", "<dd>Absolute value — of x</dd>", "https://docs/abs"))
+        self.assertEqual(store['len'], ("<dt>len(s)</dt>", "<dd>Length</dd>", "https://docs/len"))
+
+    def test_read_entries_with_any_number_of_fields(self):
+        write_doc_store({'abs': ["<p>abs — rendered</p>"], 'len': []}, self.store_path)
+        store = DocStore(self.store_path)
+        self.assertEqual(store['abs'], ("<p>abs — rendered</p>",))
+        self.assertEqual(store['len'], ())
+
+    def test_fail_to_read_store_that_was_not_built(self):
+        store = DocStore(self.store_path)
+        with self.assertRaises(IOError):
+            store['len']
+        self.assertFalse(os.path.exists(self.store_path))
+
+    def test_build_missing_store_when_first_read(self):
+        build = lambda: build_doc_store(self.source_path, self.store_path)
+        store = DocStore(self.store_path, source_paths=[self.source_path], build_func=build)
+        self.assertEqual(store['len'], ("<dt>len(s)</dt>", "<dd>Length</dd>", "https://docs/len"))
+
+    def test_rebuild_store_older_than_its_source(self):
+        build_doc_store(self.source_path, self.store_path)
+        self._write_source({'len': ["<dt>len(s)</dt>", "<dd>Length, edited</dd>", "https://docs/len"]})
+        store_time = time.time() - 60
+        os.utime(self.store_path, (store_time, store_time))
+
+        build = lambda: build_doc_store(self.source_path, self.store_path)
+        store = DocStore(self.store_path, source_paths=[self.source_path], build_func=build)
+        self.assertEqual(store['len'][1], "<dd>Length, edited</dd>")
+        self.assertNotIn('abs', store)
+
+    def test_reject_file_that_is_not_a_store(self):
+        with open(self.store_path, 'wb') as store_file:
+            store_file.write(b'not a documentation store')
+        store = DocStore(self.store_path)
+        with self.assertRaises(ValueError):
+            len(store)
+
+
+class BuiltinsDocStoreTest(unittest.TestCase):
+
+    def test_builtins_store_includes_documentation_for_builtins(self):
+        from tutorons.python.builtins import explanations
+        header, body, url = explanations['abs']
+        self.assertIn("Return the absolute value of a number.", body)
+        self.assertEqual(url, "https://docs.python.org/2/library/functions.html#abs")
@@ -0,0 +1,31 @@
+#! /usr/bin/env python
+# encoding: utf-8
+
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from tutorons.python.builtins import explanations
+from tutorons.python.render import render, prerender_explanations
+from tutorons.python.views import render_explanation
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class PrerenderExplanationsTest(unittest.TestCase):
+
+    def test_prerender_explanation_for_every_builtin(self):
+        rendered_explanations = prerender_explanations(explanations)
+        self.assertEqual(set(rendered_explanations.keys()), set(explanations.keys()))
+
+    def test_prerendered_explanation_matches_rendered_explanation(self):
+        rendered_explanations = prerender_explanations(explanations)
+        header, explanation, url = explanations['abs']
+        self.assertEqual(rendered_explanations['abs'], render('abs', header, explanation, url))
+
+
+class RenderExplanationTest(unittest.TestCase):
+
+    def test_explanation_from_store_matches_template(self):
+        header, explanation, url = explanations['abs']
+        self.assertEqual(render_explanation('abs'), render('abs', header, explanation, url))
@@ -0,0 +1,84 @@
+#! /usr/bin/env python
+# encoding: utf-8
+
+from __future__ import unicode_literals
+import unittest
+import logging
+import string
+
+from tutorons.regex.charclass import CharacterClass, PRINTABLE
+from tutorons.regex.examples import get_character_class
+from tutorons.regex.nodes import InNode, LiteralNode, RangeNode, NegateNode, CategoryNode,\
+    AnyNode
+from tutorons.regex.tree import PatternTree
+
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+
+class CharacterClassTest(unittest.TestCase):
+
+    def test_list_characters_by_code_point(self):
+        self.assertEqual(CharacterClass.from_chars('cab').chars, 'abc')
+        self.assertEqual(CharacterClass.from_range(ord('x'), ord('z')).chars, 'xyz')
+        self.assertEqual(CharacterClass.from_range(ord('z'), ord('x')).chars, '')
+
+    def test_combine_classes(self):
+        abc = CharacterClass.from_chars('abc')
+        cde = CharacterClass.from_chars('cde')
+        self.assertEqual((abc | cde).chars, 'abcde')
+        self.assertEqual((abc & cde).chars, 'c')
+        self.assertEqual((abc - cde).chars, 'ab')
+
+    def test_check_membership(self):
+        charclass = CharacterClass.from_chars('a!')
+        self.assertIn('a', charclass)
+        self.assertIn('!', charclass)
+        self.assertNotIn('b', charclass)
+        self.assertEqual(len(charclass), 2)
+
+    def test_lower_ascii_letters(self):
+        charclass = CharacterClass.from_chars('aXY1')
+        self.assertEqual(charclass.lower().chars, '1axy')
+
+
+class GetCharacterClassTest(unittest.TestCase):
+
+    def test_union_of_children(self):
+        in_node = InNode("")
+        in_node.children.extend([
+            LiteralNode(ord('d'), ""),
+            RangeNode(ord('e'), ord('g'), ""),
+            CategoryNode("digit", ""),
+        ])
+        self.assertEqual(get_character_class(in_node).chars, string.digits + 'defg')
+
+    def test_negated_class_excludes_children_from_printable_characters(self):
+        in_node = InNode("")
+        in_node.children.extend([
+            NegateNode(""),
+            RangeNode(ord('a'), ord('z'), ""),
+            RangeNode(0, 0x10, ""),
+        ])
+        charclass = get_character_class(in_node)
+        self.assertEqual(len(charclass), len(PRINTABLE) - 26 - len("\t\n\x0b\x0c\r"))
+        for char in 'az\t\n':
+            self.assertNotIn(char, charclass)
+        for char in 'AZ! ':
+            self.assertIn(char, charclass)
+
+    def test_any_excludes_newlines(self):
+        charclass = get_character_class(AnyNode())
+        for char in '\n\r\x0b\x0c':
+            self.assertNotIn(char, charclass)
+        self.assertIn('a', charclass)
+
+    def test_keep_class_on_nodes_of_tree(self):
+        in_node = InNode("")
+        in_node.children.append(LiteralNode(ord('a'), ""))
+        PatternTree(in_node)
+        self.assertIs(get_character_class(in_node), get_character_class(in_node))
+
+
+if __name__ == '__main__':
+    unittest.main()
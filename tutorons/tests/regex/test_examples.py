@@ -12,7 +12,8 @@ import sre_constants
 from tutorons.regex.nodes import InNode, LiteralNode, RepeatNode, BranchNode,\
     ChoiceNode, RangeNode, NegateNode, CategoryNode, GroupNode, AnyNode
 import tutorons.regex.examples as regex_examples
-from tutorons.regex.examples import ExampleVisitor, get_examples
+from tutorons.regex.examples import ExampleVisitor, get_examples, get_pattern_tree,\
+    budget_stats, TRUNCATION_MARKER
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -89,6 +90,13 @@ class UrtestVisitorTest(unittest.TestCase):
         msg = self.visitor.visit_node(any_node)
         self.assertEqual(len(msg), 1)
 
+    def test_examples_of_any_character_fit_on_one_line(self):
+        dictionary = ["aaaa", "bbbb", "gfed", "yxxy"]
+        examples = get_examples('a.{200}b', 4, dictionary, seed=0)
+        for example in examples:
+            for char in '\n\r\x0b\x0c':
+                self.assertNotIn(char, example)
+
 
 class ExampleRepeatsText(unittest.TestCase):
 
@@ -194,6 +202,21 @@ class GenerateMultipleExamplesTest(unittest.TestCase):
         self.assertIn('aaa', texts)
         self.assertIn('bbb', texts)
 
+    def test_generate_examples_for_states_of_shared_tree(self):
+        tree = get_pattern_tree(r'(ab|cd){1,2}')
+        self.assertIs(get_pattern_tree(r'(ab|cd){1,2}'), tree)
+        visitor = ExampleVisitor([])
+        texts = set(visitor.visit(tree, state) for state in tree.get_state_permutations())
+        self.assertEqual(texts, set(['ab', 'cd', 'abab', 'cdcd']))
+
+    def test_generate_same_examples_for_same_pattern(self):
+        patt = r'[a-z]+(ing|ed)? \d{2,4}|[A-Z]\w*'
+        dictionary = ["aaaa", "bbbb", "gfed", "yxxy"]
+        self.assertEqual(get_examples(patt, 4, dictionary), get_examples(patt, 4, dictionary))
+        self.assertEqual(
+            get_examples(patt, 4, dictionary, seed=1),
+            get_examples(patt, 4, dictionary, seed=1))
+
     def test_generate_multiple_repetition_counts(self):
         patt = r'a{3,4}'
         texts = get_examples(patt, 2)
@@ -220,5 +243,40 @@ class PatternTest(unittest.TestCase):
         self.assertTrue(bool(re.match(patt, text)))
 
 
+class ExampleBudgetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.visitor = ExampleVisitor([], max_length=10, max_steps=100)
+        budget_stats.clear()
+
+    def test_truncate_long_repetition_of_subpattern(self):
+        example = self.visitor.visit(get_pattern_tree(r'(ab){5000}'))
+        self.assertEqual(example, 'ababababab' + TRUNCATION_MARKER)
+
+    def test_truncate_long_repetition_of_character_class(self):
+        example = self.visitor.visit(get_pattern_tree(r'[a-c]{5000}'))
+        self.assertEqual(len(example), 10 + len(TRUNCATION_MARKER))
+
+    def test_stop_visiting_nodes_when_out_of_steps(self):
+        visitor = ExampleVisitor([], max_length=100000, max_steps=100)
+        example = visitor.visit(get_pattern_tree(r'((ab){100}){100}'))
+        self.assertLess(len(example), 100)
+        self.assertTrue(example.endswith(TRUNCATION_MARKER))
+        self.assertEqual(budget_stats.stats()['truncated_by_steps'], 1)
+
+    def test_truncate_huge_repetition_of_subpattern(self):
+        # A list of this many repetitions wouldn't fit in memory
+        example = self.visitor.visit(get_pattern_tree(r'(ab){4000000000}'))
+        self.assertEqual(example, 'ababababab' + TRUNCATION_MARKER)
+
+    def test_leave_short_examples_alone(self):
+        self.assertEqual(self.visitor.visit(get_pattern_tree(r'a{10}')), 'a' * 10)
+        self.assertEqual(budget_stats.stats(), {
+            'examples': 1,
+            'truncated_by_length': 0,
+            'truncated_by_steps': 0,
+        })
+
+
 if __name__ == '__main__':
     unittest.main()
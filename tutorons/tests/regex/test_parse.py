@@ -4,8 +4,11 @@
 from __future__ import unicode_literals
 import logging
 import unittest
+import re
+import sys
+from cStringIO import StringIO
 
-from tutorons.regex.parse import parse_regex
+from tutorons.regex.parse import parse_regex, describe_regex
 from tutorons.regex.nodes import InNode, RepeatNode, BranchNode,\
     LiteralNode, RangeNode, CategoryNode, AnyNode
 
@@ -69,7 +72,7 @@ class ParseRegexTest(unittest.TestCase):
         tree = parse_regex('a{3}')
         child = self._get_first_child(tree)
         self.assertEqual(type(child), RepeatNode)
-        self.assertIsNone(child.repetitions)
+        self.assertIsNone(tree.make_state()[child.id])
 
     def test_branch_node(self):
         ''' This one is tricky -- we have to get all 'or's on the same level '''
@@ -107,5 +110,30 @@ class SpecialParseTest(unittest.TestCase):
         self.assertEqual(type(lit_node), LiteralNode)
 
 
+class DescribeRegexTest(unittest.TestCase):
+
+    def _print_debug_description(self, regex):
+        stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            re.compile(regex, re.DEBUG)
+            return sys.stdout.getvalue()
+        finally:
+            sys.stdout = stdout
+
+    def test_describe_regex_as_printed_by_re_debug(self):
+        patterns = [
+            r'abra|kadabra', r'[^a-z\d\s_]+', r'(?P<x>a)(?(x)b|c)', r'(?:x)?y*?',
+            r'^\bfoo$', r'(a)\1', r'(?=a)(?!b)(?<=c)', r'a{,3}.', r'(ab|cd){2,3}',
+        ]
+        for pattern in patterns:
+            self.assertEqual(
+                describe_regex(pattern), self._print_debug_description(pattern), pattern)
+
+    def test_raise_error_for_invalid_regex(self):
+        with self.assertRaises(re.error):
+            describe_regex(r'(?<=a+)b')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 import logging
 import unittest
+import random
 import sre_constants
 
 from tutorons.regex.parse import RepeatNode, GroupNode, LiteralNode, BranchNode, ChoiceNode
@@ -84,9 +85,9 @@ class StatePermutationsTest(unittest.TestCase):
         branch.children.extend([choice1, choice2, choice3])
         tree = PatternTree(branch)
         self.assertEqual(tree.get_state_permutations(), [
-            ((branch, 'choice', 0),),
-            ((branch, 'choice', 1),),
-            ((branch, 'choice', 2),),
+            tree.make_state([(branch, 0)]),
+            tree.make_state([(branch, 1)]),
+            tree.make_state([(branch, 2)]),
         ])
 
     def _make_repeat_tree(self, min_repeats=1, max_repeats=sre_constants.MAXREPEAT):
@@ -99,24 +100,24 @@ class StatePermutationsTest(unittest.TestCase):
     def test_get_repetitions_permutations_for_unbound_range(self):
         tree = self._make_repeat_tree(1, sre_constants.MAXREPEAT)
         self.assertEqual(tree.get_state_permutations(), [
-            ((tree.root, 'repetitions', 1),),
-            ((tree.root, 'repetitions', 2),),
-            ((tree.root, 'repetitions', 3),),
+            tree.make_state([(tree.root, 1)]),
+            tree.make_state([(tree.root, 2)]),
+            tree.make_state([(tree.root, 3)]),
         ])
 
     def test_get_repetitions_permutations_for_rightbound_range(self):
         tree = self._make_repeat_tree(1, 2)
         self.assertEqual(tree.get_state_permutations(), [
-            ((tree.root, 'repetitions', 1),),
-            ((tree.root, 'repetitions', 2),),
+            tree.make_state([(tree.root, 1)]),
+            tree.make_state([(tree.root, 2)]),
         ])
 
     def test_get_repetitions_permutations_for_high_range(self):
         tree = self._make_repeat_tree(5, sre_constants.MAXREPEAT)
         self.assertEqual(tree.get_state_permutations(), [
-            ((tree.root, 'repetitions', 5),),
-            ((tree.root, 'repetitions', 6),),
-            ((tree.root, 'repetitions', 7),),
+            tree.make_state([(tree.root, 5)]),
+            tree.make_state([(tree.root, 6)]),
+            tree.make_state([(tree.root, 7)]),
         ])
 
     def test_permute_multiple_attributes(self):
@@ -134,32 +135,78 @@ class StatePermutationsTest(unittest.TestCase):
 
         tree = PatternTree(branch)
         self.assertEqual(tree.get_state_permutations(), [
-            ((repeat, 'repetitions', 1), (branch, 'choice', 0)),
-            ((repeat, 'repetitions', 1), (branch, 'choice', 1)),
-            ((repeat, 'repetitions', 2), (branch, 'choice', 0)),
-            ((repeat, 'repetitions', 2), (branch, 'choice', 1)),
+            tree.make_state([(repeat, 1), (branch, 0)]),
+            tree.make_state([(repeat, 1), (branch, 1)]),
+            tree.make_state([(repeat, 2), (branch, 0)]),
+            tree.make_state([(repeat, 2), (branch, 1)]),
         ])
 
-
-class ApplyStateTest(unittest.TestCase):
-
-    def test_apply_state_to_tree(self):
-
+    def test_sample_permutations(self):
         branch = BranchNode("")
         choice1 = ChoiceNode("")
         choice2 = ChoiceNode("")
-        repeat = RepeatNode(False, 1, 2)
+        repeat = RepeatNode(False, 1, 3)
+        repeat.children.append(LiteralNode(ord('a'), ""))
+        choice1.children.append(repeat)
+        choice2.children.append(LiteralNode(ord('b'), ""))
+        branch.children.extend([choice1, choice2])
+        tree = PatternTree(branch)
+
+        permutations = tree.get_state_permutations()
+        for count in range(1, len(permutations) + 2):
+            sample = tree.sample_state_permutations(count, random.Random(count))
+            self.assertEqual(len(sample), min(count, len(permutations)))
+            self.assertEqual(len(set(sample)), len(sample))
+            self.assertTrue(set(sample).issubset(set(permutations)))
+
+    def test_sample_from_many_permutations(self):
+        root = GroupNode()
+        for _ in range(40):
+            branch = BranchNode("")
+            branch.children.extend([ChoiceNode(""), ChoiceNode(""), ChoiceNode("")])
+            root.children.append(branch)
+        tree = PatternTree(root)
+        sample = tree.sample_state_permutations(4, random.Random(0))
+        self.assertEqual(len(set(sample)), 4)
+        self.assertEqual(sample, tree.sample_state_permutations(4, random.Random(0)))
+
+
+class MakeStateTest(unittest.TestCase):
+
+    def _make_tree(self):
+        self.branch = BranchNode("")
+        choice1 = ChoiceNode("")
+        choice2 = ChoiceNode("")
+        self.repeat = RepeatNode(False, 1, 2)
         literal1 = LiteralNode(ord('a'), "")
         literal2 = LiteralNode(ord('b'), "")
-        branch.children.extend([choice1, choice2])
-        choice1.children.append(repeat)
-        repeat.children.append(literal1)
+        self.branch.children.extend([choice1, choice2])
+        choice1.children.append(self.repeat)
+        self.repeat.children.append(literal1)
         choice2.children.append(literal2)
+        return PatternTree(self.branch)
 
-        tree = PatternTree(branch)
-        tree.set_state((
-            (repeat, 'repetitions', 2),
-            (branch, 'choice', 0),
-        ))
-        self.assertEqual(repeat.repetitions, 2)
-        self.assertEqual(branch.choice, 0)
+    def test_make_state_indexed_by_node_id(self):
+        tree = self._make_tree()
+        state = tree.make_state([
+            (self.repeat, 2),
+            (self.branch, 0),
+        ])
+        self.assertEqual(len(state), len(tree.get_nodes()))
+        self.assertEqual(state[self.repeat.id], 2)
+        self.assertEqual(state[self.branch.id], 0)
+        self.assertEqual(len([v for v in state if v is not None]), 2)
+
+    def test_state_permutations_leave_tree_unchanged(self):
+        tree = self._make_tree()
+        tree.get_state_permutations()
+        self.assertIsInstance(self.branch.children, tuple)
+        self.assertFalse(hasattr(self.branch, 'choice'))
+        self.assertFalse(hasattr(self.repeat, 'repetitions'))
+
+    def test_node_cannot_belong_to_two_trees(self):
+        self._make_tree()
+        with self.assertRaises(ValueError):
+            PatternTree(self.repeat)
+        with self.assertRaises(ValueError):
+            PatternTree(LiteralNode(ord('c'), "")).make_state([(self.repeat, 1)])
@@ -6,6 +6,7 @@ import unittest
 import logging
 
 from tutorons.regex.examples import WordBuilder
+from tutorons.regex.charclass import CharacterClass
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 
@@ -17,11 +18,11 @@ class WordBuilderTest(unittest.TestCase):
 
     def test_add_nonalpha(self):
         word = 'abba'
-        chars = [
+        charclass = CharacterClass.from_chars([
             'a', 'b',  # alphabetic
             '!'        # non-alphabetic
-        ]
-        new_word = self.word_builder.add_nonalpha(word, chars, count=2)
+        ])
+        new_word = self.word_builder.add_nonalpha(word, charclass, count=2)
         symbols = [c for c in new_word if c in '!']
         alphas = [c for c in new_word if c in 'ab']
         self.assertEqual(len(symbols), 2)
@@ -11,10 +11,14 @@ urlpatterns = patterns(
     '',
     url(r'^$', 'tutorons.views.home', name='home'),
     url(r'^home$', 'tutorons.views.home', name='home'),
+    url(r'^explain_batch$', 'tutorons.views.explain_batch', name='explain_batch'),
     url(r'^wget/', include('tutorons.wget.urls')),
     url(r'^css/', include('tutorons.css.urls')),
     url(r'^python/', include('tutorons.python.urls')),
     url(r'^regex/', include('tutorons.regex.urls')),
     url(r'^admin/', include(admin.site.urls)),
+    url(r'^metrics$', 'tutorons.views.metrics', name='metrics'),
+    url(r'^api/v1/scan_job/(?P<job_id>[0-9a-fA-F-]+)/?$', 'tutorons.common.views.scan_job',
+        name='scan_job'),
     url(r'^api/', include(v1_api.urls)),
 )
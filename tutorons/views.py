@@ -3,7 +3,13 @@
 
 from __future__ import unicode_literals
 import logging
+import json
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse
 from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt
+
+from tutorons.common.views import snippetbatch
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -11,3 +17,37 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 
 def home(request):
     return render(request, 'home.html', {})
+
+
+# Each tutoron's views are only imported once a batch needs them
+explain_batch = csrf_exempt(snippetbatch({
+    'css': 'tutorons.css.views.explain',
+    'python': 'tutorons.python.views.explain',
+    'regex': 'tutorons.regex.views.explain',
+    'wget': 'tutorons.wget.views.explain',
+}))
+
+
+@staff_member_required
+def metrics(request):
+    '''
+    Report the hit rates and sizes of the caches in this worker process, and its
+    Java gateway metrics.  Each worker keeps its own caches and counts, so successive
+    requests may report on different workers.
+    '''
+    # Imported here, like the views above, so that tutoron modules are only loaded when needed
+    from tutorons.common.extractor import command_spans
+    from tutorons.common.java.gateway import gateway_manager
+    from tutorons.css.detect import selector_verdicts
+    from tutorons.regex.examples import pattern_trees, budget_stats
+
+    with gateway_manager.metrics_lock:
+        java_gateway_metrics = dict(gateway_manager.metrics)
+
+    return HttpResponse(json.dumps({
+        'bash_command_spans_cache': command_spans.stats(),
+        'css_selector_verdicts_cache': selector_verdicts.stats(),
+        'regex_pattern_trees_cache': pattern_trees.stats(),
+        'regex_example_budgets': budget_stats.stats(),
+        'java_gateway': java_gateway_metrics,
+    }, indent=2), content_type='application/json')
@@ -11,6 +11,7 @@ from django.conf import settings
 import bashlex
 
 from tutorons.common.extractor import CommandExtractor
+from tutorons.common.artifacts import ArtifactStore
 from tutorons.common.scanner import InvalidCommandException
 from parse_phrase import get_root_type, RootType
 from opthelp import OPTHELP, COMBOHELP
@@ -49,8 +50,9 @@ def run_wget(wget_cmd):
 
 class WgetExtractor(object):
 
-    def __init__(self):
-        self.cmd_extractor = CommandExtractor(WGET_PATT)
+    def __init__(self, artifacts=None):
+        self.artifacts = artifacts if artifacts is not None else ArtifactStore()
+        self.cmd_extractor = CommandExtractor(WGET_PATT, self.artifacts)
 
     def extract(self, node):
         regions = self.cmd_extractor.extract(node)
@@ -81,7 +83,7 @@ class WgetExtractor(object):
         arg_count = 0
         has_var = False
 
-        command = bashlex.parse(cmdtext)[0]
+        command = self.artifacts.get('bash_tree', cmdtext, bashlex.parse)[0]
         after_cmdname = False
 
         for part in command.parts:
@@ -5,4 +5,8 @@ urlpatterns = patterns(
     '',
     url(r'^scan$', 'tutorons.wget.views.scan', name='wget_scan'),
     url(r'^explain$', 'tutorons.wget.views.explain', name='wget_explain'),
+    url(r'^explain_batch$', 'tutorons.wget.views.explain_batch', name='wget_explain_batch'),
+    url(r'^explanation$', 'tutorons.wget.views.explanation', name='wget_explanation'),
+    url(r'^explain_beacon$', 'tutorons.common.views.snippetbeacon',
+        name='wget_explain_beacon'),
 )
@@ -4,14 +4,14 @@
 from __future__ import unicode_literals
 import logging
 from django.views.decorators.csrf import csrf_exempt
-from django.template.loader import get_template
-from django.template import Context
 
 from tutorons.common.scanner import CommandScanner, InvalidCommandException
+from tutorons.common.artifacts import ArtifactStore
 from tutorons.wget.explain import WgetExtractor, explain as wget_explain
 from tutorons.wget.render import render as wget_render
 from tutorons.common.dblogger import DbLogger
-from tutorons.common.views import pagescan, snippetexplain
+from tutorons.common.views import pagescan, snippetexplain, snippetbatch, regionexplain,\
+    render_error
 
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -19,34 +19,44 @@ region_logger = logging.getLogger('region')
 db_logger = DbLogger()
 
 
+def explain_region(command):
+    try:
+        exp = wget_explain(command)
+    except InvalidCommandException as e:
+        logging.error("Error processing wget command %s: %s", e.cmd, e.exception)
+        return None
+    return wget_render(exp['url'], exp['opts'], exp['combo_exps'])
+
+
+def can_explain_region(command):
+    # The extractor only finds commands that wget could already parse
+    return True
+
+
 @csrf_exempt
-@pagescan
+@pagescan(explain_region, can_explain_region)
 def scan(html_doc):
 
-    rendered_regions = []
-    scanner = CommandScanner('wget', WgetExtractor())
+    artifacts = ArtifactStore()
+    scanner = CommandScanner('wget', WgetExtractor(artifacts), artifacts=artifacts)
     regions = scanner.scan(html_doc)
     for r in regions:
-        try:
-            exp = wget_explain(r.string)
-        except InvalidCommandException as e:
-            logging.error("Error processing wget command %s: %s", e.cmd, e.exception)
-            continue
-        document = wget_render(exp['url'], exp['opts'], exp['combo_exps'])
-        rendered_regions.append((r, document))
+        yield r, r.string
+
 
-    return rendered_regions
+explanation = regionexplain(explain_region)
 
 
 @csrf_exempt
 @snippetexplain
 def explain(text, edge_size):
 
-    error_template = get_template('error.html')
-
     try:
         exp = wget_explain(text)
         document = wget_render(exp['url'], exp['opts'], exp['combo_exps'])
     except InvalidCommandException:
-        document = error_template.render(Context({'text': text, 'type': 'wget command'}))
+        document = render_error(text, 'wget command')
     return document
+
+
+explain_batch = csrf_exempt(snippetbatch({'wget': explain}))